@@ -0,0 +1,105 @@
+"""
+Benchmark the merge-based sim/obs alignment against the previous per-date loops.
+
+Usage:
+    python benchmarks/bench_alignment.py [--treatments N] [--days N] [--variables N] [--repeat N]
+
+A daily simulated frame and a sparse observed frame (every 10th day, some
+values missing) are aligned for all treatments and variables. Both
+versions must collect the same value pairs.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.alignment import align_sim_obs
+
+
+def legacy_align(sim_data: DataFrame, obs_data: DataFrame, variables, treatments) -> dict:
+    """The per-treatment, per-date pairing PlotWidget.calculate_metrics used to do."""
+    aligned = {}
+    for var in variables:
+        for trt in treatments:
+            sim_trt_data = sim_data[sim_data['TRT'] == trt]
+            obs_trt_data = obs_data[obs_data['TRT'] == trt]
+            if sim_trt_data.empty or obs_trt_data.empty:
+                continue
+            common_dates = set(sim_trt_data['DATE']) & set(obs_trt_data['DATE'])
+            if not common_dates:
+                continue
+            pairs = []
+            for date in common_dates:
+                sim_val = sim_trt_data[sim_trt_data['DATE'] == date][var].values
+                obs_val = obs_trt_data[obs_trt_data['DATE'] == date][var].values
+                if len(sim_val) > 0 and len(obs_val) > 0:
+                    if pd.isna(sim_val[0]) or pd.isna(obs_val[0]):
+                        continue
+                    pairs.append((date, float(sim_val[0]), float(obs_val[0])))
+            pairs.sort()
+            aligned[(var, trt)] = pairs
+    return aligned
+
+
+def make_frames(treatments: int, days: int, variables: int):
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("1982-03-01", periods=days, freq="D")
+    names = [f"V{idx:02d}" for idx in range(variables)]
+
+    sim = {"TRT": np.repeat([str(trt) for trt in range(1, treatments + 1)], days),
+           "DATE": np.tile(dates, treatments)}
+    for name in names:
+        sim[name] = rng.random(treatments * days) * 100
+    sim_data = DataFrame(sim)
+
+    obs_data = sim_data[sim_data["DATE"].dt.dayofyear % 10 == 0].reset_index(drop=True)
+    for name in names:
+        values = obs_data[name].to_numpy() * rng.normal(1.0, 0.1, len(obs_data))
+        values[rng.random(len(obs_data)) < 0.2] = np.nan
+        obs_data[name] = values
+    return sim_data, obs_data, names
+
+
+def best_of(func, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--treatments", type=int, default=12)
+    parser.add_argument("--days", type=int, default=200)
+    parser.add_argument("--variables", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sim_data, obs_data, names = make_frames(args.treatments, args.days, args.variables)
+    treatments = [str(trt) for trt in range(1, args.treatments + 1)]
+
+    expected, legacy_time = best_of(lambda: legacy_align(sim_data, obs_data, names, treatments), args.repeat)
+    aligned, fast_time = best_of(lambda: align_sim_obs(sim_data, obs_data, names, treatments), args.repeat)
+
+    identical = expected.keys() == aligned.keys() and all(
+        [(pd.Timestamp(d), s, o) for d, s, o in zip(pair["dates"], pair["sim"], pair["obs"])] == expected[key]
+        for key, pair in aligned.items()
+    )
+    print(f"Sim rows: {len(sim_data)}  obs rows: {len(obs_data)}  pairs: {len(aligned)}")
+    print(f"  legacy  {legacy_time:8.3f}s")
+    print(f"  merged  {fast_time:8.3f}s  speedup {legacy_time / fast_time:6.1f}x")
+    print(f"  identical {identical}")
+
+
+if __name__ == "__main__":
+    main()
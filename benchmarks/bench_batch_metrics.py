@@ -0,0 +1,79 @@
+"""
+Benchmark MetricsCalculator.batch_metrics against per-group metric calls.
+
+Usage:
+    python benchmarks/bench_batch_metrics.py [--groups N] [--points N] [--repeat N]
+
+Each group stands for one (variable, treatment) pair with a few observed
+dates. The per-group path calls rmse, d_stat and r_squared once per group
+as the plot widget used to; both must agree.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from models.metrics import MetricsCalculator
+
+
+def make_groups(groups: int, points: int):
+    rng = np.random.default_rng(0)
+    result = []
+    for _ in range(groups):
+        size = int(rng.integers(2, 2 * points))
+        obs = rng.random(size) * 100
+        sim = obs * rng.normal(1.0, 0.2, size)
+        result.append((sim, obs))
+    return result
+
+
+def per_group(groups):
+    return [
+        (MetricsCalculator.rmse(obs, sim), MetricsCalculator.d_stat(obs, sim), MetricsCalculator.r_squared(sim, obs))
+        for sim, obs in groups
+    ]
+
+
+def batched(groups):
+    sim, obs, offsets = MetricsCalculator.concatenate_groups(groups)
+    return MetricsCalculator.batch_metrics(sim, obs, offsets)
+
+
+def best_of(func, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=12, help="average observations per group")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    groups = make_groups(args.groups, args.points)
+    expected, loop_time = best_of(lambda: per_group(groups), args.repeat)
+    result, batch_time = best_of(lambda: batched(groups), args.repeat)
+
+    expected = np.array(expected)
+    identical = (np.allclose(expected[:, 0], result["RMSE"])
+                 and np.allclose(expected[:, 1], result["d-stat"])
+                 and np.allclose(expected[:, 2], result["R2"]))
+    print(f"Groups: {args.groups}  values: {int(result['n'].sum())}")
+    print(f"  per group  {loop_time * 1000:9.1f} ms  (RMSE, d-stat, R2)")
+    print(f"  batched    {batch_time * 1000:9.1f} ms  (all {len(result)} columns)  speedup {loop_time / batch_time:6.1f}x")
+    print(f"  identical  {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the compressed storage used for inactive datasets.
+
+Usage:
+    python benchmarks/bench_compressed_frame.py [PATH_TO_OUT_FILE]
+        [--treatments N] [--days N] [--columns N] [--level N] [--repeat N]
+
+Without a path a synthetic multi-treatment PlantGro.OUT is generated and
+parsed. Reports the in-memory and compressed sizes, compression and
+decompression times, and checks the round trip is exact.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from bench_out_parser import write_synthetic_out, vectorized_read
+from data.compressed_frame import CompressedFrame
+
+
+def best_of(func, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", help="OUT file to parse")
+    parser.add_argument("--treatments", type=int, default=50)
+    parser.add_argument("--days", type=int, default=150)
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--level", type=int, default=None, help="zlib level (default config.DATA_COMPRESSION_LEVEL)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "PlantGro.OUT")
+        write_synthetic_out(path, args.treatments, args.days, args.columns)
+
+    df = vectorized_read(path)
+    compressed, compress_time = best_of(lambda: CompressedFrame(df, args.level), args.repeat)
+    restored, decompress_time = best_of(compressed.to_frame, args.repeat)
+    _, column_time = best_of(lambda: compressed.column(df.columns[-1]), args.repeat)
+
+    try:
+        pd.testing.assert_frame_equal(df, restored)
+        identical = True
+    except AssertionError:
+        identical = False
+
+    raw_mb = compressed.raw_bytes / 1024 / 1024
+    packed_mb = compressed.compressed_bytes / 1024 / 1024
+    print(f"File: {path}  rows {len(df)}  columns {df.shape[1]}")
+    print(f"  in memory   {raw_mb:8.2f} MB")
+    print(f"  compressed  {packed_mb:8.2f} MB  ratio {raw_mb / packed_mb:5.1f}x")
+    print(f"  compress    {compress_time:8.3f}s")
+    print(f"  decompress  {decompress_time:8.3f}s  (one column {column_time * 1000:.2f} ms)")
+    print(f"  identical   {identical}")
+
+
+if __name__ == "__main__":
+    main()
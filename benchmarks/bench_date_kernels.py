@@ -0,0 +1,95 @@
+"""
+Benchmark the vectorized date kernels against the row-wise unified_date_convert path.
+
+Usage:
+    python benchmarks/bench_date_kernels.py [--rows N] [--repeat N]
+
+Covers the YEAR/DOY conversion used for simulated data, the YYDDD codes of
+observed data and the epoch-seconds conversion used for plotting.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.data_processing import (
+    unified_date_convert, year_doy_to_dates, yyddd_to_dates,
+    dates_to_epoch_seconds, format_dates
+)
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """Daily YEAR/DOY rows spanning several decades, like a long multi-year run."""
+    dates = pd.date_range("1980-01-01", periods=rows, freq="D")
+    return pd.DataFrame({"YEAR": dates.year, "DOY": dates.dayofyear})
+
+
+def legacy_year_doy(df: pd.DataFrame):
+    unified_date_convert.cache_clear()
+    dates = df.apply(lambda row: unified_date_convert(row["YEAR"], row["DOY"]), axis=1)
+    return dates.dt.strftime("%Y-%m-%d")
+
+
+def vectorized_year_doy(df: pd.DataFrame):
+    return format_dates(year_doy_to_dates(df["YEAR"], df["DOY"]))
+
+
+def legacy_yyddd(codes: pd.Series):
+    unified_date_convert.cache_clear()
+    return codes.apply(lambda x: unified_date_convert(date_str=str(x))).dt.strftime("%Y-%m-%d")
+
+
+def vectorized_yyddd(codes: pd.Series):
+    return format_dates(yyddd_to_dates(codes))
+
+
+def legacy_epoch(dates: pd.Series):
+    return dates.map(lambda x: x.timestamp() if pd.notna(x) else np.nan)
+
+
+def vectorized_epoch(dates: pd.Series):
+    return dates_to_epoch_seconds(dates)
+
+
+def best_time(func, arg, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    codes = (df["YEAR"] % 100).astype(str).str.zfill(2) + df["DOY"].astype(str).str.zfill(3)
+    dates = pd.Series(pd.to_datetime(vectorized_year_doy(df)))
+
+    cases = (
+        ("YEAR/DOY", legacy_year_doy, vectorized_year_doy, df),
+        ("YYDDD", legacy_yyddd, vectorized_yyddd, codes),
+        ("epoch seconds", legacy_epoch, vectorized_epoch, dates),
+    )
+    print(f"Rows: {args.rows}")
+    for label, legacy, vectorized, arg in cases:
+        expected, legacy_time = best_time(legacy, arg, args.repeat)
+        result, fast_time = best_time(vectorized, arg, args.repeat)
+        same = np.array_equal(np.asarray(expected, dtype=object), np.asarray(result, dtype=object))
+        print(f"  {label:<14} legacy {legacy_time:8.3f}s  vectorized {fast_time:8.4f}s  "
+              f"speedup {legacy_time / fast_time:8.1f}x  identical {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark the vectorized OUT parser against the legacy line-based path.
+
+Usage:
+    python benchmarks/bench_out_parser.py [PATH_TO_OUT_FILE]
+        [--treatments N] [--days N] [--columns N] [--repeat N] [--float64]
+
+Without a path a synthetic multi-treatment PlantGro.OUT is generated.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from data.dssat_io import process_standard_buffer, process_standard_file
+
+
+def write_synthetic_out(path: str, treatments: int, days: int, columns: int) -> None:
+    """Write a PlantGro.OUT-like file with fixed-width right-aligned columns."""
+    rng = np.random.default_rng(0)
+    names = ["YEAR", "DOY", "DAS", "DAP"] + [f"V{i:03d}" for i in range(columns - 4)]
+    header = "@" + "".join(f"{name:>5}" if i == 0 else f"{name:>6}" for i, name in enumerate(names))[1:]
+
+    with open(path, "w", newline="\n") as out:
+        out.write("*DSSAT Cropping System Model Ver. 4.8.0.000\n\n")
+        for trt in range(1, treatments + 1):
+            out.write(f"*RUN {trt:>3}        : SYNTHETIC\n")
+            out.write(" MODEL          : MZCER048 - Maize\n")
+            out.write(" EXPERIMENT     : UFGA8201 MZ SYNTHETIC\n")
+            out.write(f" TREATMENT{trt:>3}   : SYNTHETIC TREATMENT\n\n")
+            out.write(header + "\n")
+            values = rng.random((days, columns - 4)) * 500
+            for day in range(days):
+                doy = 60 + day
+                year = 1982 + (doy - 1) // 365
+                doy = (doy - 1) % 365 + 1
+                row = f" {year:>4}{doy:>6}{day:>6}{day:>6}"
+                row += "".join(f"{v:>6.1f}" for v in values[day])
+                out.write(row + "\n")
+            out.write("\n")
+
+
+def legacy_read(path: str):
+    with open(path, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+    return process_standard_file(lines)
+
+
+def vectorized_read(path: str):
+    with open(path, "rb") as file:
+        buffer = file.read()
+    return process_standard_buffer(buffer)
+
+
+def measure(func, path: str, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", help="OUT file to parse")
+    parser.add_argument("--treatments", type=int, default=50)
+    parser.add_argument("--days", type=int, default=150)
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--float64", action="store_true",
+                        help="keep float64/int64 columns instead of the compact parse dtypes")
+    args = parser.parse_args()
+    config.COMPACT_DTYPES = not args.float64
+
+    path = args.path
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "PlantGro.OUT")
+        write_synthetic_out(path, args.treatments, args.days, args.columns)
+
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"File: {path} ({size_mb:.1f} MB)")
+
+    results = {}
+    for label, func in (("legacy", legacy_read), ("vectorized", vectorized_read)):
+        df, elapsed, peak = measure(func, path, args.repeat)
+        results[label] = (df, elapsed)
+        rows = len(df) if df is not None else 0
+        frame_mb = df.memory_usage(deep=True).sum() / 1024 / 1024 if df is not None else 0
+        print(f"  {label:<11} {elapsed:8.3f}s  peak {peak / 1024 / 1024:8.1f} MB  "
+              f"frame {frame_mb:8.1f} MB  rows {rows}")
+
+    legacy_df, legacy_time = results["legacy"]
+    fast_df, fast_time = results["vectorized"]
+    print(f"  speedup     {legacy_time / fast_time:8.1f}x")
+
+    if legacy_df is not None and fast_df is not None:
+        same_columns = list(legacy_df.columns) == list(fast_df.columns)
+        print(f"  same columns: {same_columns}")
+        mismatched = [
+            col for col in legacy_df.columns.intersection(fast_df.columns)
+            if legacy_df[col].dtype != fast_df[col].dtype
+        ]
+        if mismatched:
+            print(f"  dtype differences: {mismatched}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark the parallel DSSAT runner with a stand-in executable.
+
+Usage:
+    python benchmarks/bench_parallel_runner.py [--treatments N] [--workers N] [--seconds S]
+
+A temporary crop directory with an X file and a fake DSSAT executable is
+created. The fake executable reads BatchFile.v48, sleeps S seconds per
+treatment, and writes PlantGro.OUT (run blocks) and Summary.OUT (a table)
+like DSSAT does. The same treatments run once with one worker and once
+with N workers, and the merged outputs must match. The stand-in is a
+Python script run through its shebang line (POSIX only).
+"""
+import argparse
+import os
+import stat
+import sys
+import tempfile
+import time
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.dssat_runner import ParallelDSSATRunner
+
+FAKE_DSSAT = '''#!{python}
+import sys, time
+mode, batch_name = sys.argv[1], sys.argv[2]
+with open(batch_name) as f:
+    lines = f.read().splitlines()
+start = next(i for i, line in enumerate(lines) if line.startswith("@FILEX"))
+runs = [(line[:90].strip(), int(line[90:99])) for line in lines[start + 1:] if line.strip()]
+with open("PlantGro.OUT", "w") as plant, open("Summary.OUT", "w") as summary:
+    plant.write("*DSSAT Cropping System Model Ver. 4.8.0.000\\n\\n")
+    summary.write("*SUMMARY : FAKE\\n\\n@   RUNNO   TRNO  HWAM\\n")
+    for run, (xfile, trt) in enumerate(runs, 1):
+        time.sleep({seconds})
+        plant.write(f"*RUN {{run:>3}}        : FAKE\\n TREATMENT{{trt:>3}}   : FAKE {{trt}}\\n\\n")
+        plant.write("@YEAR DOY   DAS  LAID\\n")
+        for day in range(3):
+            plant.write(f" 1982{{60 + day:>4}}{{day:>6}}{{trt * 0.1 + day:>6.2f}}\\n")
+        plant.write("\\n")
+        summary.write(f"{{run:>9}}{{trt:>7}}{{trt * 1000:>6}}\\n")
+print(f"ran {{len(runs)}} treatments")
+'''
+
+
+def make_environment(root: str, seconds: float) -> tuple:
+    crop_dir = os.path.join(root, "Maize")
+    os.makedirs(crop_dir)
+    with open(os.path.join(crop_dir, "UFGA8201.MZX"), "w") as f:
+        f.write("*EXP.DETAILS: UFGA8201MZ FAKE\n")
+
+    exe_path = os.path.join(root, "DSCSM048")
+    with open(exe_path, "w") as f:
+        f.write(FAKE_DSSAT.format(python=sys.executable, seconds=seconds))
+    os.chmod(exe_path, os.stat(exe_path).st_mode | stat.S_IEXEC)
+    return crop_dir, exe_path
+
+
+def read_outputs(crop_dir: str) -> dict:
+    outputs = {}
+    for name in ("PlantGro.OUT", "Summary.OUT"):
+        with open(os.path.join(crop_dir, name), "rb") as f:
+            outputs[name] = f.read()
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--treatments", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=0.2, help="simulated run time per treatment")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp()
+    crop_dir, exe_path = make_environment(root, args.seconds)
+    entries = [("UFGA8201.MZX", trt) for trt in range(1, args.treatments + 1)]
+
+    results = {}
+    for workers in (1, args.workers):
+        runner = ParallelDSSATRunner(root, workers=workers, scratch_dir=os.path.join(root, "scratch"))
+        start = time.perf_counter()
+        runner.run_entries(crop_dir, "MZ", exe_path, entries)
+        results[workers] = (time.perf_counter() - start, read_outputs(crop_dir))
+
+    serial_time, serial_outputs = results[1]
+    parallel_time, parallel_outputs = results[args.workers]
+    print(f"Treatments: {args.treatments}  ({args.seconds:.2f}s each)")
+    print(f"  1 worker   {serial_time:7.2f}s")
+    print(f"  {args.workers} workers  {parallel_time:7.2f}s  speedup {serial_time / parallel_time:5.1f}x")
+    print(f"  identical outputs {serial_outputs == parallel_outputs}")
+    print(f"  scratch directories left: {len(os.listdir(os.path.join(root, 'scratch')))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark the column-at-a-time standardize_dtypes against the previous frame-wide version.
+
+Usage:
+    python benchmarks/bench_standardize_dtypes.py [--rows N] [--columns N] [--repeat N]
+
+Two wide DSSAT-like inputs are used: the all-string frame produced by the
+line-based OUT parser and the typed frame produced by the vectorized
+parser. Both versions must return identical frames (values and dtypes).
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, to_numeric
+
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.data_processing import standardize_dtypes
+
+
+def legacy_standardize_dtypes(df: DataFrame, keep_numeric_dates: bool = False) -> DataFrame:
+    """The frame-wide implementation standardize_dtypes replaced."""
+    if df is None or df.empty:
+        return df
+
+    non_empty_cols = df.notna().any()
+    df = df.loc[:, non_empty_cols]
+
+    string_cols = df.select_dtypes(include=['object']).columns
+    if len(string_cols) > 0:
+        non_empty_string_cols = df[string_cols].apply(lambda x: x.str.strip().astype(bool).any())
+        df = df.drop(columns=string_cols[~non_empty_string_cols.values])
+
+    timestamp_cols = df.columns.intersection({"YEAR", "DOY", "DATE"})
+    treatment_cols = df.columns.intersection({"TRT", "TRNO", "TR"})
+    non_numeric_cols = timestamp_cols.union(treatment_cols).union({"CR"})
+    potential_numeric_cols = df.columns.difference(non_numeric_cols)
+
+    for col in timestamp_cols:
+        if keep_numeric_dates and col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            continue
+        if col in df.columns:
+            if df[col].nunique() < 100:
+                df[col] = df[col].astype('category')
+            else:
+                df[col] = df[col].astype(str)
+
+    for col in treatment_cols:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    if 'CR' in df.columns:
+        df['CR'] = df['CR'].astype('category')
+
+    if len(potential_numeric_cols) > 0:
+        numeric_df = df[potential_numeric_cols].apply(to_numeric, errors="coerce")
+        valid_numeric_mask = numeric_df.isna().mean() < 0.1
+        valid_numeric_cols = potential_numeric_cols[valid_numeric_mask]
+        for col in valid_numeric_cols:
+            df[col] = numeric_df[col]
+
+    return df
+
+
+def make_string_frame(rows: int, columns: int) -> DataFrame:
+    """Object columns as the line-based parser leaves them, with a blank and an all-missing column."""
+    rng = np.random.default_rng(0)
+    data = {
+        "YEAR": np.repeat(["1982", "1983"], rows // 2 + 1)[:rows].astype(object),
+        "DOY": (np.arange(rows) % 365 + 1).astype(str).astype(object),
+        "DAS": np.arange(rows).astype(str).astype(object),
+        "TRT": (np.arange(rows) % 12 + 1).astype(str).astype(object),
+        "CR": np.full(rows, "MZ", dtype=object),
+        "BLANK": np.full(rows, "   ", dtype=object),
+        "EMPTY": np.full(rows, None, dtype=object),
+    }
+    for idx in range(columns - len(data)):
+        values = np.round(rng.random(rows) * 500, 1).astype(str).astype(object)
+        if idx % 7 == 0:
+            values[rng.random(rows) < 0.2] = "-99.0*"  # mostly numeric column that stays text
+        data[f"V{idx:03d}"] = values
+    return DataFrame(data)
+
+
+def make_typed_frame(rows: int, columns: int) -> DataFrame:
+    """Typed columns as the vectorized parser produces them."""
+    rng = np.random.default_rng(1)
+    data = {
+        "YEAR": np.repeat([1982, 1983], rows // 2 + 1)[:rows].astype(np.int16),
+        "DOY": (np.arange(rows) % 365 + 1).astype(np.int16),
+        "DAS": np.arange(rows).astype(np.int16),
+        "TRT": pd.Categorical((np.arange(rows) % 12 + 1).astype(str)),
+    }
+    for idx in range(columns - len(data)):
+        values = (rng.random(rows) * 500).astype(np.float32)
+        if idx % 5 == 0:
+            values[rng.random(rows) < 0.3] = np.nan
+        data[f"V{idx:03d}"] = values
+    return DataFrame(data)
+
+
+def measure(func, df: DataFrame, repeat: int, **kwargs):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df, **kwargs)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(df, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = (
+        ("string input", make_string_frame(args.rows, args.columns), {}),
+        ("typed input", make_typed_frame(args.rows, args.columns), {"keep_numeric_dates": True}),
+    )
+    print(f"Rows: {args.rows}  columns: {args.columns}")
+    for label, df, kwargs in cases:
+        expected, legacy_time, legacy_peak = measure(legacy_standardize_dtypes, df, args.repeat, **kwargs)
+        result, fast_time, fast_peak = measure(standardize_dtypes, df, args.repeat, **kwargs)
+        try:
+            pd.testing.assert_frame_equal(expected, result)
+            identical = True
+        except AssertionError:
+            identical = False
+        print(f"  {label:<13} legacy {legacy_time:7.3f}s peak {legacy_peak / 1024 / 1024:7.1f} MB  "
+              f"new {fast_time:7.3f}s peak {fast_peak / 1024 / 1024:7.1f} MB  "
+              f"speedup {legacy_time / fast_time:5.1f}x  identical {identical}")
+
+
+if __name__ == "__main__":
+    main()
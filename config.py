@@ -26,6 +26,58 @@ ENABLE_ANTIALIASING = False  # Disable antialiasing for better performance
 ENABLE_OPENGL = True  # Use OpenGL for hardware acceleration
 CACHE_SIZE_LIMIT = 1000  # Maximum number of cached items
 
+# Persistent cache of parsed DSSAT files (keyed by path, mtime, size and parser version)
+ENABLE_PARSED_FILE_CACHE = True
+PARSED_FILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dssat_viewer", "parsed_cache")
+PARSED_FILE_CACHE_SIZE_LIMIT = 2 * 1024 * 1024 * 1024  # 2GB on disk
+
+# In-memory cache of loaded frames; evicted frames can spill to local disk
+DATA_CACHE_SIZE_LIMIT = 256 * 1024 * 1024  # 256MB in memory
+ENABLE_DATA_CACHE_SPILL = False
+DATA_CACHE_SPILL_DIR = os.path.join(os.path.expanduser("~"), ".dssat_viewer", "spill_cache")
+DATA_CACHE_SPILL_SIZE_LIMIT = 1024 * 1024 * 1024  # 1GB on disk
+
+# Inactive frames are kept as zlib-compressed column chunks (ENABLE_DATA_COMPRESSION);
+# frames below the size threshold are left as they are
+DATA_COMPRESSION_MIN_BYTES = 1024 * 1024  # 1MB
+DATA_COMPRESSION_LEVEL = 1  # zlib level, 1 favours speed
+DATA_COMPRESSION_HOT_ENTRIES = 4  # Most recently used frames kept uncompressed in the data cache
+
+# Compiled DATA.CDE / DETAIL.CDE dictionaries, validated by the source file's mtime and size
+CODE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dssat_viewer", "code_cache")
+
+# Persistent index of experiment titles, treatments and OUT files per crop directory
+EXPERIMENT_CATALOG_PATH = os.path.join(os.path.expanduser("~"), ".dssat_viewer", "experiment_catalog.json")
+
+# Parse OUT files straight into compact dtypes (float32 variables, int16 day counters,
+# categorical treatments); False keeps float64/int64 columns
+COMPACT_DTYPES = True
+
+# Return Arrow-backed DataFrames from the DSSAT readers (requires pyarrow)
+USE_ARROW_BACKEND = False
+
+# Worker processes used to parse several selected output files at once
+MAX_LOADER_PROCESSES = max(1, min(4, (os.cpu_count() or 1) - 1))
+# Files smaller than this (or a single selected file) are parsed on a thread instead
+LOADER_PROCESS_MIN_BYTES = 2 * 1024 * 1024
+
+# DSSAT runs split into shards executed in parallel, each in its own scratch directory
+ENABLE_PARALLEL_RUNS = True
+DSSAT_RUN_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+DSSAT_SCRATCH_DIR = None  # None uses the system temp directory
+
+# How often output files are polled for new treatment blocks during a run
+TAIL_POLL_INTERVAL_MS = 1000
+
+# Bootstrap confidence intervals shown next to the model performance metrics
+ENABLE_BOOTSTRAP_CI = True
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 0  # Fixed so replotting shows the same intervals; None draws a new seed
+
+# Metric results cached by the content of the aligned values (entries, LRU)
+METRICS_CACHE_SIZE = 512
+
 # Default values
 DEFAULT_ENCODING = 'utf-8'
 FALLBACK_ENCODING = 'latin-1'
@@ -0,0 +1,106 @@
+"""
+Alignment of simulated and observed data on (treatment, date)
+
+Both frames are reduced to the selected treatments and variables, keyed
+on (TRT, DATE) and joined in a single merge. The joined table is sorted
+by treatment and date, so each (variable, treatment) pair is a contiguous
+slice of the merged value arrays.
+"""
+import os
+import sys
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+logger = logging.getLogger(__name__)
+
+def value_column(df: DataFrame, var: str) -> str:
+    """Return the column holding var's unscaled values."""
+    original = f"{var}_original"
+    return original if original in df.columns else var
+
+def _keyed_frame(df: DataFrame, variables: List[str], treatments: Optional[set],
+                 trt_col: str, date_col: str) -> DataFrame:
+    """Numeric values of variables, one row per (treatment, date), first occurrence kept."""
+    keys = df[trt_col].astype(str)
+    mask = df[date_col].notna().to_numpy()
+    if treatments is not None:
+        mask = mask & keys.isin(treatments).to_numpy()
+
+    columns = {trt_col: keys.to_numpy()[mask], date_col: df[date_col].to_numpy()[mask]}
+    for var in variables:
+        values = pd.to_numeric(df[value_column(df, var)], errors="coerce")
+        columns[var] = values.to_numpy(dtype=np.float64, na_value=np.nan)[mask]
+
+    keyed = DataFrame(columns, copy=False)
+    return keyed.drop_duplicates([trt_col, date_col], keep="first")
+
+def align_sim_obs(sim_data: DataFrame, obs_data: DataFrame, variables: Iterable[str],
+                  treatments: Optional[Iterable] = None, trt_col: str = "TRT",
+                  date_col: str = "DATE") -> Dict[Tuple[str, object], dict]:
+    """Pair simulated and observed values of each variable per treatment on common dates.
+
+    Returns {(variable, treatment): {"dates", "sim", "obs", "common_dates"}}
+    with float64 "sim"/"obs" arrays sorted by date, holding only dates where
+    both values are present. "common_dates" counts the dates both frames
+    share before missing values are dropped. Treatments keep the values
+    passed in (matched by their string form); treatments without common
+    dates and variables missing from either frame are left out.
+    """
+    if sim_data is None or obs_data is None or sim_data.empty or obs_data.empty:
+        return {}
+    for df, label in ((sim_data, "simulated"), (obs_data, "observed")):
+        if trt_col not in df.columns or date_col not in df.columns:
+            logger.warning(f"Cannot align: {label} data has no {trt_col}/{date_col} columns")
+            return {}
+
+    variables = [var for var in dict.fromkeys(variables)
+                 if var in sim_data.columns and var in obs_data.columns]
+    if not variables:
+        return {}
+
+    labels = None
+    if treatments is not None:
+        labels = {str(trt): trt for trt in treatments}
+
+    try:
+        sim_keyed = _keyed_frame(sim_data, variables, labels, trt_col, date_col)
+        obs_keyed = _keyed_frame(obs_data, variables, labels, trt_col, date_col)
+        merged = sim_keyed.merge(obs_keyed, on=[trt_col, date_col], how="inner",
+                                 suffixes=("_sim", "_obs"), sort=False)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Could not align simulated and observed data: {e}")
+        return {}
+
+    if merged.empty:
+        return {}
+
+    merged = merged.sort_values([trt_col, date_col], kind="stable", ignore_index=True)
+    trt_keys = merged[trt_col].to_numpy()
+    dates = merged[date_col].to_numpy()
+    boundaries = np.flatnonzero(trt_keys[1:] != trt_keys[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(merged)]))
+
+    aligned = {}
+    for var in variables:
+        sim_values = merged[f"{var}_sim"].to_numpy()
+        obs_values = merged[f"{var}_obs"].to_numpy()
+        valid = ~np.isnan(sim_values) & ~np.isnan(obs_values)
+        for start, end in zip(starts, ends):
+            trt = trt_keys[start] if labels is None else labels[trt_keys[start]]
+            keep = valid[start:end]
+            aligned[(var, trt)] = {
+                "dates": dates[start:end][keep],
+                "sim": sim_values[start:end][keep],
+                "obs": obs_values[start:end][keep],
+                "common_dates": int(end - start),
+            }
+    return aligned
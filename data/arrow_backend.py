@@ -0,0 +1,72 @@
+"""
+Optional Arrow-backed DataFrames for the DSSAT readers
+
+The readers build numpy column buffers; in Arrow mode those buffers are
+wrapped as pyarrow arrays instead of being copied into new pandas
+columns. Numeric and datetime buffers are reused as-is (NaN becomes a
+null bitmap next to the same data buffer), strings and categories become
+compact Arrow string and dictionary arrays. Requires pyarrow.
+"""
+import os
+import sys
+import logging
+from typing import Optional
+
+import pandas as pd
+from pandas import DataFrame
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+_warned_unavailable = False
+
+def arrow_enabled(use_arrow: Optional[bool] = None) -> bool:
+    """Resolve the per-call flag against config.USE_ARROW_BACKEND and pyarrow availability."""
+    global _warned_unavailable
+    requested = config.USE_ARROW_BACKEND if use_arrow is None else use_arrow
+    if requested and pa is None:
+        if not _warned_unavailable:
+            logger.warning("Arrow backend requested but pyarrow is not installed, using numpy columns")
+            _warned_unavailable = True
+        return False
+    return bool(requested)
+
+def _arrow_column(series: pd.Series):
+    if isinstance(series.dtype, pd.ArrowDtype):
+        return series.array
+    try:
+        return pd.arrays.ArrowExtensionArray(pa.Array.from_pandas(series.array))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+        # Mixed-type object columns stay as they are
+        logger.debug(f"Keeping column {series.name} as {series.dtype}: {e}")
+        return series.array
+
+def to_arrow_frame(df: Optional[DataFrame]) -> Optional[DataFrame]:
+    """Wrap every column of df in an Arrow-backed array without copying numeric buffers."""
+    if df is None or pa is None:
+        return df
+    arrays = {idx: _arrow_column(df.iloc[:, idx]) for idx in range(df.shape[1])}
+    result = DataFrame(arrays, index=df.index, copy=False)
+    result.columns = df.columns
+    return result
+
+def with_backend(df: Optional[DataFrame], use_arrow: Optional[bool] = None) -> Optional[DataFrame]:
+    """Return df in the requested column backend."""
+    if df is None or not arrow_enabled(use_arrow):
+        return df
+    return to_arrow_frame(df)
+
+def arrow_to_numpy_series(series: pd.Series) -> pd.Series:
+    """Return the numpy-backed equivalent of an Arrow-backed column (nulls become NaN/None)."""
+    values = pa.array(series.array).to_pandas()
+    return values.set_axis(series.index).rename(series.name)
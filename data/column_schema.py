@@ -0,0 +1,87 @@
+"""
+Per-column parse dtypes for DSSAT output files
+
+The OUT parser converts each fixed-width field straight into its final
+dtype: small integers for the calendar/day counters, categoricals for
+treatment numbers and float32 for state variables listed in DATA.CDE.
+Missing-value sentinels from config.MISSING_VALUES become NaN while the
+field is converted. With config.COMPACT_DTYPES off the parser keeps the
+float64/int64 columns it produced before.
+"""
+import os
+import sys
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Day counters and calendar fields fit in int16
+SMALL_INT_COLUMNS = {"YEAR", "DOY", "DAS", "DAP"}
+
+# Treatment numbers are repeated on every row of a block
+CATEGORY_COLUMNS = {"TRT", "TRNO", "TR"}
+
+# Numeric sentinels DSSAT writes for missing values
+MISSING_SENTINELS = np.array(
+    sorted({float(value) for value in config.MISSING_VALUES if not isinstance(value, str)})
+)
+
+def column_dtype(name: str, known_variables) -> Optional[str]:
+    """Return the schema dtype of a column: "int16", "category", "float" or None to infer."""
+    if name in SMALL_INT_COLUMNS:
+        return "int16"
+    if name in CATEGORY_COLUMNS:
+        return "category"
+    if name in known_variables:
+        return "float"
+    return None
+
+def _decode(raw: np.ndarray) -> np.ndarray:
+    return np.char.decode(np.char.strip(raw), "latin-1").astype(object)
+
+def _float_values(raw: np.ndarray) -> np.ndarray:
+    """Parse to float32 with missing sentinels mapped to NaN (raises ValueError if not numeric)."""
+    values = raw.astype(np.float64)
+    values[np.isin(values, MISSING_SENTINELS)] = np.nan
+    return values.astype(np.float32)
+
+def _int_values(values: np.ndarray) -> np.ndarray:
+    """Return integer values in the smallest of int16/int32/int64 that holds them."""
+    if values.size == 0:
+        return values.astype(np.int32)
+    low, high = values.min(), values.max()
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if low >= info.min and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+def convert_compact(raw: np.ndarray, name: str, known_variables) -> object:
+    """Convert a bytes field to its schema dtype, inferring unknown columns."""
+    target = column_dtype(name, known_variables)
+    if target == "category":
+        return pd.Categorical(_decode(raw))
+
+    if target != "float":
+        try:
+            values = raw.astype(np.int64)
+        except (ValueError, OverflowError):
+            values = None
+        if values is not None:
+            if not np.isin(values, MISSING_SENTINELS).any():
+                return _int_values(values)
+            # A sentinel in an integer column needs NaN, so it becomes float
+
+    try:
+        return _float_values(raw)
+    except ValueError:
+        return _decode(raw)
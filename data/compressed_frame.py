@@ -0,0 +1,103 @@
+"""
+Compressed in-memory storage for inactive DataFrames
+
+Each column is kept as one zlib-compressed chunk. Numeric buffers are
+byte-shuffled first (all first bytes of every value, then all second
+bytes, ...), which lets zlib exploit the shared exponents of float
+state variables. Other columns (categories, strings, Arrow arrays) are
+pickled before compression. Frames are decompressed whole with to_frame()
+or one column at a time with column().
+"""
+import os
+import sys
+import zlib
+import pickle
+import logging
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+
+logger = logging.getLogger(__name__)
+
+def _shuffle(values: np.ndarray) -> bytes:
+    raw = np.ascontiguousarray(values).view(np.uint8).reshape(-1, values.dtype.itemsize)
+    return raw.T.tobytes()
+
+def _unshuffle(data: bytes, dtype: np.dtype, rows: int) -> np.ndarray:
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, rows)
+    return np.ascontiguousarray(raw.T).view(dtype).reshape(rows)
+
+class CompressedFrame:
+    """A DataFrame stored as compressed column chunks."""
+
+    def __init__(self, df: DataFrame, level: int = None):
+        self.level = config.DATA_COMPRESSION_LEVEL if level is None else level
+        self.rows = len(df)
+        self.columns = df.columns
+        self.index = zlib.compress(pickle.dumps(df.index, protocol=pickle.HIGHEST_PROTOCOL), self.level)
+        self.raw_bytes = int(df.memory_usage(deep=True).sum())
+        self.chunks = [self._compress_column(df.iloc[:, idx]) for idx in range(df.shape[1])]
+        self.compressed_bytes = len(self.index) + sum(len(chunk[1]) for chunk in self.chunks)
+
+    @property
+    def shape(self) -> tuple:
+        return (self.rows, len(self.columns))
+
+    def _compress_column(self, series: pd.Series) -> tuple:
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            return (dtype, zlib.compress(_shuffle(series.to_numpy()), self.level))
+        return (None, zlib.compress(pickle.dumps(series.array, protocol=pickle.HIGHEST_PROTOCOL), self.level))
+
+    def _column_values(self, position: int):
+        dtype, chunk = self.chunks[position]
+        if dtype is None:
+            return pickle.loads(zlib.decompress(chunk))
+        return _unshuffle(zlib.decompress(chunk), dtype, self.rows)
+
+    def _index(self) -> pd.Index:
+        return pickle.loads(zlib.decompress(self.index))
+
+    def column(self, name) -> pd.Series:
+        """Decompress a single column."""
+        position = self.columns.get_loc(name)
+        return pd.Series(self._column_values(position), index=self._index(), name=name, copy=False)
+
+    def to_frame(self) -> DataFrame:
+        """Decompress all columns into a new DataFrame."""
+        arrays = {idx: self._column_values(idx) for idx in range(len(self.chunks))}
+        df = DataFrame(arrays, index=self._index(), copy=False)
+        df.columns = self.columns
+        return df
+
+def compress_frame(df: Optional[DataFrame], min_bytes: int = None,
+                   level: int = None) -> Union[DataFrame, CompressedFrame, None]:
+    """Return df compressed if config.ENABLE_DATA_COMPRESSION is on and it is large enough to pay off."""
+    if df is None or not config.ENABLE_DATA_COMPRESSION or isinstance(df, CompressedFrame):
+        return df
+    min_bytes = config.DATA_COMPRESSION_MIN_BYTES if min_bytes is None else min_bytes
+    try:
+        if df.memory_usage(deep=True).sum() < min_bytes:
+            return df
+        compressed = CompressedFrame(df, level)
+    except Exception as e:
+        logger.warning(f"Could not compress frame, keeping it uncompressed: {e}")
+        return df
+    # Keep frames that barely compress as they are
+    if compressed.compressed_bytes >= compressed.raw_bytes * 0.9:
+        return df
+    return compressed
+
+def as_frame(data: Union[DataFrame, CompressedFrame, None]) -> Optional[DataFrame]:
+    """Return a DataFrame for a value stored by compress_frame."""
+    if isinstance(data, CompressedFrame):
+        return data.to_frame()
+    return data
@@ -19,70 +19,97 @@ from pandas import to_numeric
 from numpy import arange, min, max, full, isclose, mean
 
 import logging
+import json
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import  List, Tuple
 from functools import lru_cache
 import config
+from utils.code_cache import load_code_dictionary, clear_code_dictionaries
+from utils.performance_monitor import perf_monitor
+from data.file_cache import ParsedFileCache
+from data.compressed_frame import CompressedFrame, compress_frame, as_frame
 
 logger = logging.getLogger(__name__)
 
 # Global cache for frequently used lookups
-_variable_info_cache = {}
 _date_conversion_cache = {}
 
-def standardize_dtypes(df: DataFrame) -> DataFrame:
-    """Optimized data type standardization with vectorized operations."""
+# Column groups standardize_dtypes types specially
+_TIMESTAMP_COLUMNS = {"YEAR", "DOY", "DATE"}
+_CATEGORY_COLUMNS = {"TRT", "TRNO", "TR", "CR"}
+
+def _is_text_dtype(dtype) -> bool:
+    """Object and default string columns, the ones select_dtypes(include=['object']) returns."""
+    return dtype == object or dtype == "str"
+
+def _has_text(column: Series) -> bool:
+    """True if an object column has any value other than empty or blank strings."""
+    # Missing and non-string values count as content, as in str.strip().astype(bool)
+    return bool(column.str.strip().astype(bool).any())
+
+def _standardize_column(name, column: Series, keep_numeric_dates: bool):
+    """Return one column in its standardized dtype, or None if it should be dropped."""
+    if not column.notna().any():
+        return None
+    is_text = _is_text_dtype(column.dtype)
+
+    if name in _TIMESTAMP_COLUMNS or name in _CATEGORY_COLUMNS:
+        if is_text and not _has_text(column):
+            return None
+        if name in _CATEGORY_COLUMNS:
+            # Treatment and crop columns are always categorical
+            return column.astype('category')
+        if keep_numeric_dates and api.types.is_integer_dtype(column):
+            return column
+        # Use categorical for low-cardinality timestamp columns
+        if column.nunique() < 100:
+            return column.astype('category')
+        return column.astype(str)
+
+    # to_numeric returns numeric columns unchanged, so only other dtypes are converted
+    if api.types.is_numeric_dtype(column):
+        return column
+    numeric = to_numeric(column, errors="coerce")
+    missing = numeric.isna()
+    # A parsed number proves the column is not blank; otherwise check the strings
+    if is_text and missing.all() and not _has_text(column):
+        return None
+    # Keep the conversion only if fewer than 10% of the values are NaN afterwards
+    if missing.mean() < 0.1:
+        return numeric
+    return column
+
+def standardize_dtypes(df: DataFrame, keep_numeric_dates: bool = False) -> DataFrame:
+    """Optimized data type standardization, one column at a time.
+
+    All-NaN columns and text columns holding only blank strings are
+    dropped; YEAR/DOY/DATE and treatment columns become categorical (or
+    strings for high-cardinality dates) and other columns are converted to
+    numbers when at most 10% of their values fail. Unchanged columns are
+    shared with the input instead of copied. With keep_numeric_dates,
+    YEAR/DOY columns already parsed as integers keep their dtype.
+    """
     if df is None or df.empty:
         return df
-    
-    # Drop all-NaN columns efficiently using boolean indexing
-    non_empty_cols = df.notna().any()
-    df = df.loc[:, non_empty_cols]
-    
-    # Drop columns that contain only empty strings or spaces
-    string_cols = df.select_dtypes(include=['object']).columns
-    if len(string_cols) > 0:
-        non_empty_string_cols = df[string_cols].apply(lambda x: x.str.strip().astype(bool).any())
-        df = df.loc[:, ~df.columns.isin(string_cols) | non_empty_string_cols]
-    
-    # Define column groups for efficient bulk processing
-    timestamp_cols = df.columns.intersection({"YEAR", "DOY", "DATE"})
-    treatment_cols = df.columns.intersection({"TRT", "TRNO", "TR"})
-    # Explicitly exclude the CR column from numeric conversion
-    non_numeric_cols = timestamp_cols.union(treatment_cols).union({"CR"})
-    potential_numeric_cols = df.columns.difference(non_numeric_cols)
-    
-    # Process timestamp columns
-    for col in timestamp_cols:
-        if col in df.columns:
-            # Use categorical for low-cardinality timestamp columns
-            if df[col].nunique() < 100:
-                df[col] = df[col].astype('category')
-            else:
-                df[col] = df[col].astype(str)
-    
-    # Process treatment columns - always as categorical for efficiency
-    for col in treatment_cols:
-        if col in df.columns:
-            df[col] = df[col].astype('category')
-    
-    # Handle CR column specifically if present
-    if 'CR' in df.columns:
-        df['CR'] = df['CR'].astype('category')
-    
-    # Process numeric columns in bulk
-    if len(potential_numeric_cols) > 0:
-        # Convert to numeric in one operation
-        numeric_df = df[potential_numeric_cols].apply(to_numeric, errors="coerce")
-        
-        # Find columns with < 10% NaN values after conversion
-        valid_numeric_mask = numeric_df.isna().mean() < 0.1
-        valid_numeric_cols = potential_numeric_cols[valid_numeric_mask]
-        
-        # Process each valid numeric column
-        for col in valid_numeric_cols:
-            df[col] = numeric_df[col]
-    
-    return df
+
+    positions = []
+    converted = {}
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        standardized = _standardize_column(df.columns[position], column, keep_numeric_dates)
+        if standardized is None:
+            continue
+        if standardized is not column:
+            converted[len(positions)] = standardized
+        positions.append(position)
+
+    result = df.iloc[:, positions]
+    for position, column in converted.items():
+        result.isetitem(position, column)
+    return result
 
 @lru_cache(maxsize=1024)
 def unified_date_convert(year=None, doy=None, date_str=None):
@@ -130,13 +157,55 @@ def vectorized_date_conversion(df: DataFrame, date_col: str = "DATE") -> DataFra
         # Direct vectorized conversion
         df[date_col] = to_datetime(df[date_col], errors="coerce")
     elif "YEAR" in df.columns and "DOY" in df.columns:
-        # Combine year and day of year for efficient conversion
-        year_col = df["YEAR"].astype(str)
-        doy_col = df["DOY"].astype(str).str.zfill(3)
-        df[date_col] = to_datetime(year_col + doy_col, format="%Y%j", errors="coerce")
+        df[date_col] = year_doy_to_dates(df["YEAR"], df["DOY"])
     
     return df
 
+# Years representable as datetime64[ns]
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+
+def year_doy_to_dates(year, doy) -> np.ndarray:
+    """Vectorized YEAR/DOY to datetime64[ns]; invalid pairs become NaT.
+
+    Same rules as unified_date_convert: values are truncated to integers,
+    DOY must be 1-366 and DOY 366 of a non-leap year rolls into January 1.
+    """
+    year = np.trunc(to_numeric(np.asarray(year).ravel(), errors="coerce").astype(np.float64))
+    doy = np.trunc(to_numeric(np.asarray(doy).ravel(), errors="coerce").astype(np.float64))
+    valid = (doy >= 1) & (doy <= 366) & (year >= _MIN_YEAR) & (year <= _MAX_YEAR)
+
+    dates = np.full(year.shape, np.datetime64("NaT"), dtype="datetime64[ns]")
+    years = (year[valid].astype(np.int64) - 1970).astype("datetime64[Y]")
+    dates[valid] = years.astype("datetime64[D]") + (doy[valid].astype(np.int64) - 1)
+    return dates
+
+def yyddd_to_dates(codes) -> np.ndarray:
+    """Vectorized 5-digit YYDDD codes to datetime64[ns]; invalid codes become NaT.
+
+    Two-digit years up to 30 are 20xx, later ones 19xx, as in unified_date_convert.
+    """
+    codes = Series(np.asarray(codes, dtype=object).ravel()).astype(str).str.strip()
+    valid = (codes.str.len() == 5) & codes.str.isdigit()
+
+    numbers = to_numeric(codes.where(valid), errors="coerce").to_numpy(dtype=np.float64)
+    year_part = numbers // 1000
+    year = np.where(year_part <= 30, 2000 + year_part, 1900 + year_part)
+    return year_doy_to_dates(year, numbers % 1000)
+
+def dates_to_epoch_seconds(dates) -> np.ndarray:
+    """Seconds since the epoch as float64 (NaN for NaT), like Timestamp.timestamp()."""
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    seconds = dates.view(np.int64) / 1e9
+    seconds[np.isnat(dates)] = np.nan
+    return seconds
+
+def format_dates(dates) -> np.ndarray:
+    """Format datetime64 values as YYYY-MM-DD strings, NaN for NaT."""
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    formatted = np.datetime_as_string(dates, unit="D").astype(object)
+    formatted[np.isnat(dates)] = np.nan
+    return formatted
+
 def handle_missing_xvar(obs_data: DataFrame, x_var: str, sim_data: DataFrame = None) -> DataFrame:
     """Handle missing X variables in observed data - optimized version."""
     if obs_data is None or obs_data.empty:
@@ -197,73 +266,72 @@ def handle_missing_xvar(obs_data: DataFrame, x_var: str, sim_data: DataFrame = N
     obs_data[f"{x_var}"].fillna(method="ffill", inplace=True)
     return obs_data
 
-@lru_cache(maxsize=8)
+def _parse_data_cde_lines(lines: List[str]) -> dict:
+    """Parse the lines of DATA.CDE into {code: {"label", "description"}}."""
+    variable_info = {}
+    
+    # One-pass processing with indexed access
+    non_comment_lines = [i for i, line in enumerate(lines) 
+                        if not line.startswith(("!", "*"))]
+    
+    header_idx = next((i for i in non_comment_lines if lines[i].startswith("@")), None)
+    if header_idx is None:
+        logger.error("No header found in DATA.CDE file")
+        return variable_info
+    
+    # Process data lines after header
+    data_line_indices = [i for i in non_comment_lines if i > header_idx]
+    
+    for i in data_line_indices:
+        line = lines[i]
+        if len(line.strip()) == 0:
+            continue
+        
+        # Fixed-width parsing is faster than splitting
+        cde = line[0:6].strip()
+        label = line[7:20].strip() if len(line) > 7 else ""
+        description = line[21:70].strip() if len(line) > 21 else ""
+        
+        if cde:
+            variable_info[cde] = {"label": label, "description": description}
+    
+    return variable_info
+
 def parse_data_cde(data_cde_path: str = None) -> dict:
     """Parse DATA.CDE file and return a dictionary of variable information.
-    Results are cached for better performance."""
+    Results come from the compiled code cache and are reparsed only when the file changes."""
     if data_cde_path is None:
         from config import DSSAT_BASE
         data_cde_path = f"{DSSAT_BASE}/DATA.CDE"
     
-    # Return from cache if previously parsed
-    if data_cde_path in _variable_info_cache:
-        return _variable_info_cache[data_cde_path]
-    
-    variable_info = {}
     try:
-        # Use with context for file handling
-        with open(data_cde_path, "r", errors='replace') as f:
-            lines = f.readlines()
-        
-        # One-pass processing with indexed access
-        non_comment_lines = [i for i, line in enumerate(lines) 
-                            if not line.startswith(("!", "*"))]
-        
-        header_idx = next((i for i in non_comment_lines if lines[i].startswith("@")), None)
-        if header_idx is None:
-            logger.error(f"No header found in DATA.CDE file: {data_cde_path}")
-            return variable_info
-        
-        # Process data lines after header
-        data_line_indices = [i for i in non_comment_lines if i > header_idx]
-        
-        for i in data_line_indices:
-            line = lines[i]
-            if len(line.strip()) == 0:
-                continue
-            
-            # Fixed-width parsing is faster than splitting
-            cde = line[0:6].strip()
-            label = line[7:20].strip() if len(line) > 7 else ""
-            description = line[21:70].strip() if len(line) > 21 else ""
-            
-            if cde:
-                variable_info[cde] = {"label": label, "description": description}
-        
-        # Cache the result
-        _variable_info_cache[data_cde_path] = variable_info
-        
+        return load_code_dictionary(data_cde_path, "data_cde", _parse_data_cde_lines, default={})
     except Exception as e:
         logger.error(f"Error parsing DATA.CDE: {e}")
-    
-    return variable_info
+        return {}
 
-@lru_cache(maxsize=256)
 def get_variable_info(variable_name: str, data_cde_path: str = None) -> tuple:
-    """Get label and description for a variable, with caching."""
+    """Get label and description for a variable."""
     try:
-        variable_info = parse_data_cde(data_cde_path)
-        if variable_name in variable_info:
-            return (
-                variable_info[variable_name]["label"],
-                variable_info[variable_name]["description"],
-            )
+        info = parse_data_cde(data_cde_path).get(variable_name)
+        if info is not None:
+            return info["label"], info["description"]
         return None, None
     
     except Exception as e:
         logger.error(f"Error getting variable info: {e}")
         return None, None
 
+def get_variable_infos(variable_names: List[str], data_cde_path: str = None) -> dict:
+    """Get (label, description) for many variables with one dictionary lookup.
+    Unknown variables map to (None, None)."""
+    variable_info = parse_data_cde(data_cde_path)
+    result = {}
+    for name in variable_names:
+        info = variable_info.get(name)
+        result[name] = (info["label"], info["description"]) if info is not None else (None, None)
+    return result
+
 def get_evaluate_variable_pairs(data: DataFrame) -> List[Tuple[str, str, str]]:
     """
     Get pairs of simulated and measured variables from EVALUATE.OUT data.
@@ -328,8 +396,9 @@ def get_all_evaluate_variables(data: DataFrame) -> List[Tuple[str, str]]:
                  if col not in metadata_cols and not data[col].isna().all()]
     
     # Get variable info for all columns at once
+    infos = get_variable_infos(valid_cols)
     for col in valid_cols:
-        var_label, _ = get_variable_info(col)
+        var_label, _ = infos[col]
         display_name = var_label if var_label else col
         variables.append((display_name, col))
     
@@ -388,102 +457,322 @@ def improved_smart_scale(
 
 # Add a background caching utility
 class DataCacheManager:
-    """Utility class for managing data caching with memory management."""
-    
-    def __init__(self):
-        self.data_cache = {}
+    """Byte-bounded LRU cache of DataFrames with pinning and an optional disk spill tier.
+
+    Entry sizes are measured once on insert, so size accounting and
+    eviction are O(1) per entry. Pinned entries (frames currently shown)
+    are never evicted. With config.ENABLE_DATA_COMPRESSION, frames that
+    fall out of the most recently used config.DATA_COMPRESSION_HOT_ENTRIES
+    are kept as CompressedFrames and decompressed on the next lookup.
+    With spilling enabled, evicted frames are written to a ParsedFileCache
+    and promoted back to memory on the next lookup.
+    """
+
+    def __init__(self, size_limit: int = None, spill: bool = None, spill_dir: str = None,
+                 hot_entries: int = None):
+        self.data_cache = OrderedDict()  # key -> DataFrame, least recently used first
+        self.cold_cache = OrderedDict()  # key -> CompressedFrame (or small DataFrame), least recently used first
+        self.pinned = {}  # key -> DataFrame, exempt from eviction
+        self.hot_entries = config.DATA_COMPRESSION_HOT_ENTRIES if hot_entries is None else hot_entries
+        self.entry_sizes = {}
+        self.path_cache = {}
         self.variable_info = {}
         self.data_cde_cache = {}
-        self.path_cache = {}
-        self.cache_size_limit = 1024 * 1024 * 256  # Reduced to 256MB for better memory usage
+        self.cache_size_limit = size_limit or config.DATA_CACHE_SIZE_LIMIT
+        self.current_size = 0
+        self.spill_enabled = config.ENABLE_DATA_CACHE_SPILL if spill is None else spill
+        self.spill_dir = spill_dir or config.DATA_CACHE_SPILL_DIR
+        self._spill_cache = None
+        self._spilled = set()
+        self._lock = threading.RLock()
         self.cache_hits = 0
         self.cache_misses = 0
-    
-    def cache_data(self, key: str, data: pd.DataFrame, metadata: dict = None):
-        """Cache DataFrame with memory management."""
+        self.evictions = 0
+        self.spills = 0
+        self.spill_hits = 0
+        self.decompressions = 0
+
+    @staticmethod
+    def make_key(kind: str, file_paths: List[str], **params) -> str:
+        """Key for frames built from file_paths; it changes whenever one of the files is rewritten."""
+        sources = []
+        for path in file_paths:
+            try:
+                stat = os.stat(path)
+                sources.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                sources.append((os.path.abspath(path), None, None))
+        variant = json.dumps([sources, params], sort_keys=True, default=str)
+        return f"{kind}-{hashlib.sha1(variant.encode('utf-8')).hexdigest()[:16]}"
+
+    def cache_data(self, key: str, data: pd.DataFrame, metadata: dict = None, pin: bool = False):
+        """Cache DataFrame with memory management.
+
+        Low-cardinality object columns are stored as categories; the
+        conversion happens on a shallow copy, so the caller's frame is not
+        modified.
+        """
         try:
             # Convert object dtypes to categories where beneficial
-            for col in data.select_dtypes(include=['object']):
-                if data[col].nunique() / len(data[col]) < 0.5:  # If less than 50% unique values
+            converted = [
+                col for col in data.columns
+                if _is_text_dtype(data[col].dtype) and len(data) and data[col].nunique() / len(data) < 0.5  # If less than 50% unique values
+            ]
+            if converted:
+                data = data.copy(deep=False)
+                for col in converted:
                     data[col] = data[col].astype('category')
-            
-            data_size = data.memory_usage(deep=True).sum()
-            
-            # Clear old entries if cache would exceed limit
-            while (self.get_cache_size() + data_size > self.cache_size_limit 
-                   and self.data_cache):
-                oldest_key = min(self.path_cache.keys(), 
-                               key=lambda k: self.path_cache[k].get('last_access', 0))
-                self.clear_cache(oldest_key)
-            
-            self.data_cache[key] = data
-            if metadata:
-                metadata['last_access'] = pd.Timestamp.now().timestamp()
-                self.path_cache[key] = metadata
-                
+
+            data_size = int(data.memory_usage(deep=True).sum())
+            with self._lock:
+                self._remove(key)
+                self._discard_spilled(key)
+                if pin:
+                    self.pinned[key] = data
+                else:
+                    self.data_cache[key] = data
+                self.entry_sizes[key] = data_size
+                self.current_size += data_size
+                if metadata:
+                    self.path_cache[key] = metadata
+                self._demote()
+                self._evict(self.cache_size_limit)
+
         except Exception as e:
             logger.error(f"Error caching data: {str(e)}")
-    
+
     def get_cached_data(self, key: str) -> pd.DataFrame:
-        """Retrieve cached data if available."""
-        if key in self.data_cache:
-            self.cache_hits += 1
-            if key in self.path_cache:
-                self.path_cache[key]['last_access'] = pd.Timestamp.now().timestamp()
-            return self.data_cache[key]
-        self.cache_misses += 1
-        return None
-        
-    def optimize_memory(self, threshold_mb: int = 200):  # Reduced threshold
-        """Optimize memory usage if it exceeds threshold."""
-        current_size = self.get_cache_size()
-        if current_size > threshold_mb * 1024 * 1024:
-            # Remove least recently used items until under threshold
-            while self.get_cache_size() > threshold_mb * 1024 * 1024 and self.path_cache:
-                oldest_key = min(self.path_cache.keys(), 
-                               key=lambda k: self.path_cache[k].get('last_access', 0))
-                self.clear_cache(oldest_key)
-            
-            # Force garbage collection
-            import gc
-            gc.collect()
-            
+        """Retrieve cached data if available, promoting spilled frames back to memory."""
+        with self._lock:
+            if key in self.pinned:
+                self._record_hit()
+                return self.pinned[key]
+            if key in self.data_cache:
+                self.data_cache.move_to_end(key)
+                self._record_hit()
+                return self.data_cache[key]
+            if key in self.cold_cache:
+                self._record_hit()
+                return self._promote(key)
+            data = self._load_spilled(key)
+            if data is None:
+                self.cache_misses += 1
+                perf_monitor.increment_counter("data_cache", "misses")
+                return None
+            self.spill_hits += 1
+            perf_monitor.increment_counter("data_cache", "spill_hits")
+            self._record_hit()
+            self.cache_data(key, data, self.path_cache.get(key))
+            return data
+
+    def _record_hit(self):
+        self.cache_hits += 1
+        perf_monitor.increment_counter("data_cache", "hits")
+
+    def pin(self, key: str) -> bool:
+        """Exempt a cached frame from eviction; returns False if key is not cached."""
+        with self._lock:
+            if key in self.pinned:
+                return True
+            if key not in self.data_cache:
+                self.get_cached_data(key)
+            data = self.data_cache.pop(key, None)
+            if data is None:
+                return False
+            self.pinned[key] = data
+            return True
+
+    def unpin(self, key: str):
+        """Make a pinned frame evictable again as the most recently used entry."""
+        with self._lock:
+            data = self.pinned.pop(key, None)
+            if data is not None:
+                self.data_cache[key] = data
+                self._demote()
+                self._evict(self.cache_size_limit)
+
+    def pin_frames(self, frames: dict, previous=()) -> List[str]:
+        """Cache and pin the frames now on screen, unpinning the previously shown keys.
+
+        frames maps key -> DataFrame; None values are skipped. Returns the
+        pinned keys, to be passed back as previous on the next call.
+        """
+        with self._lock:
+            for key in previous:
+                if key not in frames:
+                    self.unpin(key)
+            for key, data in frames.items():
+                if data is not None:
+                    self.cache_data(key, data, pin=True)
+            shown = [key for key, data in frames.items() if data is not None]
+            if set(shown) != set(previous):
+                # Unpinned frames move towards the compressed tier as the selection changes
+                logger.info(self.stats_summary())
+            return shown
+
+    def optimize_memory(self, threshold_mb: int = 200):
+        """Evict least recently used frames until the cache is under threshold_mb."""
+        with self._lock:
+            if self.current_size > threshold_mb * 1024 * 1024:
+                self._evict(threshold_mb * 1024 * 1024)
+                # Force garbage collection
+                import gc
+                gc.collect()
+
         # Log cache efficiency metrics
         total_requests = self.cache_hits + self.cache_misses
         if total_requests > 0:
             hit_rate = (self.cache_hits / total_requests) * 100
             logger.info(f"Cache hit rate: {hit_rate:.1f}%")
 
+    def _evict(self, limit: int):
+        # Cold entries go first, then the least recently used hot ones
+        while self.current_size > limit and (self.cold_cache or self.data_cache):
+            if self.cold_cache:
+                key, data = self.cold_cache.popitem(last=False)
+            else:
+                key, data = self.data_cache.popitem(last=False)
+            self.current_size -= self.entry_sizes.pop(key, 0)
+            self.evictions += 1
+            perf_monitor.increment_counter("data_cache", "evictions")
+            if self.spill_enabled:
+                self._spill(key, as_frame(data))
+            if key not in self._spilled:
+                self.path_cache.pop(key, None)
+
+    def _remove(self, key: str):
+        for store in (self.data_cache, self.cold_cache, self.pinned):
+            if store.pop(key, None) is not None:
+                self.current_size -= self.entry_sizes.pop(key, 0)
+                return
+
+    # Compression tier --------------------------------------------------------
+
+    def _demote(self):
+        """Move frames beyond the hot window into the compressed tier."""
+        if not config.ENABLE_DATA_COMPRESSION:
+            return
+        while len(self.data_cache) > self.hot_entries:
+            key, data = self.data_cache.popitem(last=False)
+            stored = compress_frame(data)
+            if isinstance(stored, CompressedFrame):
+                self.current_size += stored.compressed_bytes - self.entry_sizes[key]
+                self.entry_sizes[key] = stored.compressed_bytes
+                perf_monitor.increment_counter("data_cache", "compressions")
+            self.cold_cache[key] = stored
+
+    def _promote(self, key: str) -> pd.DataFrame:
+        """Move a cold entry back into the hot tier, decompressing it."""
+        stored = self.cold_cache.pop(key)
+        data = as_frame(stored)
+        if isinstance(stored, CompressedFrame):
+            self.current_size += stored.raw_bytes - self.entry_sizes[key]
+            self.entry_sizes[key] = stored.raw_bytes
+            self.decompressions += 1
+            perf_monitor.increment_counter("data_cache", "decompressions")
+        self.data_cache[key] = data
+        self._demote()
+        self._evict(self.cache_size_limit)
+        return data
+
+    # Spill tier --------------------------------------------------------------
+
+    def _spill_store(self):
+        if self._spill_cache is None:
+            # Spilled frames only live for one session
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self._spill_cache = ParsedFileCache(
+                cache_dir=self.spill_dir,
+                size_limit=config.DATA_CACHE_SPILL_SIZE_LIMIT,
+                enabled=True,
+                counter_category="spill_cache",
+            )
+        return self._spill_cache
+
+    @staticmethod
+    def _spill_key(key: str) -> str:
+        return hashlib.sha1(str(key).encode("utf-8")).hexdigest()[:16] + "-spill"
+
+    def _spill(self, key: str, data: pd.DataFrame):
+        if not self.spill_enabled:
+            return
+        if self._spill_store().put(self._spill_key(key), data):
+            self._spilled.add(key)
+            self.spills += 1
+            perf_monitor.increment_counter("data_cache", "spills")
+
+    def _load_spilled(self, key: str):
+        if key not in self._spilled:
+            return None
+        self._spilled.discard(key)
+        store = self._spill_store()
+        data = store.get(self._spill_key(key))
+        if data is not None:
+            # Detach from the memory-mapped files before they are removed
+            data = data.copy()
+        store.discard(self._spill_key(key))
+        return data
+
+    def _discard_spilled(self, key: str):
+        if key in self._spilled:
+            self._spilled.discard(key)
+            self._spill_store().discard(self._spill_key(key))
+
     def clear_cache(self, key: str = None):
         """Clear specific or all cached data."""
-        if key:
-            self.data_cache.pop(key, None)
-            self.path_cache.pop(key, None)
-        else:
-            self.data_cache.clear()
-            self.variable_info.clear()
-            self.data_cde_cache.clear()
-            self.path_cache.clear()
-            get_variable_info.cache_clear()
-            parse_data_cde.cache_clear()
-            unified_date_convert.cache_clear()
-    
+        with self._lock:
+            if key:
+                self._remove(key)
+                self._discard_spilled(key)
+                self.path_cache.pop(key, None)
+            else:
+                self.data_cache.clear()
+                self.cold_cache.clear()
+                self.pinned.clear()
+                self.entry_sizes.clear()
+                self.current_size = 0
+                for spilled_key in list(self._spilled):
+                    self._discard_spilled(spilled_key)
+                self.variable_info.clear()
+                self.data_cde_cache.clear()
+                self.path_cache.clear()
+                clear_code_dictionaries()
+                unified_date_convert.cache_clear()
+
     def get_cache_size(self) -> int:
         """Get current cache size in bytes."""
-        return sum(df.memory_usage(deep=True).sum() for df in self.data_cache.values())
-    
-    def optimize_memory(self, threshold_mb: int = 400):
-        """Optimize memory usage if it exceeds threshold."""
-        current_size = self.get_cache_size()
-        if current_size > threshold_mb * 1024 * 1024:
-            # Remove oldest items until under threshold
-            while (self.get_cache_size() > threshold_mb * 1024 * 1024 
-                   and self.data_cache):
-                self.data_cache.pop(next(iter(self.data_cache)))
-            
-            # Force garbage collection
-            import gc
-            gc.collect()
+        return self.current_size
+
+    def stats_summary(self) -> str:
+        """One-line description of get_stats() for the log."""
+        stats = self.get_stats()
+        mb = 1024 * 1024
+        return (f"Data cache: {stats['entries']} frames ({stats['pinned']} pinned, "
+                f"{stats['compressed_entries']} compressed saving {stats['compression_saved_bytes'] / mb:.1f}MB, "
+                f"{stats['spilled']} spilled), {stats['size_bytes'] / mb:.1f}MB of {stats['size_limit'] / mb:.0f}MB, "
+                f"hit rate {stats['hit_rate']:.0%}")
+
+    def get_stats(self) -> dict:
+        """Return hit/miss/eviction counts, memory usage and the bytes saved by compression."""
+        with self._lock:
+            total = self.cache_hits + self.cache_misses
+            compressed = [stored for stored in self.cold_cache.values() if isinstance(stored, CompressedFrame)]
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": self.cache_hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "spills": self.spills,
+                "spill_hits": self.spill_hits,
+                "decompressions": self.decompressions,
+                "entries": len(self.data_cache) + len(self.cold_cache) + len(self.pinned),
+                "compressed_entries": len(compressed),
+                "compression_saved_bytes": sum(stored.raw_bytes - stored.compressed_bytes for stored in compressed),
+                "pinned": len(self.pinned),
+                "spilled": len(self._spilled),
+                "size_bytes": self.current_size,
+                "size_limit": self.cache_size_limit,
+            }
 
 # Create a singleton instance
 cache_manager = DataCacheManager()
\ No newline at end of file
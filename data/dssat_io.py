@@ -10,30 +10,39 @@ sys.path.insert(0, project_dir)
 DSSAT file I/O operations
 """
 import os
-import glob
+import re
+import mmap
 # OPTIMIZED: Import only necessary pandas components
 from pandas import DataFrame, concat, to_datetime, to_numeric, isna
 # OPTIMIZED: Import only necessary numpy components
+import numpy as np
 from numpy import nan
 import logging
 import subprocess
 from typing import List, Optional
 import config
-from data.data_processing import standardize_dtypes, unified_date_convert
-from utils.dssat_paths import get_crop_details
+from data.data_processing import (
+    standardize_dtypes, year_doy_to_dates, yyddd_to_dates, parse_data_cde,
+    get_evaluate_variable_pairs, get_all_evaluate_variables
+)
+from data.column_schema import convert_compact, MISSING_SENTINELS
+from data.file_cache import parsed_file_cache
+from data.arrow_backend import arrow_enabled, with_backend
+from data.experiment_catalog import (
+    experiment_catalog, parse_treatment_lines, treatments_frame
+)
+from utils.dssat_paths import crop_registry
+from utils.file_access import read_bytes, decode_bytes, read_lines
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing output changes so stale on-disk cache entries are ignored
+PARSER_VERSION = 3
+
 def prepare_experiment(selected_folder: str) -> List[tuple]:
     """List available experiments based on selected folder."""
     try:
-        # Get crop details for directory and code
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == selected_folder.upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(selected_folder)
         
         if not crop_info:
             logger.error(f"Could not find crop information for folder {selected_folder}")
@@ -45,31 +54,8 @@ def prepare_experiment(selected_folder: str) -> List[tuple]:
             logger.error(f"No directory found for crop {selected_folder}")
             return []
             
-        # Find X files using crop code
-        x_file_pattern = f"*.{crop_info['code']}X"
-        x_files = glob.glob(os.path.join(folder_path, x_file_pattern))
-        
-        result = []
-        for file_path in x_files:
-            filename = os.path.basename(file_path)
-            exp_detail = filename  # Default to filename
-            
-            # Try to read experiment title from file
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    for line in file:
-                        if "*EXP.DETAILS:" in line:
-                            # Extract the title from the line
-                            detail_part = line.strip().split("*EXP.DETAILS:")[1].strip()
-                            exp_detail = ' '.join(detail_part.split()[1:])
-                            break
-            except Exception as e:
-                logger.warning(f"Could not read experiment details from {filename}: {e}")
-            
-            # Add tuple of (display_name, filename) to the result
-            result.append((exp_detail, filename))
-        
-        return result
+        # Titles come from the catalog; only new or changed X files are read
+        return experiment_catalog.experiments(folder_path, crop_info['code'])
         
     except Exception as e:
         logger.error(f"Error preparing experiments: {str(e)}")
@@ -78,13 +64,7 @@ def prepare_experiment(selected_folder: str) -> List[tuple]:
 def prepare_treatment(selected_folder: str, selected_experiment: str) -> Optional[DataFrame]:
     """Prepare treatment data based on selected folder and experiment."""
     try:
-        # Get crop details
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == selected_folder.upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(selected_folder)
         
         if not crop_info:
             logger.error(f"Could not find crop information for folder {selected_folder}")
@@ -97,7 +77,10 @@ def prepare_treatment(selected_folder: str, selected_experiment: str) -> Optiona
             return None
             
         file_path = os.path.join(folder_path, selected_experiment)
-        return read_treatments(file_path)
+        if not os.path.exists(file_path):
+            logger.error(f"Treatment file does not exist: {file_path}")
+            return None
+        return experiment_catalog.treatments(folder_path, crop_info['code'], selected_experiment)
         
     except Exception as e:
         logger.error(f"Error preparing treatment: {str(e)}")
@@ -110,32 +93,9 @@ def read_treatments(file_path: str) -> Optional[DataFrame]:
             logger.error(f"Treatment file does not exist: {file_path}")
             return None
             
-        with open(file_path, "r") as file:
-            lines = file.readlines()
+        lines = read_lines(file_path)
             
-        # Find treatment section
-        treatment_begins = next(
-            (i for i, line in enumerate(lines) if line.startswith("*TREATMENT")),
-            None
-        )
-        
-        if treatment_begins is None:
-            return None
-            
-        treatment_ends = next(
-            (i for i, line in enumerate(lines) 
-             if line.startswith("*") and i > treatment_begins),
-            len(lines)
-        )
-        
-        # Process treatment data
-        treatment_data = lines[treatment_begins:treatment_ends]
-        not_trash_lines = [line for line in treatment_data if line.startswith(" ")]
-        
-        return DataFrame({
-            "TR": [line[:3].strip() for line in not_trash_lines],
-            "TNAME": [line[9:36].strip() for line in not_trash_lines],
-        })
+        return treatments_frame(parse_treatment_lines(lines))
         
     except Exception as e:
         logger.error(f"Error reading treatments: {str(e)}")
@@ -144,13 +104,7 @@ def read_treatments(file_path: str) -> Optional[DataFrame]:
 def prepare_out_files(selected_folder: str) -> List[str]:
     """List OUT files in the selected folder."""
     try:
-        # Get crop details for directory
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == selected_folder.upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(selected_folder)
         
         if not crop_info:
             logger.error(f"Could not find crop information for folder {selected_folder}")
@@ -163,7 +117,7 @@ def prepare_out_files(selected_folder: str) -> List[str]:
             return []
             
         logger.info(f"Looking for OUT files in: {folder_path}")
-        out_files = [f for f in os.listdir(folder_path) if f.endswith(".OUT")]
+        out_files = experiment_catalog.out_files(folder_path, crop_info['code'])
         logger.info(f"Output files found: {out_files}")
         return out_files
         
@@ -171,29 +125,29 @@ def prepare_out_files(selected_folder: str) -> List[str]:
         logger.error(f"Error preparing OUT files: {str(e)}")
         return []
 
-import pandas as pd
-from io import StringIO
-from typing import List, Optional
-import os
-import logging
-import glob
+def resolve_output_path(file_path: str) -> str:
+    """Resolve a bare OUT file name against the crop directories."""
+    if os.path.basename(file_path) == file_path:  # File has no directory part
+        # Try to find the file in crop directories
+        for folder_path in crop_registry.directories():
+            possible_path = os.path.join(folder_path, file_path)
+            if os.path.exists(possible_path):
+                file_path = possible_path
+                break
+    # Normalize the file path to ensure the correct format
+    return os.path.normpath(file_path)
 
-def read_file(file_path: str) -> Optional[DataFrame]:
+def read_file(file_path: str, columns: Optional[List[str]] = None,
+              treatments: Optional[List[str]] = None,
+              use_arrow: Optional[bool] = None) -> Optional[DataFrame]:
     """Read and process DSSAT output file with optimized performance.
     Handles both standard output files and FORAGE.OUT with special processing.
+    The whole file is parsed and cached once; columns keeps only those
+    variables plus the key columns and treatments only those treatments' rows.
+    use_arrow overrides config.USE_ARROW_BACKEND for Arrow-backed columns.
     """
     try:
-        if os.path.basename(file_path) == file_path:  # File has no directory part
-            # Try to find the file in crop directories
-            crop_details = get_crop_details()
-            for crop_info in crop_details:
-                folder_path = crop_info['directory'].strip()
-                possible_path = os.path.join(folder_path, file_path)
-                if os.path.exists(possible_path):
-                    file_path = possible_path
-                    break
-        # Normalize the file path to ensure the correct format
-        file_path = os.path.normpath(file_path)
+        file_path = resolve_output_path(file_path)
         print(f"Attempting to open file: {file_path}")
         print(f"File exists check: {os.path.exists(file_path)}")
         
@@ -201,36 +155,70 @@ def read_file(file_path: str) -> Optional[DataFrame]:
             logger.error(f"File does not exist: {file_path}")
             return None
 
-        # Read file with efficient encoding handling
-        encodings = ['utf-8', 'latin-1']
-        lines = None
-        for encoding in encodings:
-            try:
-                with open(file_path, "r", encoding=encoding) as file:
-                    lines = file.readlines()
-                break
-            except UnicodeDecodeError:
-                continue
-
-        if not lines:
-            logger.error(f"Could not read file with any encoding: {file_path}")
-            return None
+        # One full parse is cached per file version; projections are applied on top of it
+        cache_key = parsed_file_cache.make_key(
+            "out", file_path, version=PARSER_VERSION, compact=config.COMPACT_DTYPES
+        )
+        df = parsed_file_cache.get(cache_key)
+        if df is None:
+            df = parse_output_file(file_path)
+            parsed_file_cache.put(cache_key, df, file_path)
 
-        # Check if this is FORAGE.OUT file
-        is_forage_file = os.path.basename(file_path).upper() == "FORAGE.OUT"
-        
-        # Different processing paths for different file types
-        if is_forage_file:
-            # Special processing for FORAGE.OUT
-            return process_forage_file(lines)
-        else:
-            # Standard processing for other DSSAT output files
-            return process_standard_file(lines)
+        df = select_treatments(project_columns(df, columns), treatments)
+        return with_backend(df, use_arrow)
 
     except Exception as e:
         logger.error(f"Error processing file {file_path}: {str(e)}")
         return None
 
+def parse_output_file(file_path: str) -> Optional[DataFrame]:
+    """Parse a whole OUT file, with the special handling FORAGE.OUT needs."""
+    # Read the whole file as bytes in one call
+    buffer = read_bytes(file_path)
+
+    if not buffer:
+        logger.error(f"File is empty: {file_path}")
+        return None
+
+    # Different processing paths for different file types
+    if os.path.basename(file_path).upper() == "FORAGE.OUT":
+        # Special processing for FORAGE.OUT
+        text = decode_bytes(buffer, file_path)
+        return process_forage_file(text.splitlines(keepends=True))
+    # Vectorized processing for other DSSAT output files
+    return process_standard_buffer(buffer)
+
+def select_treatments(df: Optional[DataFrame], treatments: Optional[List[str]]) -> Optional[DataFrame]:
+    """Keep the rows of the given treatments; None keeps all rows.
+
+    Frames without treatment numbers (files without TREATMENT lines) are
+    kept whole, and the frame itself is returned when every row matches.
+    """
+    if df is None or treatments is None:
+        return df
+    trt_col = next((col for col in ("TRT", "TRNO") if col in df.columns), None)
+    if trt_col is None or df[trt_col].isna().all():
+        return df
+
+    wanted = {str(t).strip() for t in treatments}
+    mask = df[trt_col].astype(str).str.strip().isin(wanted).to_numpy()
+    if not mask.any():
+        logger.warning(f"None of treatments {sorted(wanted)} found")
+        return None
+    if mask.all():
+        return df
+    return df[mask].reset_index(drop=True)
+
+def read_tagged_file(file_path: str, file_name: Optional[str] = None, columns: Optional[List[str]] = None,
+                     treatments: Optional[List[str]] = None,
+                     use_arrow: Optional[bool] = None) -> Optional[DataFrame]:
+    """Read a simulated output file and tag its rows with FILE and source="sim"."""
+    df = read_file(file_path, columns, treatments, use_arrow)
+    if df is not None and not df.empty:
+        df["FILE"] = file_name or os.path.basename(file_path)
+        df["source"] = "sim"
+    return df
+
 def process_forage_file(lines: List[str]) -> Optional[DataFrame]:
     """Process FORAGE.OUT file using pandas with special handling for headers."""
     try:
@@ -294,13 +282,7 @@ def process_forage_file(lines: List[str]) -> Optional[DataFrame]:
         
         # Create DATE column if possible
         if "YEAR" in df.columns and "DOY" in df.columns:
-            df["DATE"] = pd.to_datetime(
-                df["YEAR"].astype(str) + 
-                df["DOY"].astype(str).str.zfill(3),
-                format="%Y%j",
-                errors='coerce'
-            )
-            df["DATE"] = df["DATE"].dt.strftime("%Y-%m-%d")
+            df["DATE"] = year_doy_to_dates(df["YEAR"], df["DOY"])
         
         return df
         
@@ -309,8 +291,8 @@ def process_forage_file(lines: List[str]) -> Optional[DataFrame]:
         logger.exception("Detailed error:")
         return None
 
-def process_standard_file(lines: List[str]) -> Optional[DataFrame]:
-    """Process standard DSSAT output files."""
+def process_standard_file(lines: List[str], columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Process standard DSSAT output files, optionally keeping only the given columns."""
     try:
         # Process data more efficiently
         data_frames = []
@@ -320,38 +302,49 @@ def process_standard_file(lines: List[str]) -> Optional[DataFrame]:
             # Multiple treatment format
             for idx, start_idx in enumerate(treatment_indices):
                 next_idx = treatment_indices[idx + 1] if idx + 1 < len(treatment_indices) else len(lines)
-                df = process_treatment_block(lines[start_idx:next_idx])
+                df = project_columns(process_treatment_block(lines[start_idx:next_idx]), columns)
                 if df is not None:
                     data_frames.append(df)
         else:
             # Single treatment format
-            df = process_treatment_block(lines)
+            df = project_columns(process_treatment_block(lines), columns)
             if df is not None:
                 data_frames.append(df)
 
-        # Combine and process data efficiently
-        if data_frames:
-            combined_data = pd.concat(data_frames, ignore_index=True)
-            combined_data = combined_data.loc[:, combined_data.notna().any()]
-            combined_data = standardize_dtypes(combined_data)
-            
-            # Create DATE column if possible
-            if "YEAR" in combined_data.columns and "DOY" in combined_data.columns:
-                combined_data["DATE"] = pd.to_datetime(
-                    combined_data["YEAR"].astype(str) + 
-                    combined_data["DOY"].astype(str).str.zfill(3),
-                    format="%Y%j",
-                    errors='coerce'
-                )
-                
-            return combined_data
+        return combine_treatment_frames(data_frames)
 
-        return None
-    
     except Exception as e:
         logger.error(f"Error processing standard file: {str(e)}")
         return None
 
+def column_projection(columns: Optional[List[str]]) -> Optional[set]:
+    """Names to keep for a column projection: the requested ones plus the key columns."""
+    if columns is None:
+        return None
+    return set(columns) | _KEY_COLUMNS
+
+def project_columns(df: Optional[DataFrame], columns: Optional[List[str]]) -> Optional[DataFrame]:
+    """Drop every column of df outside the projection; None keeps all columns."""
+    wanted = column_projection(columns)
+    if df is None or wanted is None:
+        return df
+    return df[[col for col in df.columns if col in wanted]]
+
+def combine_treatment_frames(data_frames: List[DataFrame]) -> Optional[DataFrame]:
+    """Concatenate per-treatment frames, standardize dtypes and add DATE."""
+    if not data_frames:
+        return None
+
+    combined_data = pd.concat(data_frames, ignore_index=True)
+    combined_data = combined_data.loc[:, combined_data.notna().any()]
+    combined_data = standardize_dtypes(combined_data, keep_numeric_dates=config.COMPACT_DTYPES)
+
+    # Create DATE column if possible
+    if "YEAR" in combined_data.columns and "DOY" in combined_data.columns:
+        combined_data["DATE"] = year_doy_to_dates(combined_data["YEAR"], combined_data["DOY"])
+
+    return combined_data
+
 def process_treatment_block(lines: List[str]) -> Optional[DataFrame]:
     """Helper function to process a treatment block of data."""
     try:
@@ -388,18 +381,477 @@ def process_treatment_block(lines: List[str]) -> Optional[DataFrame]:
         logger.error(f"Error processing treatment block: {str(e)}")
         return None
 
-def read_observed_data(selected_folder: str, selected_experiment: str, x_var: str, y_vars: List[str]) -> Optional[DataFrame]:
-    """Read observed data from .xxT file matching experiment name pattern."""
+# Vectorized whole-buffer parsing engine for standard DSSAT output files.
+# Blocks are located with one regex scan over the raw bytes, blocks sharing
+# a header are stacked into one fixed-width byte grid and every column is
+# converted with a single NumPy cast instead of per-row splits.
+_TREATMENT_RE = re.compile(rb"\n[ \t]*TREATMENT[ \t]*(\d*)", re.IGNORECASE)
+_HEADER_RE = re.compile(rb"^@", re.MULTILINE)
+_TOKEN_RE = re.compile(rb"\S+")
+
+# Columns kept as strings so standardize_dtypes types them like the legacy path
+_KEY_COLUMNS = {"YEAR", "DOY", "DATE", "TRT", "TRNO", "TR"}
+_SKIPPED_COLUMNS = {"CR"}
+_NON_DATA_PREFIXES = np.frombuffer(b"*!@", dtype=np.uint8)
+_SPACE = ord(" ")
+
+def find_treatment_blocks(buffer: bytes) -> List[tuple]:
+    """Return (start, end, treatment) byte ranges of the blocks in an OUT buffer.
+
+    Files without TREATMENT lines are returned as a single block with no
+    treatment number.
+    """
+    # Anchoring on the newline keeps the scan a fast literal search
+    matches = [(match.start() + 1, match.group(1)) for match in _TREATMENT_RE.finditer(buffer)]
+    first = _TREATMENT_RE.match(b"\n" + buffer[:256])
+    if first is not None:
+        matches.insert(0, (0, first.group(1)))
+    if not matches:
+        return [(0, len(buffer), None)]
+
+    blocks = []
+    for idx, (start, number) in enumerate(matches):
+        end = matches[idx + 1][0] if idx + 1 < len(matches) else len(buffer)
+        blocks.append((start, end, number.decode("latin-1") or None))
+    return blocks
+
+def _data_line_bounds(data: np.ndarray) -> tuple:
+    """Return start/end offsets of the data lines in a block body.
+
+    Blank lines, comment/header lines (``*``, ``!``, ``@``) and the
+    ``KEY : value`` run metadata that precedes the next TREATMENT line are
+    excluded.
+    """
+    newlines = np.flatnonzero(data == 10)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [data.size]))
+    keep = starts < data.size
+    starts, ends = starts[keep], ends[keep]
+    if starts.size == 0:
+        return starts, ends
+
+    # Strip Windows line endings
+    crlf = (ends > starts) & (data[np.maximum(ends - 1, 0)] == 13)
+    ends = ends - crlf
+
+    # Per-line "contains any" reductions over the whole body at once
+    has_text = np.logical_or.reduceat(data > _SPACE, starts)
+    has_colon = np.logical_or.reduceat(data == ord(":"), starts)
+    first_char = data[starts]
+
+    mask = has_text & ~has_colon & ~np.isin(first_char, _NON_DATA_PREFIXES)
+    return starts[mask], ends[mask]
+
+def _scan_block(block: bytes) -> Optional[tuple]:
+    """Locate the header line and data lines of one treatment block.
+
+    Returns (header, data, starts, ends) where data is the block body after
+    the header as a uint8 array and starts/ends bound its data lines.
+    """
+    header_match = _HEADER_RE.search(block)
+    if header_match is None:
+        return None
+
+    header_end = block.find(b"\n", header_match.start())
+    if header_end == -1:
+        return None
+    header = block[header_match.start():header_end].rstrip(b"\r")
+
+    data = np.frombuffer(block, dtype=np.uint8, offset=header_end + 1)
+    starts, ends = _data_line_bounds(data)
+    if starts.size == 0:
+        return None
+    return header, data, starts, ends
+
+def _line_grid(data: np.ndarray, starts: np.ndarray, ends: np.ndarray, width: int) -> np.ndarray:
+    """Arrange data lines as an (n_rows, width) uint8 grid padded with spaces."""
+    lengths = ends - starts
+    if lengths.size > 1:
+        strides = np.diff(starts)
+        uniform = lengths.min() == lengths.max() and strides.min() == strides.max()
+    else:
+        uniform = True
+
+    if uniform and lengths[0] >= width:
+        # Equal-length contiguous lines: a zero-copy strided view of the buffer
+        stride = int(strides[0]) if lengths.size > 1 else int(lengths[0])
+        return np.lib.stride_tricks.as_strided(
+            data[starts[0]:], shape=(lengths.size, width), strides=(stride, 1)
+        )
+
+    offsets = np.arange(width)
+    index = np.minimum(starts[:, None] + offsets, data.size - 1)
+    return np.where(offsets < lengths[:, None], data[index], _SPACE).astype(np.uint8)
+
+def _fixed_width_fields(header: bytes, grid: np.ndarray) -> Optional[List[np.ndarray]]:
+    """Slice a line grid into right-aligned fields ending under each header name.
+
+    Returns None when the data does not line up with the header, in which
+    case the caller falls back to whitespace tokenization.
+    """
+    ends = [match.end() for match in _TOKEN_RE.finditer(header.replace(b"@", b" ", 1))]
+    if not ends or ends[-1] > grid.shape[1]:
+        return None
+    if (grid[:, ends[-1]:] > _SPACE).any():
+        return None
+
+    fields = []
+    start = 0
+    for end in ends:
+        if start > 0 and (grid[:, start] != _SPACE).any():
+            return None
+        field = np.ascontiguousarray(grid[:, start:end])
+        fields.append(field.view(f"S{end - start}").ravel())
+        start = end
+    return fields
+
+def _whitespace_fields(blocks: List[tuple], n_columns: int) -> Optional[List[np.ndarray]]:
+    """Tokenize data lines on whitespace into one bytes array per column."""
+    lines = []
+    for _, data, starts, ends in blocks:
+        body = data.tobytes()
+        lines.extend(body[s:e] for s, e in zip(starts, ends))
+    tokens = b" ".join(lines).split()
+    if len(tokens) != len(lines) * n_columns:
+        return None
+    table = np.array(tokens).reshape(len(lines), n_columns)
+    return [table[:, idx] for idx in range(n_columns)]
+
+def convert_field(raw: np.ndarray, name: str, known_variables=None) -> np.ndarray:
+    """Convert a bytes field to its final dtype.
+
+    With config.COMPACT_DTYPES the column schema decides (int16 day
+    counters, categorical treatments, float32 variables, sentinels as NaN);
+    otherwise int64/float64, or stripped strings if not numeric.
+    """
+    # Fields past the end of a short line are blank; they are missing values
+    bytes_view = np.ascontiguousarray(raw).view(np.uint8).reshape(raw.size, raw.dtype.itemsize)
+    blank = ~(bytes_view > _SPACE).any(axis=1)
+    if blank.any():
+        raw = np.where(blank, b"nan", raw)
+
+    values = None
+    if config.COMPACT_DTYPES:
+        values = convert_compact(raw, name, known_variables or {})
+    elif name not in _KEY_COLUMNS:
+        for dtype in (np.int64, np.float64):
+            try:
+                values = raw.astype(dtype)
+                break
+            except ValueError:
+                continue
+    if values is None:
+        values = np.char.decode(np.char.strip(raw), "latin-1").astype(object)
+
+    if blank.any() and not (isinstance(values, np.ndarray) and values.dtype.kind in "iuf"):
+        # String and categorical columns get NaN rather than the "nan" placeholder
+        is_category = isinstance(values, pd.Categorical)
+        values = np.asarray(values, dtype=object)
+        values[blank] = nan
+        if is_category:
+            values = pd.Categorical(values)
+    return values
+
+def _parse_layout(header: bytes, blocks: List[tuple], columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Parse every block that shares one header line into a single frame.
+
+    Each entry of blocks is (treatment, data, starts, ends) as returned by
+    _scan_block; rows keep the block order. Columns outside the projection
+    are never converted.
+    """
+    headers = header.lstrip(b"@").decode("latin-1").split()
+    width = max(max(int((ends - starts).max()) for _, _, starts, ends in blocks), len(header))
+
+    grids = [_line_grid(data, starts, ends, width) for _, data, starts, ends in blocks]
+    grid = grids[0] if len(grids) == 1 else np.concatenate(grids)
+
+    fields = _fixed_width_fields(header, grid)
+    if fields is None:
+        fields = _whitespace_fields(blocks, len(headers))
+    if fields is None:
+        # Ragged rows: defer to the line-based parser block by block
+        frames = []
+        for treatment, data, _, _ in blocks:
+            lines = (header + b"\n" + data.tobytes()).decode("latin-1").splitlines(keepends=True)
+            df = project_columns(process_treatment_block(lines), columns)
+            if df is not None:
+                if treatment is not None:
+                    df["TRT"] = treatment
+                frames.append(df)
+        return pd.concat(frames, ignore_index=True) if frames else None
+
+    wanted = column_projection(columns)
+    known_variables = parse_data_cde() if config.COMPACT_DTYPES else None
+    converted = {}
+    for name, raw in zip(headers, fields):
+        if name in _SKIPPED_COLUMNS or name in converted:
+            continue
+        if wanted is not None and name not in wanted:
+            continue
+        converted[name] = convert_field(raw, name, known_variables)
+
+    df = DataFrame(converted, index=pd.RangeIndex(grid.shape[0]))
+    treatments = [treatment for treatment, _, _, _ in blocks]
+    if any(treatment is not None for treatment in treatments):
+        counts = [starts.size for _, _, starts, _ in blocks]
+        df["TRT"] = np.repeat(np.array(treatments, dtype=object), counts)
+        if config.COMPACT_DTYPES:
+            df["TRT"] = df["TRT"].astype("category")
+    return df
+
+def parse_treatment_buffer(block: bytes, treatment: Optional[str] = None) -> Optional[DataFrame]:
+    """Parse one treatment block of an OUT file from raw bytes.
+
+    Produces the same columns as process_treatment_block with numeric
+    columns already converted.
+    """
+    scanned = _scan_block(block)
+    if scanned is None:
+        return None
+    header, data, starts, ends = scanned
+    return _parse_layout(header, [(treatment, data, starts, ends)])
+
+def process_standard_buffer(buffer: bytes, columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Process a standard DSSAT output file held in memory as bytes.
+
+    If columns is given only those variables plus the key columns are converted.
+    """
+    try:
+        blocks = ((buffer[start:end], treatment) for start, end, treatment in find_treatment_blocks(buffer))
+        return process_blocks(blocks, columns)
+
+    except Exception as e:
+        logger.error(f"Error processing standard file buffer: {str(e)}")
+        return None
+
+def process_blocks(blocks, columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Parse (block bytes, treatment) pairs of an OUT file into one frame in block order."""
+    try:
+        # Group blocks by header line so each column is converted only once
+        layouts = {}
+        for order, (block, treatment) in enumerate(blocks):
+            scanned = _scan_block(block)
+            if scanned is None:
+                continue
+            header, data, starts, ends = scanned
+            layouts.setdefault(header, []).append((order, (treatment, data, starts, ends)))
+
+        data_frames = []
+        for header, entries in layouts.items():
+            df = _parse_layout(header, [block for _, block in entries], columns)
+            if df is None:
+                continue
+            if len(layouts) > 1:
+                counts = [block[2].size for _, block in entries]
+                df["_BLOCK"] = np.repeat([order for order, _ in entries], counts)
+            data_frames.append(df)
+
+        if len(data_frames) > 1:
+            # Restore file order when blocks had different headers
+            combined = pd.concat(data_frames, ignore_index=True)
+            combined = combined.sort_values("_BLOCK", kind="stable").drop(columns="_BLOCK")
+            data_frames = [combined.reset_index(drop=True)]
+
+        return combine_treatment_frames(data_frames)
+
+    except Exception as e:
+        logger.error(f"Error processing treatment blocks: {str(e)}")
+        return None
+
+def build_block_index(file_path: str) -> Optional[DataFrame]:
+    """Scan an OUT file for TREATMENT blocks.
+
+    Returns one row per block with its byte OFFSET, LENGTH and treatment
+    number (TRT, None for files without TREATMENT lines).
+    """
+    try:
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return None
+            # Regex scan over a memory map so the file is never copied into memory
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                blocks = find_treatment_blocks(buffer)
+
+        return DataFrame({
+            "OFFSET": np.array([start for start, _, _ in blocks], dtype=np.int64),
+            "LENGTH": np.array([end - start for start, end, _ in blocks], dtype=np.int64),
+            "TRT": np.array([treatment for _, _, treatment in blocks], dtype=object),
+        })
+
+    except Exception as e:
+        logger.error(f"Error indexing treatment blocks of {file_path}: {str(e)}")
+        return None
+
+def get_block_index(file_path: str) -> Optional[DataFrame]:
+    """Return the block index of an OUT file, building it once per file version."""
+    cache_key = parsed_file_cache.make_key("block_index", file_path, version=PARSER_VERSION)
+    index = parsed_file_cache.get(cache_key)
+    if index is None:
+        index = build_block_index(file_path)
+        parsed_file_cache.put(cache_key, index, file_path)
+    return index
+
+def read_treatment_blocks(file_path: str, treatments: List[str],
+                          columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Read only the blocks of the given treatments from an OUT file.
+
+    Files without TREATMENT lines are read in full.
+    """
+    try:
+        index = get_block_index(file_path)
+        if index is None:
+            return None
+
+        if index["TRT"].isna().all():
+            selected = index
+        else:
+            wanted = {str(t).strip() for t in treatments}
+            selected = index[index["TRT"].isin(wanted)]
+            if selected.empty:
+                logger.warning(f"None of treatments {sorted(wanted)} found in {file_path}")
+                return None
+
+        return process_blocks(_read_indexed_blocks(file_path, selected), columns)
+
+    except Exception as e:
+        logger.error(f"Error reading treatment blocks from {file_path}: {str(e)}")
+        return None
+
+def _read_indexed_blocks(file_path: str, index: DataFrame):
+    """Yield (block bytes, treatment) for each row of a block index, one block at a time."""
+    with open(file_path, "rb") as file:
+        for offset, length, treatment in index.itertuples(index=False):
+            file.seek(offset)
+            # A cached index stores "no treatment" as a missing string value
+            yield file.read(length), None if isna(treatment) else treatment
+
+def iter_treatment_blocks(file_path: str, columns: Optional[List[str]] = None):
+    """Yield (treatment, DataFrame) for each treatment block of an OUT file.
+
+    Only one block is held in memory at a time, so arbitrarily large
+    outputs can be processed in a streaming fashion. Frames are typed the
+    same way as read_file; files without TREATMENT lines (and FORAGE.OUT)
+    are yielded as a single block with treatment None.
+    """
+    file_path = resolve_output_path(file_path)
+    if os.path.basename(file_path).upper() == "FORAGE.OUT":
+        df = read_file(file_path, columns)
+        if df is not None:
+            yield None, df
+        return
+
+    index = get_block_index(file_path)
+    if index is None:
+        return
+
+    for block, treatment in _read_indexed_blocks(file_path, index):
+        df = process_blocks([(block, treatment)], columns)
+        if df is not None and not df.empty:
+            yield treatment, df
+
+def export_out_file(file_path: str, output_path: str, columns: Optional[List[str]] = None) -> int:
+    """Stream an OUT file to CSV block by block; returns the number of rows written."""
+    rows = 0
+    header = None
+    with open(output_path, "w", newline="", encoding="utf-8") as out:
+        for _, df in iter_treatment_blocks(file_path, columns):
+            if header is None:
+                header = list(df.columns)
+            # Blocks may drop all-empty columns; keep the CSV layout fixed
+            df.reindex(columns=header).to_csv(out, header=rows == 0, index=False)
+            rows += len(df)
+    return rows
+
+# Bytes read from the head of a file to discover its schema
+SCHEMA_SAMPLE_BYTES = 1024 * 1024
+
+_schema_cache = {}
+
+def _schema_columns(header: bytes, is_forage: bool, has_treatments: bool) -> List[str]:
+    """Column names read_file produces for a header line, before empty columns are dropped."""
+    raw_columns = header.lstrip(b"@").decode("latin-1").split()
+    if is_forage:
+        if raw_columns[:2] == ["RUN", "FILEX"]:
+            raw_columns = ["RUN_FILEX"] + raw_columns[2:]
+        columns = ["TRNO" if col in ("TR", "TRT", "TN") else col for col in raw_columns]
+        if "TRNO" not in columns:
+            columns.append("TRNO")
+    else:
+        columns = list(dict.fromkeys(col for col in raw_columns if col not in _SKIPPED_COLUMNS))
+        if has_treatments and "TRT" not in columns:
+            columns.append("TRT")
+
+    if "YEAR" in columns and "DOY" in columns and "DATE" not in columns:
+        columns.append("DATE")
+    return columns
+
+def read_file_schema(file_path: str) -> Optional[dict]:
+    """Return the columns, treatment count and row count of an OUT file without parsing it.
+
+    Only the first SCHEMA_SAMPLE_BYTES of the file are read. For larger
+    files treatments and rows are extrapolated from that sample and
+    "exact" is False. Results are cached per path, mtime and size.
+    """
+    try:
+        file_path = resolve_output_path(file_path)
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if cache_key in _schema_cache:
+            return _schema_cache[cache_key]
+
+        with open(file_path, "rb") as file:
+            sample = file.read(SCHEMA_SAMPLE_BYTES)
+
+        header_match = _HEADER_RE.search(sample)
+        if header_match is None:
+            logger.error(f"No header line found in {file_path}")
+            return None
+        header_end = sample.find(b"\n", header_match.start())
+        header = sample[header_match.start():header_end if header_end != -1 else len(sample)].rstrip(b"\r")
+
+        exact = len(sample) >= stat.st_size
+        if not exact:
+            # Only count complete lines of the sample
+            sample = sample[:sample.rfind(b"\n") + 1]
+
+        blocks = find_treatment_blocks(sample)
+        has_treatments = blocks[0][2] is not None or len(blocks) > 1
+        rows = 0
+        for start, end, _ in blocks:
+            scanned = _scan_block(sample[start:end])
+            if scanned is not None:
+                rows += scanned[2].size
+
+        treatments = len(blocks) if has_treatments else 1
+        if not exact and sample:
+            scale = stat.st_size / len(sample)
+            rows = int(round(rows * scale))
+            treatments = int(round(treatments * scale)) if has_treatments else 1
+
+        is_forage = os.path.basename(file_path).upper() == "FORAGE.OUT"
+        schema = {
+            "columns": _schema_columns(header, is_forage, has_treatments),
+            "treatments": treatments,
+            "rows": rows,
+            "exact": exact,
+        }
+        _schema_cache[cache_key] = schema
+        return schema
+
+    except Exception as e:
+        logger.error(f"Error reading schema of {file_path}: {str(e)}")
+        return None
+
+def read_observed_data(selected_folder: str, selected_experiment: str, x_var: str, y_vars: List[str],
+                       columns: Optional[List[str]] = None,
+                       use_arrow: Optional[bool] = None) -> Optional[DataFrame]:
+    """Read observed data from .xxT file matching experiment name pattern.
+    If columns is given only those variables plus the key columns are kept.
+    use_arrow overrides config.USE_ARROW_BACKEND for Arrow-backed columns."""
     try:
         base_name = selected_experiment.split(".")[0]
         
-        # Get crop details
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == selected_folder.upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(selected_folder)
         
         if not crop_info:
             logger.error(f"Could not find crop code for folder {selected_folder}")
@@ -410,18 +862,42 @@ def read_observed_data(selected_folder: str, selected_experiment: str, x_var: st
         logger.info(f"Checking for T file in folder: {folder_path}")
         
         # Look for T file
-        t_file_pattern = os.path.join(folder_path, f"{base_name}.{crop_info['code']}T")
-        matching_files = [f for f in glob.glob(t_file_pattern) 
-                         if not f.upper().endswith(".OUT")]
+        t_file = experiment_catalog.observed_file(folder_path, crop_info['code'], base_name)
         
-        if not matching_files:
+        if t_file is None:
             logger.warning(f"No matching .{crop_info['code']}T files found for {base_name}")
             return None
             
         # Read and process T file
-        t_file = matching_files[0]
-        with open(t_file, "r") as file:
-            content = file.readlines()
+        cache_key = parsed_file_cache.make_key(
+            "observed", t_file, version=PARSER_VERSION,
+            columns=sorted(columns) if columns is not None else None
+        )
+        df = parsed_file_cache.get(cache_key)
+        if df is None:
+            df = _parse_observed_file(t_file, columns)
+            if df is None:
+                return None
+            parsed_file_cache.put(cache_key, df, t_file)
+
+        # Validate required variables
+        required_vars = ["TRT"] + [var for var in y_vars if var in df.columns]
+        missing_vars = [var for var in required_vars if var not in df.columns]
+
+        if missing_vars:
+            logger.warning(f"Missing required variables: {missing_vars}")
+            return None
+
+        return with_backend(df, use_arrow)
+
+    except Exception as e:
+        logger.error(f"Error reading observed data: {str(e)}")
+        return None
+
+def _parse_observed_file(t_file: str, columns: Optional[List[str]] = None) -> Optional[DataFrame]:
+    """Parse a .xxT observed data file into a standardized DataFrame."""
+    try:
+        content = read_lines(t_file)
             
         # Find header and data
         header_idx = next(
@@ -451,34 +927,79 @@ def read_observed_data(selected_folder: str, selected_experiment: str, x_var: st
         df = df.rename(columns={"TRNO": "TRT"})
         df = df.rename(columns={"TR": "TRT"})
         df = df.rename(columns={"TN": "TRT"})
+        df = project_columns(df, columns)
         df = df.loc[:, df.notna().any()]
         df = standardize_dtypes(df)
         
         # Process DATE column
         if "DATE" in df.columns:
-            df["DATE"] = df["DATE"].apply(lambda x: unified_date_convert(date_str=str(x)))
-            df["DATE"] = df["DATE"].dt.strftime("%Y-%m-%d")
+            df["DATE"] = yyddd_to_dates(df["DATE"])
             df = df.dropna(subset=["DATE"])
             
         # Process treatment columns
         for col in ["TRNO", "TRT","TR", "TN"]:
             if col in df.columns:
                 df[col] = df[col].astype(str)
-                
-        # Validate required variables
-        required_vars = ["TRT"] + [var for var in y_vars if var in df.columns]
-        missing_vars = [var for var in required_vars if var not in df.columns]
-        
-        if missing_vars:
-            logger.warning(f"Missing required variables: {missing_vars}")
-            return None
-            
+
         return df
-        
+
     except Exception as e:
-        logger.error(f"Error reading observed data: {str(e)}")
+        logger.error(f"Error parsing observed file {t_file}: {str(e)}")
         return None
 
+def batch_runs(folder_path: str, entries: List[tuple]) -> List[tuple]:
+    """Resolve (experiment file, treatment) entries to (X file path, treatment number) runs."""
+    runs = []
+    for experiment, treatment in entries:
+        try:
+            trt_num = int(treatment)
+        except ValueError:
+            raise ValueError(f"Invalid treatment number: {treatment}")
+        full_path = os.path.normpath(os.path.join(folder_path, experiment))
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"Experiment file does not exist: {full_path}")
+        runs.append((full_path, trt_num))
+    return runs
+
+def write_batch_file(target_dir: str, crop_code: str, folder_path: str, exe_path: str,
+                     experiment: str, runs: List[tuple]) -> str:
+    """Write BatchFile.v48 for (X file path, treatment number) runs into target_dir."""
+    batch_file_lines = [
+        f"$BATCH({crop_code})",
+        "!",
+        f"! Directory    : {folder_path}",
+        f"! Command Line : {exe_path} B BatchFile.v48",
+        f"! Experiment   : {experiment}",
+        f"! ExpNo        : {len(runs)}",
+        "!",
+        "@FILEX                                                                                        TRTNO     RP     SQ     OP     CO"
+    ]
+    for full_path, trt_num in runs:
+        padded_path = f"{full_path:<90}"
+        batch_file_lines.append(f"{padded_path}{trt_num:>9}      1      0      0      0")
+
+    batch_file_path = os.path.join(target_dir, "BatchFile.v48")
+    with open(batch_file_path, "w", newline="\n", encoding='utf-8') as f:
+        f.write("\n".join(batch_file_lines))
+
+    logger.info(f"Created batch file: {batch_file_path}")
+    return batch_file_path
+
+def check_dssat_result(result: subprocess.CompletedProcess) -> str:
+    """Raise RuntimeError for a failed DSSAT run, return its stdout otherwise."""
+    if result.returncode == 99:
+        error_msg = (
+            "DSSAT simulation failed. Please verify:\n"
+            "1. Input files are properly formatted\n"
+            "2. All required weather files are present\n"
+            "3. Cultivation and treatment parameters are valid"
+        )
+        raise RuntimeError(error_msg)
+    elif result.returncode != 0:
+        error_msg = result.stderr or f"Unknown error (code {result.returncode})"
+        raise RuntimeError(f"DSSAT execution failed: {error_msg}")
+    return result.stdout
+
 def create_batch_file(input_data: dict, DSSAT_BASE: str) -> str:
     """Create DSSAT batch file for treatment execution."""
     try:
@@ -488,13 +1009,7 @@ def create_batch_file(input_data: dict, DSSAT_BASE: str) -> str:
         if missing_fields:
             raise ValueError(f"Missing required input data: {', '.join(missing_fields)}")
             
-        # Get crop directory
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == input_data["folders"].upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(input_data["folders"])
         
         if not crop_info:
             raise ValueError(f"Could not find crop information for {input_data['folders']}")
@@ -515,41 +1030,11 @@ def create_batch_file(input_data: dict, DSSAT_BASE: str) -> str:
         if not os.path.exists(folder_path):
             raise FileNotFoundError(f"Folder path does not exist: {folder_path}")
             
-        # Create batch file content
-        batch_file_lines = [
-            f"$BATCH({crop_info['code']})",
-            "!",
-            f"! Directory    : {folder_path}",
-            f"! Command Line : {os.path.join(base_path, input_data['executables'])} B BatchFile.v48",
-            f"! Experiment   : {input_data['experiment']}",
-            f"! ExpNo        : {len(treatments)}",
-            "!",
-            "@FILEX                                                                                        TRTNO     RP     SQ     OP     CO"
-        ]
-        
-        # Add treatment lines
-        for treatment in treatments:
-            try:
-                trt_num = int(treatment)
-                full_path = os.path.normpath(os.path.join(folder_path, input_data["experiment"]))
-                
-                if not os.path.exists(full_path):
-                    raise FileNotFoundError(f"Experiment file does not exist: {full_path}")
-                    
-                padded_path = f"{full_path:<90}"
-                line = f"{padded_path}{trt_num:>9}      1      0      0      0"
-                batch_file_lines.append(line)
-                
-            except ValueError as e:
-                raise ValueError(f"Invalid treatment number: {treatment}")
-                
-        # Write batch file
-        batch_file_path = os.path.join(folder_path, "BatchFile.v48")
-        with open(batch_file_path, "w", newline="\n", encoding='utf-8') as f:
-            f.write("\n".join(batch_file_lines))
-            
-        logger.info(f"Created batch file: {batch_file_path}")
-        return batch_file_path
+        runs = batch_runs(folder_path, [(input_data["experiment"], treatment) for treatment in treatments])
+        return write_batch_file(
+            folder_path, crop_info['code'], folder_path,
+            os.path.join(base_path, input_data['executables']), input_data['experiment'], runs
+        )
         
     except Exception as e:
         logger.error(f"Error creating batch file: {str(e)}")
@@ -561,13 +1046,7 @@ def run_treatment(input_data: dict, DSSAT_BASE: str) -> str:
         raise ValueError("No treatments selected")
         
     try:
-        # Get crop directory
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-             if crop['name'].upper() == input_data["folders"].upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(input_data["folders"])
         
         if not crop_info:
             raise ValueError(f"Could not find crop information for {input_data['folders']}")
@@ -604,19 +1083,7 @@ def run_treatment(input_data: dict, DSSAT_BASE: str) -> str:
             )
             
             # Handle execution results
-            if result.returncode == 99:
-                error_msg = (
-                    "DSSAT simulation failed. Please verify:\n"
-                    "1. Input files are properly formatted\n"
-                    "2. All required weather files are present\n"
-                    "3. Cultivation and treatment parameters are valid"
-                )
-                raise RuntimeError(error_msg)
-            elif result.returncode != 0:
-                error_msg = result.stderr or f"Unknown error (code {result.returncode})"
-                raise RuntimeError(f"DSSAT execution failed: {error_msg}")
-                
-            return result.stdout
+            return check_dssat_result(result)
             
         finally:
             os.chdir(original_dir)
@@ -626,16 +1093,24 @@ def run_treatment(input_data: dict, DSSAT_BASE: str) -> str:
         logger.error(f"Error in run_treatment: {str(e)}")
         raise
 
-def read_evaluate_file(selected_folder: str) -> Optional[DataFrame]:
-    """Read and process EVALUATE.OUT file."""
+# (path, mtime, size, arrow) -> {"data", "pairs", "variables"} for EVALUATE.OUT
+_evaluate_cache = {}
+
+def read_evaluate_file(selected_folder: str, use_arrow: Optional[bool] = None) -> Optional[DataFrame]:
+    """Read and process EVALUATE.OUT file.
+    use_arrow overrides config.USE_ARROW_BACKEND for Arrow-backed columns."""
+    evaluate = read_evaluate_data(selected_folder, use_arrow)
+    return evaluate["data"] if evaluate is not None else None
+
+def read_evaluate_data(selected_folder: str, use_arrow: Optional[bool] = None) -> Optional[dict]:
+    """Read EVALUATE.OUT once per file version together with its derived variable lists.
+
+    Returns {"data": DataFrame, "pairs": get_evaluate_variable_pairs(data),
+    "variables": get_all_evaluate_variables(data)}; repeated calls for an
+    unchanged file return the same result without parsing or pairing again.
+    """
     try:
-        # Get crop details
-        crop_details = get_crop_details()
-        crop_info = next(
-            (crop for crop in crop_details 
-              if crop['name'].upper() == selected_folder.upper()),
-            None
-        )
+        crop_info = crop_registry.get_by_name(selected_folder)
         
         if not crop_info:
             logger.error(f"Could not find crop information for folder {selected_folder}")
@@ -648,76 +1123,107 @@ def read_evaluate_file(selected_folder: str) -> Optional[DataFrame]:
         if not os.path.exists(evaluate_path):
             logger.warning(f"EVALUATE.OUT not found in {folder_path}")
             return None
-            
-        # Read file
-        try:
-            with open(evaluate_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-        except UnicodeDecodeError:
-            with open(evaluate_path, 'r', encoding='latin-1') as file:
-                lines = file.readlines()
-                
-        # Find header
-        header_idx = next(
-            (i for i, line in enumerate(lines) 
-              if line.strip().startswith("@")),
-            None
-        )
-        
-        if header_idx is None:
-            logger.error(f"No header found in {evaluate_path}")
-            return None
-            
-        # Process data
-        headers = lines[header_idx].strip().lstrip("@").split()
-        logger.info(f"Found headers: {headers}")
-        
-        data_lines = [
-            line.strip().split()
-            for line in lines[header_idx + 1:]
-            if line.strip() and not line.startswith("*")
-        ]
+
+        stat = os.stat(evaluate_path)
+        arrow = arrow_enabled(use_arrow)
+        memo_key = (os.path.abspath(evaluate_path), stat.st_mtime_ns, stat.st_size, arrow)
+        if memo_key in _evaluate_cache:
+            return _evaluate_cache[memo_key]
+
+        cache_key = parsed_file_cache.make_key("evaluate", evaluate_path, version=PARSER_VERSION)
+        df = parsed_file_cache.get(cache_key)
+        if df is None:
+            df = _parse_evaluate_file(evaluate_path)
+            if df is None:
+                return None
+            parsed_file_cache.put(cache_key, df, evaluate_path)
+
+        evaluate = {
+            "data": with_backend(df, arrow),
+            "pairs": get_evaluate_variable_pairs(df),
+            "variables": get_all_evaluate_variables(df),
+        }
+        # Only the current version of each file is kept
+        for key in [key for key in _evaluate_cache if key[0] == memo_key[0]]:
+            del _evaluate_cache[key]
+        _evaluate_cache[memo_key] = evaluate
+        return evaluate
         
-        if not data_lines:
-            logger.warning(f"No data found in {evaluate_path}")
-            return None
+    except Exception as e:
+        logger.error(f"Error reading EVALUATE.OUT: {str(e)}")
+        logger.exception("Detailed error:")
+        return None
+
+def _numeric_evaluate_column(tokens: np.ndarray) -> np.ndarray:
+    """Convert one EVALUATE.OUT column to numbers with missing sentinels as NaN."""
+    values = to_numeric(tokens, errors="coerce")
+    missing = np.isin(values, MISSING_SENTINELS)
+    if missing.any():
+        values = values.astype(np.float64)
+        values[missing] = nan
+    return values
+
+def _parse_evaluate_file(evaluate_path: str) -> Optional[DataFrame]:
+    """Parse EVALUATE.OUT into a standardized DataFrame with TRNO as the treatment column."""
+    lines = read_lines(evaluate_path)
             
-        # Create DataFrame
-        df = DataFrame(data_lines, columns=headers)
-        logger.info(f"Initial DataFrame columns: {df.columns.tolist()}")
-        
-        # Convert string columns to numeric where possible
-        for col in df.columns:
-            df[col] = to_numeric(df[col], errors='coerce')
-        
-        # Handle missing values - replace with NaN
-        for val in config.MISSING_VALUES:
-            df = df.replace(val, nan)
+    # Find header
+    header_idx = next(
+        (i for i, line in enumerate(lines) 
+          if line.strip().startswith("@")),
+        None
+    )
+    
+    if header_idx is None:
+        logger.error(f"No header found in {evaluate_path}")
+        return None
         
-        # Standardize treatment column names with case-insensitive check
-        treatment_cols = ['TRNO', 'TR', 'TRT','TN']
-        found_trt_col = None
+    # Process data
+    headers = lines[header_idx].strip().lstrip("@").split()
+    logger.info(f"Found headers: {headers}")
+    
+    data_lines = [
+        line
+        for line in lines[header_idx + 1:]
+        if line.strip() and not line.startswith("*")
+    ]
+    
+    if not data_lines:
+        logger.warning(f"No data found in {evaluate_path}")
+        return None
+
+    # Tokenize all rows in one split when every row has a value per header
+    tokens = " ".join(data_lines).split()
+    if len(tokens) == len(data_lines) * len(headers):
+        table = np.array(tokens, dtype=object).reshape(len(data_lines), len(headers))
+        df = DataFrame(
+            {idx: _numeric_evaluate_column(table[:, idx]) for idx in range(len(headers))}
+        )
+        df.columns = headers
+    else:
+        df = DataFrame([line.split() for line in data_lines], columns=headers)
         for col in df.columns:
-            if col.upper() in [t.upper() for t in treatment_cols]:
-                found_trt_col = col
-                if col != 'TRNO':
-                    df = df.rename(columns={col: 'TRNO'})
-                    logger.info(f"Renamed '{col}' column to 'TRNO'")
-                break
-                
-        if found_trt_col is None:
-            logger.warning("No treatment column (TRNO/TR/TRT) found in the data")
-            # Create a default TRNO column if none exists
-            df['TRNO'] = 1
-            logger.info("Created default TRNO column with value 1")
+            df[col] = _numeric_evaluate_column(df[col].to_numpy(dtype=object))
+    logger.info(f"Initial DataFrame columns: {df.columns.tolist()}")
+    
+    # Standardize treatment column names with case-insensitive check
+    treatment_cols = ['TRNO', 'TR', 'TRT','TN']
+    found_trt_col = None
+    for col in df.columns:
+        if col.upper() in [t.upper() for t in treatment_cols]:
+            found_trt_col = col
+            if col != 'TRNO':
+                df = df.rename(columns={col: 'TRNO'})
+                logger.info(f"Renamed '{col}' column to 'TRNO'")
+            break
             
-        # Log final columns for debugging
-        logger.info(f"Final DataFrame columns: {df.columns.tolist()}")
-        
-        df = standardize_dtypes(df)
-        return df
+    if found_trt_col is None:
+        logger.warning("No treatment column (TRNO/TR/TRT) found in the data")
+        # Create a default TRNO column if none exists
+        df['TRNO'] = 1
+        logger.info("Created default TRNO column with value 1")
         
-    except Exception as e:
-        logger.error(f"Error reading EVALUATE.OUT: {str(e)}")
-        logger.exception("Detailed error:")
-        return None
\ No newline at end of file
+    # Log final columns for debugging
+    logger.info(f"Final DataFrame columns: {df.columns.tolist()}")
+    
+    return standardize_dtypes(df)
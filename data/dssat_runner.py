@@ -0,0 +1,225 @@
+"""
+Parallel DSSAT execution in isolated working directories
+
+The selected runs are split into contiguous shards. Each shard gets its
+own scratch directory and BatchFile.v48 and runs the DSSAT executable
+there, so shards never overwrite each other's batch or output files.
+Each time the next shard in order finishes, the OUT files of all finished
+leading shards are merged back into the crop directory. The runs stay in
+treatment order and the merged files only grow, so a plot following them
+sees the runs arrive as it would during a sequential run.
+"""
+import os
+import re
+import sys
+import shutil
+import logging
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from utils.dssat_paths import crop_registry
+from data.dssat_io import batch_runs, write_batch_file, check_dssat_result
+
+logger = logging.getLogger(__name__)
+
+_RUN_LINE = re.compile(rb"^\*RUN(\s+\d+)")
+_LEADING_NUMBER = re.compile(rb"^\s*\d+")
+
+# First header columns of tabular OUT files (Summary.OUT, EVALUATE.OUT) that number the runs
+_RUN_COLUMNS = {b"RUNNO", b"RUN"}
+
+def shard_runs(runs: List[tuple], shards: int) -> List[List[tuple]]:
+    """Split runs into at most `shards` contiguous, near-equal chunks."""
+    shards = max(1, min(shards, len(runs)))
+    size, extra = divmod(len(runs), shards)
+    chunks = []
+    start = 0
+    for idx in range(shards):
+        end = start + size + (1 if idx < extra else 0)
+        chunks.append(runs[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+def merge_out_contents(parts: List[bytes]) -> bytes:
+    """Concatenate one OUT file from several shards.
+
+    The first shard is kept whole. Later shards contribute their run
+    blocks (from the first *RUN line on) or, for tabular files such as
+    Summary.OUT, the rows after their last @ header line. *RUN numbers and
+    the run number column of tabular files are rewritten to run on across
+    shards.
+    """
+    merged = []
+    for idx, part in enumerate(parts):
+        lines = part.splitlines(keepends=True)
+        if idx > 0:
+            start = next((i for i, line in enumerate(lines) if line.startswith(b"*RUN")), None)
+            if start is None:
+                headers = [i for i, line in enumerate(lines) if line.startswith(b"@")]
+                start = headers[-1] + 1 if headers else 0
+            lines = lines[start:]
+        if merged and not merged[-1].endswith(b"\n"):
+            merged[-1] += b"\n"
+        merged.extend(lines)
+
+    run_number = 0
+    for idx, line in enumerate(merged):
+        match = _RUN_LINE.match(line)
+        if match:
+            run_number += 1
+            # The number keeps its right-aligned field width
+            field = b" " + str(run_number).encode("ascii").rjust(len(match.group(1)) - 1)
+            merged[idx] = b"*RUN" + field + line[match.end():]
+
+    if run_number == 0:
+        _renumber_table_rows(merged)
+    return b"".join(merged)
+
+def _renumber_table_rows(lines: List[bytes]) -> None:
+    """Number the data rows after the last @ header if its first column is the run number."""
+    headers = [i for i, line in enumerate(lines) if line.startswith(b"@")]
+    if not headers or lines[headers[-1]][1:].split()[:1] not in ([column] for column in _RUN_COLUMNS):
+        return
+    run_number = 0
+    for idx in range(headers[-1] + 1, len(lines)):
+        match = _LEADING_NUMBER.match(lines[idx])
+        if match:
+            run_number += 1
+            field = str(run_number).encode("ascii").rjust(len(match.group(0)))
+            lines[idx] = field + lines[idx][match.end():]
+
+def merge_out_files(shard_dirs: List[str], target_dir: str) -> List[str]:
+    """Merge the OUT files of all shard directories into target_dir; returns the merged names."""
+    names = []
+    for shard_dir in shard_dirs:
+        for entry in sorted(os.scandir(shard_dir), key=lambda entry: entry.name):
+            if entry.is_file() and entry.name.upper().endswith(".OUT") and entry.name not in names:
+                names.append(entry.name)
+
+    for name in names:
+        parts = []
+        paths = [os.path.join(shard_dir, name) for shard_dir in shard_dirs]
+        for path in paths:
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    parts.append(f.read())
+
+        target_path = os.path.join(target_dir, name)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}-", dir=target_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(merge_out_contents(parts))
+        # mkstemp creates the file as 0600; keep the mode of the file it replaces
+        mode_source = target_path if os.path.exists(target_path) else next(p for p in paths if os.path.exists(p))
+        shutil.copymode(mode_source, tmp_path)
+        os.replace(tmp_path, target_path)
+
+    logger.info(f"Merged {len(names)} output files from {len(shard_dirs)} shards into {target_dir}")
+    return names
+
+class ParallelDSSATRunner:
+    """Run DSSAT treatments in parallel shards, each in its own scratch directory."""
+
+    def __init__(self, dssat_base: str = None, workers: int = None, scratch_dir: str = None):
+        self.dssat_base = dssat_base or config.DSSAT_BASE
+        self.workers = workers or config.DSSAT_RUN_WORKERS
+        self.scratch_dir = scratch_dir or config.DSSAT_SCRATCH_DIR
+
+    def run(self, input_data: dict) -> str:
+        """Run the treatments of input_data (same fields as run_treatment).
+
+        input_data may also carry "runs": a list of (experiment file,
+        treatment) entries spanning several experiments of the crop.
+        """
+        entries = input_data.get("runs")
+        if not entries:
+            treatments = input_data.get("treatment")
+            if not treatments:
+                raise ValueError("No treatments selected")
+            if isinstance(treatments, str):
+                treatments = [treatments]
+            entries = [(input_data["experiment"], treatment) for treatment in treatments]
+
+        crop_info = crop_registry.get_by_name(input_data["folders"])
+        if not crop_info:
+            raise ValueError(f"Could not find crop information for {input_data['folders']}")
+
+        folder_path = os.path.normpath(crop_info['directory'].strip())
+        if not os.path.exists(folder_path):
+            raise FileNotFoundError(f"Working directory does not exist: {folder_path}")
+
+        exe_path = os.path.normpath(os.path.join(self.dssat_base, input_data["executables"]))
+        return self.run_entries(folder_path, crop_info['code'], exe_path, entries)
+
+    def run_entries(self, folder_path: str, crop_code: str, exe_path: str, entries: List[tuple]) -> str:
+        """Run (experiment file, treatment) entries of one crop directory and merge their outputs there."""
+        if not os.path.exists(exe_path):
+            raise FileNotFoundError(f"Executable not found: {exe_path}")
+
+        runs = batch_runs(folder_path, entries)
+        shards = shard_runs(runs, self.workers)
+        experiment = ", ".join(dict.fromkeys(experiment for experiment, _ in entries))
+        logger.info(f"Running {len(runs)} treatments in {len(shards)} shards")
+
+        if self.scratch_dir:
+            os.makedirs(self.scratch_dir, exist_ok=True)
+        shard_dirs = [tempfile.mkdtemp(prefix=f"dssat-shard{idx}-", dir=self.scratch_dir)
+                      for idx in range(len(shards))]
+        failed = False
+        try:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="dssat") as executor:
+                futures = [
+                    executor.submit(self._run_shard, shard_dir, crop_code, folder_path, exe_path, experiment, shard)
+                    for shard_dir, shard in zip(shard_dirs, shards)
+                ]
+                outputs = []
+                errors = []
+                for idx, future in enumerate(futures):
+                    try:
+                        outputs.append(future.result())
+                    except Exception as e:
+                        errors.append(f"shard {idx + 1} ({shard_dirs[idx]}): {e}")
+                        continue
+                    if not errors:
+                        # Each merge extends the previous one, so followed files grow as shards finish
+                        merge_out_files(shard_dirs[:idx + 1], folder_path)
+
+            if errors:
+                failed = True
+                raise RuntimeError("DSSAT execution failed in " + "; ".join(errors))
+
+            return "".join(outputs)
+
+        finally:
+            for shard_dir in shard_dirs:
+                if failed:
+                    logger.info(f"Keeping scratch directory {shard_dir} for inspection")
+                else:
+                    shutil.rmtree(shard_dir, ignore_errors=True)
+
+    def _run_shard(self, shard_dir: str, crop_code: str, folder_path: str, exe_path: str,
+                   experiment: str, runs: List[tuple]) -> str:
+        write_batch_file(shard_dir, crop_code, folder_path, exe_path, experiment, runs)
+        logger.info(f"Executing {exe_path} B BatchFile.v48 in {shard_dir}")
+        result = subprocess.run(
+            [exe_path, "B", "BatchFile.v48"],
+            cwd=shard_dir,
+            capture_output=True,
+            text=True,
+            encoding='utf-8'
+        )
+        return check_dssat_result(result)
+
+def run_treatments_parallel(input_data: dict, DSSAT_BASE: str, workers: Optional[int] = None) -> str:
+    """Run DSSAT treatments in parallel shards; drop-in for create_batch_file + run_treatment."""
+    try:
+        return ParallelDSSATRunner(DSSAT_BASE, workers).run(input_data)
+    except Exception as e:
+        logger.error(f"Error in run_treatments_parallel: {str(e)}")
+        raise
@@ -0,0 +1,267 @@
+"""
+Persistent catalog of experiment, observed and output files in crop directories
+
+Experiment titles and treatment tables are read once per X file version
+and kept in a JSON index, so the selectors populate without reopening
+every X file. Queries are answered from the in-memory index; a directory
+is rescanned with os.scandir only when its mtime differs from the one
+recorded at the last scan (or by refresh_all_async), and only files whose
+mtime or size changed are parsed again.
+"""
+import os
+import sys
+import json
+import logging
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from pandas import DataFrame
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from utils.dssat_paths import crop_registry
+from utils.file_access import read_lines
+
+logger = logging.getLogger(__name__)
+
+# Bump when the indexed fields change so old catalogs are rebuilt
+CATALOG_VERSION = 1
+
+# A directory changed this recently may change again within the same mtime tick
+_MTIME_SETTLE_NS = 2_000_000_000
+
+def parse_experiment_title(lines: List[str], default: str) -> str:
+    """Return the title on the *EXP.DETAILS: line of an X file."""
+    for line in lines:
+        if "*EXP.DETAILS:" in line:
+            # Extract the title from the line
+            detail_part = line.strip().split("*EXP.DETAILS:")[1].strip()
+            return ' '.join(detail_part.split()[1:])
+    return default
+
+def parse_treatment_lines(lines: List[str]) -> Optional[List[tuple]]:
+    """Return (TR, TNAME) pairs from the *TREATMENTS section of an X file."""
+    treatment_begins = next(
+        (i for i, line in enumerate(lines) if line.startswith("*TREATMENT")),
+        None
+    )
+
+    if treatment_begins is None:
+        return None
+
+    treatment_ends = next(
+        (i for i, line in enumerate(lines)
+         if line.startswith("*") and i > treatment_begins),
+        len(lines)
+    )
+
+    treatment_data = lines[treatment_begins:treatment_ends]
+    not_trash_lines = [line for line in treatment_data if line.startswith(" ")]
+    return [(line[:3].strip(), line[9:36].strip()) for line in not_trash_lines]
+
+def treatments_frame(treatments: Optional[List[tuple]]) -> Optional[DataFrame]:
+    """Build the TR/TNAME frame the treatment selector expects."""
+    if treatments is None:
+        return None
+    return DataFrame({
+        "TR": [tr for tr, _ in treatments],
+        "TNAME": [name for _, name in treatments],
+    })
+
+def _file_kind(name: str, crop_code: str) -> Optional[str]:
+    # Suffixes match case-insensitively, like glob does on Windows
+    name = name.upper()
+    if name.endswith(".OUT"):
+        return "OUT"
+    crop_code = crop_code.upper() if crop_code else crop_code
+    if crop_code and name.endswith(f".{crop_code}X"):
+        return "X"
+    if crop_code and name.endswith(f".{crop_code}T"):
+        return "T"
+    return None
+
+def _directory_mtime(folder_path: str) -> Optional[int]:
+    """Return the directory's mtime, or None if it is missing or too recent to trust."""
+    try:
+        mtime = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        return None
+    if time.time_ns() - mtime < _MTIME_SETTLE_NS:
+        return None
+    return mtime
+
+class ExperimentCatalog:
+    """Index of X/T/OUT files, experiment titles and treatment tables per directory."""
+
+    def __init__(self, index_path: str = None, max_workers: int = 4):
+        self.index_path = index_path or config.EXPERIMENT_CATALOG_PATH
+        self.max_workers = max_workers
+        self.directories = {}
+        self._lock = threading.RLock()
+        self._dir_locks = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the persisted index, ignoring it if unreadable or outdated."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("version") == CATALOG_VERSION:
+                self.directories = stored.get("directories", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable experiment catalog {self.index_path}: {e}")
+
+    def save(self) -> None:
+        """Persist the index atomically if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": CATALOG_VERSION, "directories": self.directories}
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.index_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".catalog-", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.warning(f"Could not save experiment catalog: {e}")
+
+    def _directory_lock(self, folder_path: str) -> threading.Lock:
+        with self._lock:
+            return self._dir_locks.setdefault(folder_path, threading.Lock())
+
+    def refresh_directory(self, folder_path: str, crop_code: str) -> dict:
+        """Rescan one directory, parsing only new or changed X files."""
+        with self._directory_lock(folder_path):
+            with self._lock:
+                entry = self.directories.get(folder_path)
+            if entry is None or entry.get("code") != crop_code:
+                entry = {"code": crop_code, "files": {}}
+
+            # Taken before the scan so a change during it triggers another one
+            dir_mtime = _directory_mtime(folder_path)
+            old_files = entry["files"]
+            files = {}
+            changed = False
+            try:
+                scanned = list(os.scandir(folder_path))
+            except OSError as e:
+                logger.error(f"Could not scan {folder_path}: {e}")
+                return entry
+
+            for dir_entry in scanned:
+                kind = _file_kind(dir_entry.name, crop_code)
+                if kind is None or not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+                previous = old_files.get(dir_entry.name)
+                if previous and previous["mtime"] == stat.st_mtime_ns and previous["size"] == stat.st_size:
+                    files[dir_entry.name] = previous
+                    continue
+
+                record = {"kind": kind, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+                if kind == "X":
+                    record.update(self._index_experiment(dir_entry.path))
+                files[dir_entry.name] = record
+                changed = True
+
+            changed = changed or files.keys() != old_files.keys() or entry.get("mtime") != dir_mtime
+            entry = {"code": crop_code, "files": files, "mtime": dir_mtime}
+            with self._lock:
+                self.directories[folder_path] = entry
+                self._dirty = self._dirty or changed
+            return entry
+
+    def _index_experiment(self, file_path: str) -> dict:
+        filename = os.path.basename(file_path)
+        try:
+            lines = read_lines(file_path)
+        except Exception as e:
+            logger.warning(f"Could not read experiment details from {filename}: {e}")
+            return {"title": filename, "treatments": None}
+        return {
+            "title": parse_experiment_title(lines, filename),
+            "treatments": parse_treatment_lines(lines),
+        }
+
+    def refresh_all_async(self):
+        """Rescan every crop directory in a background thread pool.
+
+        Returns the futures; the index is saved once all scans finish.
+        """
+        crops = [
+            (crop['directory'].strip(), crop['code'])
+            for crop in crop_registry.crops() if crop['directory'].strip()
+        ]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="catalog")
+        futures = [executor.submit(self.refresh_directory, path, code) for path, code in crops]
+        executor.submit(self._save_when_done, futures)
+        executor.shutdown(wait=False)
+        return futures
+
+    def _save_when_done(self, futures) -> None:
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error scanning crop directory: {e}")
+        self.save()
+
+    def _entry(self, folder_path: str, crop_code: str) -> dict:
+        """Return the indexed directory, rescanning it only if it changed since the last scan."""
+        with self._lock:
+            entry = self.directories.get(folder_path)
+        if (entry is not None and entry.get("code") == crop_code
+                and entry.get("mtime") is not None and entry["mtime"] == _directory_mtime(folder_path)):
+            return entry
+        entry = self.refresh_directory(folder_path, crop_code)
+        self.save()
+        return entry
+
+    def _files(self, folder_path: str, crop_code: str, kind: str) -> dict:
+        entry = self._entry(folder_path, crop_code)
+        return {name: record for name, record in entry["files"].items() if record["kind"] == kind}
+
+    def experiments(self, folder_path: str, crop_code: str) -> List[tuple]:
+        """Return (title, filename) for every X file in the directory."""
+        files = self._files(folder_path, crop_code, "X")
+        return [(files[name]["title"], name) for name in sorted(files)]
+
+    def treatments(self, folder_path: str, crop_code: str, filename: str) -> Optional[DataFrame]:
+        """Return the TR/TNAME table of one experiment."""
+        record = self._entry(folder_path, crop_code)["files"].get(filename)
+        if record is None or record["kind"] != "X":
+            return None
+        return treatments_frame(record["treatments"])
+
+    def out_files(self, folder_path: str, crop_code: str) -> List[str]:
+        """Return the names of the OUT files in the directory."""
+        return sorted(self._files(folder_path, crop_code, "OUT"))
+
+    def observed_file(self, folder_path: str, crop_code: str, base_name: str) -> Optional[str]:
+        """Return the path of the T file of an experiment, if present."""
+        files = self._entry(folder_path, crop_code)["files"]
+        name = f"{base_name}.{crop_code}T"
+        record = files.get(name)
+        if record is not None and record["kind"] == "T":
+            return os.path.join(folder_path, name)
+        wanted = name.upper()
+        for name in sorted(files):
+            if name.upper() == wanted and files[name]["kind"] == "T":
+                return os.path.join(folder_path, name)
+        return None
+
+
+# Create a singleton instance
+experiment_catalog = ExperimentCatalog()
@@ -0,0 +1,339 @@
+"""
+Persistent on-disk cache for parsed DSSAT files
+
+Each parsed DataFrame is stored as one .npy file per column plus a small
+JSON manifest, so a cache hit memory-maps the column buffers instead of
+reparsing the source file. Entries are keyed by the absolute source path,
+its mtime and size, and the parser version.
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from utils.performance_monitor import perf_monitor
+from data.arrow_backend import arrow_to_numpy_series
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _path_digest(file_path: str) -> str:
+    return hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+
+
+def _directory_size(path: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class ParsedFileCache:
+    """Size-bounded on-disk cache of parsed DataFrames."""
+
+    def __init__(self, cache_dir: str = None, size_limit: int = None, monitor=None,
+                 enabled: bool = None, counter_category: str = "parsed_cache"):
+        self.cache_dir = cache_dir or config.PARSED_FILE_CACHE_DIR
+        self.size_limit = size_limit or config.PARSED_FILE_CACHE_SIZE_LIMIT
+        self.monitor = monitor or perf_monitor
+        self.enabled = config.ENABLE_PARSED_FILE_CACHE if enabled is None else enabled
+        self.counter_category = counter_category
+        self.hits = 0
+        self.misses = 0
+        # Running on-disk size of the entries, loaded by one scan on first use
+        self._total_size = None
+        self._size_lock = threading.Lock()
+
+    def make_key(self, kind: str, file_path: str, **params) -> Optional[str]:
+        """Build the cache key for a source file, or None if it cannot be stat'ed.
+
+        Extra keyword arguments (parser version, column projection, ...)
+        become part of the key.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        variant = json.dumps({
+            "kind": kind,
+            "path": os.path.abspath(file_path),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "params": params,
+        }, sort_keys=True, default=str)
+        variant_digest = hashlib.sha1(variant.encode("utf-8")).hexdigest()[:16]
+        return f"{_path_digest(file_path)}-{variant_digest}"
+
+    def get(self, key: Optional[str]) -> Optional[DataFrame]:
+        """Return the cached DataFrame for key, memory-mapping its columns."""
+        if not self.enabled or key is None:
+            return None
+
+        entry_dir = os.path.join(self.cache_dir, key)
+        try:
+            with open(os.path.join(entry_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            df = self._load_frame(entry_dir, manifest)
+        except FileNotFoundError:
+            df = None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove_entry(entry_dir)
+            df = None
+
+        if df is None:
+            self.misses += 1
+            self.monitor.increment_counter(self.counter_category, "misses")
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        os.utime(entry_dir)
+        self.hits += 1
+        self.monitor.increment_counter(self.counter_category, "hits")
+        return df
+
+    def put(self, key: Optional[str], df: DataFrame, source_path: str = None) -> bool:
+        """Store df under key; returns False if the frame cannot be cached."""
+        if not self.enabled or key is None or df is None:
+            return False
+
+        entry_dir = os.path.join(self.cache_dir, key)
+        tmp_dir = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+            manifest = self._save_frame(tmp_dir, df)
+            if manifest is None:
+                logger.debug(f"Not caching parsed data for {source_path or key}: it has a column that cannot be stored")
+                self.monitor.increment_counter(self.counter_category, "skipped")
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return False
+            manifest["source"] = os.path.abspath(source_path) if source_path else None
+            manifest["source_mtime"] = self._source_mtime(source_path)
+            with open(os.path.join(tmp_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+
+            # Drop entries for older versions of the same source file
+            self._remove_stale(key)
+            entry_size = _directory_size(tmp_dir)
+            # Load the total before the new entry shows up in the directory
+            self._current_size()
+            try:
+                os.rename(tmp_dir, entry_dir)
+                self._add_size(entry_size)
+            except OSError:
+                # Another process stored the same entry first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            self.monitor.increment_counter(self.counter_category, "writes")
+            self.evict()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Could not cache parsed data for {source_path or key}: {e}")
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+
+    def invalidate(self, file_path: str = None) -> None:
+        """Remove cached entries for one source file, or everything."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        if file_path is None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            with self._size_lock:
+                self._total_size = 0
+            logger.info("Cleared parsed file cache")
+            return
+
+        prefix = _path_digest(file_path) + "-"
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(prefix):
+                self._remove_entry(entry.path)
+        self.monitor.increment_counter(self.counter_category, "invalidations")
+
+    def discard(self, key: Optional[str]) -> None:
+        """Remove a single entry."""
+        if key is not None:
+            self._remove_entry(os.path.join(self.cache_dir, key))
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size limit.
+
+        The directory is only scanned once the running size total exceeds
+        the limit.
+        """
+        if not os.path.isdir(self.cache_dir) or self._current_size() <= self.size_limit:
+            return
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir() and not entry.name.startswith("."):
+                entries.append((entry.stat().st_mtime, _directory_size(entry.path), entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.size_limit:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+            self.monitor.increment_counter(self.counter_category, "evictions")
+
+        # The scan also picks up entries written by other processes
+        with self._size_lock:
+            self._total_size = total_size
+
+    def get_stats(self) -> dict:
+        """Return hit/miss counts and current on-disk size."""
+        size = 0
+        entries = 0
+        if os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_dir() and not entry.name.startswith("."):
+                    entries += 1
+                    size += _directory_size(entry.path)
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def _remove_stale(self, key: str) -> None:
+        prefix = key.split("-", 1)[0] + "-"
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.startswith(prefix) or entry.name == key:
+                continue
+            manifest_path = os.path.join(entry.path, MANIFEST_NAME)
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                if stored.get("source_mtime") != self._source_mtime(stored.get("source")):
+                    self._remove_entry(entry.path)
+            except (OSError, ValueError):
+                self._remove_entry(entry.path)
+
+    def _current_size(self) -> int:
+        with self._size_lock:
+            if self._total_size is None:
+                self._total_size = sum(
+                    _directory_size(entry.path) for entry in os.scandir(self.cache_dir)
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ) if os.path.isdir(self.cache_dir) else 0
+            return self._total_size
+
+    def _add_size(self, delta: int) -> None:
+        self._current_size()
+        with self._size_lock:
+            self._total_size = max(0, self._total_size + delta)
+
+    def _remove_entry(self, entry_dir: str) -> None:
+        try:
+            size = _directory_size(entry_dir)
+        except OSError:
+            return
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        self._add_size(-size)
+
+    @staticmethod
+    def _source_mtime(source: Optional[str]) -> Optional[int]:
+        try:
+            return os.stat(source).st_mtime_ns if source else None
+        except OSError:
+            return None
+
+    # Column encoding -------------------------------------------------------
+
+    def _save_frame(self, entry_dir: str, df: DataFrame) -> Optional[dict]:
+        columns = []
+        for idx in range(df.shape[1]):
+            spec = self._save_column(entry_dir, f"c{idx}", df.iloc[:, idx])
+            if spec is None:
+                return None
+            spec["name"] = df.columns[idx]
+            columns.append(spec)
+
+        index = None
+        if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+            index = self._save_column(entry_dir, "index", pd.Series(df.index))
+            if index is None:
+                return None
+
+        return {"columns": columns, "index": index, "rows": len(df)}
+
+    def _save_column(self, entry_dir: str, stem: str, series: pd.Series) -> Optional[dict]:
+        if isinstance(series.dtype, pd.ArrowDtype):
+            # Arrow columns are stored in numpy form; Arrow readers wrap the mapped buffers again
+            series = arrow_to_numpy_series(series)
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = self._save_column(entry_dir, f"{stem}_categories", pd.Series(dtype.categories))
+            if categories is None:
+                return None
+            np.save(os.path.join(entry_dir, f"{stem}.npy"), series.cat.codes.to_numpy())
+            return {"kind": "category", "file": f"{stem}.npy", "ordered": bool(dtype.ordered),
+                    "categories": categories}
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            np.save(os.path.join(entry_dir, f"{stem}.npy"), series.to_numpy())
+            return {"kind": "numpy", "file": f"{stem}.npy"}
+
+        # String columns: fixed-width unicode values plus a null mask
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred not in ("string", "empty"):
+            logger.debug(f"Column {series.name!r} holds {inferred} values, which the cache cannot store")
+            return None
+        mask = series.isna().to_numpy()
+        values = np.asarray(series.where(~mask, "").to_numpy(dtype=object), dtype=str)
+        np.save(os.path.join(entry_dir, f"{stem}.npy"), values)
+        np.save(os.path.join(entry_dir, f"{stem}_mask.npy"), mask)
+        return {"kind": "string", "file": f"{stem}.npy", "mask": f"{stem}_mask.npy",
+                "dtype": str(dtype)}
+
+    def _load_frame(self, entry_dir: str, manifest: dict) -> DataFrame:
+        arrays = {idx: self._load_column(entry_dir, spec) for idx, spec in enumerate(manifest["columns"])}
+        index = None
+        if manifest.get("index") is not None:
+            index = pd.Index(self._load_column(entry_dir, manifest["index"]))
+        df = DataFrame(arrays, index=index, copy=False)
+        if not arrays:
+            df = DataFrame(index=index if index is not None else pd.RangeIndex(manifest["rows"]))
+        df.columns = [spec["name"] for spec in manifest["columns"]]
+        return df
+
+    def _load_column(self, entry_dir: str, spec: dict):
+        # Copy-on-write maps: callers may modify the frame without touching the cache
+        path = os.path.join(entry_dir, spec["file"])
+        if spec["kind"] == "numpy":
+            return np.asarray(np.load(path, mmap_mode="c"))
+        if spec["kind"] == "category":
+            categories = self._load_column(entry_dir, spec["categories"])
+            codes = np.asarray(np.load(path, mmap_mode="c"))
+            return pd.Categorical.from_codes(codes, categories=categories, ordered=spec["ordered"])
+
+        values = np.load(path).astype(object)
+        mask = np.load(os.path.join(entry_dir, spec["mask"]))
+        values[mask] = np.nan
+        if spec["dtype"] != "object":
+            return pd.array(values, dtype=spec["dtype"])
+        return values
+
+
+# Create a singleton instance
+parsed_file_cache = ParsedFileCache()
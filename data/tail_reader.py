@@ -0,0 +1,89 @@
+"""
+Incremental reader for DSSAT output files that are still being written
+"""
+import os
+import sys
+import logging
+from typing import List, Optional, Tuple
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.dssat_io import find_treatment_blocks, process_blocks
+
+logger = logging.getLogger(__name__)
+
+class OutFileTailer:
+    """Follow one OUT file and parse only the treatment blocks appended since the last poll.
+
+    A block is complete once the next TREATMENT line has been written, so
+    the last block stays pending until finish() is called. If the file is
+    truncated (DSSAT starts a new run) the tailer starts over from the top
+    and reports the reset.
+    """
+
+    def __init__(self, file_path: str, columns: Optional[List[str]] = None, since: float = None):
+        self.file_path = file_path
+        self.columns = columns
+        # Ignore content written before this timestamp (output of a previous run)
+        self.since = since
+        self.offset = 0
+        self.blocks_read = 0
+
+    def reset(self) -> None:
+        """Forget all progress and start again from the top of the file."""
+        self.offset = 0
+        self.blocks_read = 0
+
+    def poll(self) -> Tuple[bool, List[tuple]]:
+        """Parse newly completed blocks.
+
+        Returns (reset, deltas) where deltas is a list of
+        (treatment, DataFrame) and reset is True when the file was
+        truncated since the previous poll.
+        """
+        return self._read(final=False)
+
+    def finish(self) -> Tuple[bool, List[tuple]]:
+        """Parse everything left in the file, including the last block."""
+        return self._read(final=True)
+
+    def _read(self, final: bool) -> Tuple[bool, List[tuple]]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False, []
+
+        if self.since is not None and stat.st_mtime < self.since:
+            return False, []
+
+        reset = False
+        if stat.st_size < self.offset:
+            logger.info(f"{self.file_path} was truncated, reading it again")
+            self.reset()
+            reset = True
+
+        if stat.st_size == self.offset:
+            return reset, []
+
+        with open(self.file_path, "rb") as file:
+            file.seek(self.offset)
+            chunk = file.read(stat.st_size - self.offset)
+
+        blocks = find_treatment_blocks(chunk)
+        if blocks[0][2] is None and len(blocks) == 1 and not final:
+            # No TREATMENT line yet, or a file without treatment blocks
+            return reset, []
+
+        complete = blocks if final else blocks[:-1]
+        deltas = []
+        for start, end, treatment in complete:
+            df = process_blocks([(chunk[start:end], treatment)], self.columns)
+            if df is not None and not df.empty:
+                deltas.append((treatment, df))
+
+        if complete:
+            self.offset += complete[-1][1]
+            self.blocks_read += len(complete)
+        return reset, deltas
@@ -13,15 +13,13 @@ import os
 import warnings
 import logging
 import gc
+import multiprocessing
 from pathlib import Path
 from PyQt6.QtCore import QSize
 from PyQt6.QtWidgets import QApplication, QMessageBox, QStyleFactory
-from utils.performance_monitor import PerformanceMonitor, function_timer
+from utils.performance_monitor import perf_monitor, function_timer
 from ui.main_window import MainWindow  # Import MainWindow at the top level
 
-# Initialize performance monitor
-perf_monitor = PerformanceMonitor()
-
 # Configure logging first - use INFO level to avoid excessive logs
 logging.basicConfig(
     level=logging.INFO,
@@ -188,6 +186,9 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    # Lets process pool workers of the frozen (PyInstaller) build start as workers
+    multiprocessing.freeze_support()
+    
     # Use return code from main function
     exit_code = main()
     
@@ -0,0 +1,99 @@
+"""
+Bootstrap confidence intervals for model performance metrics
+
+Pairs are resampled with replacement within each group. All resamples of
+all groups are drawn as one index matrix (one row per resample), so every
+row is a concatenation of resampled groups that
+MetricsCalculator.batch_metrics evaluates in a single pass. Large inputs
+are processed in blocks of rows to bound memory.
+"""
+import os
+import sys
+import logging
+import warnings
+from typing import Iterable
+
+import numpy as np
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from models.metrics import MetricsCalculator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS = ("RMSE", "d-stat")
+
+# Upper bound on resampled values held at once (per block of resamples)
+MAX_BLOCK_VALUES = 4_000_000
+
+def _drop_missing(sim: np.ndarray, obs: np.ndarray, offsets: np.ndarray):
+    """Remove NaN pairs and return the compacted arrays with their new offsets."""
+    valid = ~(np.isnan(sim) | np.isnan(obs))
+    group_ids = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    counts = np.bincount(group_ids[valid], minlength=len(offsets) - 1)
+    new_offsets = np.zeros(len(offsets), dtype=np.int64)
+    np.cumsum(counts, out=new_offsets[1:])
+    return sim[valid], obs[valid], new_offsets
+
+def bootstrap_metrics(sim_values, obs_values, offsets, metrics: Iterable[str] = DEFAULT_METRICS,
+                      n_resamples: int = None, confidence: float = None, seed=None) -> dict:
+    """Percentile bootstrap intervals of metrics for every group.
+
+    Inputs are laid out as for MetricsCalculator.batch_metrics. Returns
+    {"<metric>_low": array, "<metric>_high": array} with one entry per
+    group; groups with fewer than two valid pairs get NaN bounds.
+    n_resamples, confidence and seed default to config.BOOTSTRAP_RESAMPLES,
+    config.BOOTSTRAP_CONFIDENCE and config.BOOTSTRAP_SEED.
+    """
+    n_resamples = n_resamples or config.BOOTSTRAP_RESAMPLES
+    confidence = confidence or config.BOOTSTRAP_CONFIDENCE
+    seed = config.BOOTSTRAP_SEED if seed is None else seed
+    metrics = list(metrics)
+
+    sim = np.asarray(sim_values, dtype=float).ravel()
+    obs = np.asarray(obs_values, dtype=float).ravel()
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if len(sim) != len(obs) or len(offsets) == 0 or offsets[-1] != len(sim):
+        raise ValueError("sim_values, obs_values and offsets do not describe the same groups")
+
+    sim, obs, offsets = _drop_missing(sim, obs, offsets)
+    n_groups = len(offsets) - 1
+    lengths = np.diff(offsets)
+    total = len(sim)
+    if n_groups == 0:
+        return {f"{metric}_{bound}": np.empty(0) for metric in metrics for bound in ("low", "high")}
+
+    samples = {metric: np.full((n_resamples, n_groups), np.nan) for metric in metrics}
+    if total:
+        rng = np.random.default_rng(seed)
+        group_ids = np.repeat(np.arange(n_groups), lengths)
+        starts = offsets[:-1][group_ids]
+        sizes = lengths[group_ids]
+        block = max(1, MAX_BLOCK_VALUES // total)
+
+        for first in range(0, n_resamples, block):
+            rows = min(block, n_resamples - first)
+            # Row r holds one resample of every group, each drawn from its own slice
+            index = starts + rng.integers(0, sizes, size=(rows, total))
+            row_offsets = np.append(
+                (np.arange(rows)[:, None] * total + offsets[None, :-1]).ravel(), rows * total
+            )
+            result = MetricsCalculator.batch_metrics(sim[index].ravel(), obs[index].ravel(), row_offsets)
+            for metric in metrics:
+                samples[metric][first:first + rows] = result[metric].reshape(rows, n_groups)
+
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    with warnings.catch_warnings():
+        # Groups without valid resamples produce all-NaN columns
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for metric in metrics:
+            low, high = np.nanpercentile(samples[metric], [100 * alpha, 100 * (1 - alpha)], axis=0)
+            low[lengths < 2] = np.nan
+            high[lengths < 2] = np.nan
+            intervals[f"{metric}_low"] = low
+            intervals[f"{metric}_high"] = high
+    return intervals
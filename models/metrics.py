@@ -3,9 +3,13 @@ Model performance metrics calculation with minimal dependencies
 """
 import numpy as np
 import logging
+from typing import Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by MetricsCalculator.batch_metrics
+BATCH_METRIC_COLUMNS = ("n", "mean_obs", "RMSE", "NRMSE", "Bias", "MAE", "R2", "d-stat", "NSE")
+
 class MetricsCalculator:
     """Calculate model performance metrics using only NumPy."""
     
@@ -112,4 +116,229 @@ class MetricsCalculator:
             
         except Exception as e:
             logger.error(f"Error calculating metrics: {e}", exc_info=True)
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def concatenate_groups(groups: Iterable[Tuple[np.ndarray, np.ndarray]]):
+        """Concatenate (sim, obs) value pairs into flat arrays plus group offsets for batch_metrics."""
+        sims = []
+        obs = []
+        lengths = []
+        for sim_values, obs_values in groups:
+            sim_arr = np.asarray(sim_values, dtype=float).ravel()
+            obs_arr = np.asarray(obs_values, dtype=float).ravel()
+            if len(sim_arr) != len(obs_arr):
+                raise ValueError(f"Group has {len(sim_arr)} simulated but {len(obs_arr)} observed values")
+            sims.append(sim_arr)
+            obs.append(obs_arr)
+            lengths.append(len(sim_arr))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if not sims:
+            return np.empty(0), np.empty(0), offsets
+        return np.concatenate(sims), np.concatenate(obs), offsets
+
+    @staticmethod
+    def batch_metrics(sim_values, obs_values, offsets) -> dict:
+        """Calculate metrics for many groups in one vectorized pass.
+
+        sim_values and obs_values hold all groups back to back; group i is
+        sim_values[offsets[i]:offsets[i + 1]]. Pairs where either value is
+        NaN are ignored. Returns a dict of arrays, one entry per group, keyed
+        by BATCH_METRIC_COLUMNS. Metrics undefined for a group (no valid
+        pairs, R2 with fewer than two pairs, zero variance or zero mean) are
+        NaN.
+        """
+        sim = np.asarray(sim_values, dtype=float).ravel()
+        obs = np.asarray(obs_values, dtype=float).ravel()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if len(sim) != len(obs) or len(offsets) == 0 or offsets[-1] != len(sim):
+            raise ValueError("sim_values, obs_values and offsets do not describe the same groups")
+
+        n_groups = len(offsets) - 1
+        group_ids = np.repeat(np.arange(n_groups), np.diff(offsets))
+        valid = ~(np.isnan(sim) | np.isnan(obs))
+        group_ids = group_ids[valid]
+        sim = sim[valid]
+        obs = obs[valid]
+
+        def group_sum(values):
+            return np.bincount(group_ids, weights=values, minlength=n_groups)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n = np.bincount(group_ids, minlength=n_groups)
+            mean_obs = group_sum(obs) / n
+            mean_sim = group_sum(sim) / n
+
+            error = sim - obs
+            sse = group_sum(error ** 2)
+            rmse = np.sqrt(sse / n)
+            bias = group_sum(error) / n
+            mae = group_sum(np.abs(error)) / n
+
+            obs_dev = obs - mean_obs[group_ids]
+            sim_dev = sim - mean_sim[group_ids]
+            ss_obs = group_sum(obs_dev ** 2)
+            ss_sim = group_sum(sim_dev ** 2)
+            covariance = group_sum(obs_dev * sim_dev)
+            r2 = covariance ** 2 / (ss_obs * ss_sim)
+            r2[n < 2] = np.nan
+
+            agreement = group_sum((np.abs(sim - mean_obs[group_ids]) + np.abs(obs_dev)) ** 2)
+            d_stat = 1 - sse / agreement
+            nse = 1 - sse / ss_obs
+            nrmse = rmse / mean_obs * 100
+
+        # Zero denominators give inf/NaN; report them uniformly as NaN
+        for values in (r2, d_stat, nse, nrmse):
+            values[~np.isfinite(values)] = np.nan
+
+        return {
+            "n": n,
+            "mean_obs": mean_obs,
+            "RMSE": rmse,
+            "NRMSE": nrmse,
+            "Bias": bias,
+            "MAE": mae,
+            "R2": r2,
+            "d-stat": d_stat,
+            "NSE": nse,
+        }
+
+
+class MetricsAccumulator:
+    """Mergeable running state for the metrics of one group of (sim, obs) pairs.
+
+    Means, variances and the sim/obs co-moment are kept Welford-style and
+    combined with Chan's pairwise update, so partial accumulators from
+    chunks or workers merge exactly. Error sums are plain running sums.
+    Willmott's d compares every pair with the final observed mean and has
+    no fixed-size state, so the valid pairs themselves are kept for it
+    (set track_d_stat=False to skip it).
+    """
+
+    def __init__(self, track_d_stat: bool = True):
+        self.n = 0
+        self.mean_sim = 0.0
+        self.mean_obs = 0.0
+        self.m2_sim = 0.0
+        self.m2_obs = 0.0
+        self.co_moment = 0.0
+        self.sum_error = 0.0
+        self.sum_abs_error = 0.0
+        self.sse = 0.0
+        self.track_d_stat = track_d_stat
+        self._pairs = []
+
+    def update(self, sim_values, obs_values) -> "MetricsAccumulator":
+        """Add a chunk of pairs; pairs with a NaN value are ignored."""
+        sim = np.asarray(sim_values, dtype=float).ravel()
+        obs = np.asarray(obs_values, dtype=float).ravel()
+        if len(sim) != len(obs):
+            raise ValueError(f"Chunk has {len(sim)} simulated but {len(obs)} observed values")
+        valid = ~(np.isnan(sim) | np.isnan(obs))
+        sim = sim[valid]
+        obs = obs[valid]
+        if len(sim) == 0:
+            return self
+
+        chunk = MetricsAccumulator(self.track_d_stat)
+        chunk.n = len(sim)
+        chunk.mean_sim = float(sim.mean())
+        chunk.mean_obs = float(obs.mean())
+        sim_dev = sim - chunk.mean_sim
+        obs_dev = obs - chunk.mean_obs
+        chunk.m2_sim = float(np.dot(sim_dev, sim_dev))
+        chunk.m2_obs = float(np.dot(obs_dev, obs_dev))
+        chunk.co_moment = float(np.dot(sim_dev, obs_dev))
+        error = sim - obs
+        chunk.sum_error = float(error.sum())
+        chunk.sum_abs_error = float(np.abs(error).sum())
+        chunk.sse = float(np.dot(error, error))
+        if self.track_d_stat:
+            chunk._pairs = [(sim, obs)]
+        return self.merge(chunk)
+
+    def merge(self, other: "MetricsAccumulator") -> "MetricsAccumulator":
+        """Fold another accumulator's pairs into this one."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update({key: value for key, value in other.__dict__.items() if key != "track_d_stat"})
+            self._pairs = list(other._pairs)
+            return self
+
+        n = self.n + other.n
+        weight = self.n * other.n / n
+        delta_sim = other.mean_sim - self.mean_sim
+        delta_obs = other.mean_obs - self.mean_obs
+        self.m2_sim += other.m2_sim + delta_sim ** 2 * weight
+        self.m2_obs += other.m2_obs + delta_obs ** 2 * weight
+        self.co_moment += other.co_moment + delta_sim * delta_obs * weight
+        self.mean_sim += delta_sim * other.n / n
+        self.mean_obs += delta_obs * other.n / n
+        self.sum_error += other.sum_error
+        self.sum_abs_error += other.sum_abs_error
+        self.sse += other.sse
+        self.n = n
+        if self.track_d_stat:
+            self._pairs.extend(other._pairs)
+        return self
+
+    def _d_stat(self) -> float:
+        if not self.track_d_stat or not self._pairs:
+            return np.nan
+        if len(self._pairs) > 1:
+            self._pairs = [tuple(np.concatenate(values) for values in zip(*self._pairs))]
+        sim, obs = self._pairs[0]
+        agreement = np.sum((np.abs(sim - self.mean_obs) + np.abs(obs - self.mean_obs)) ** 2)
+        return 1 - self.sse / agreement if agreement != 0 else np.nan
+
+    def result(self) -> dict:
+        """Return the metrics keyed like MetricsCalculator.batch_metrics (NaN where undefined)."""
+        if self.n == 0:
+            return {column: (0 if column == "n" else np.nan) for column in BATCH_METRIC_COLUMNS}
+
+        rmse = float(np.sqrt(self.sse / self.n))
+        variance_product = self.m2_sim * self.m2_obs
+        return {
+            "n": self.n,
+            "mean_obs": self.mean_obs,
+            "RMSE": rmse,
+            "NRMSE": rmse / self.mean_obs * 100 if self.mean_obs != 0 else np.nan,
+            "Bias": self.sum_error / self.n,
+            "MAE": self.sum_abs_error / self.n,
+            "R2": self.co_moment ** 2 / variance_product if self.n >= 2 and variance_product > 0 else np.nan,
+            "d-stat": self._d_stat(),
+            "NSE": 1 - self.sse / self.m2_obs if self.m2_obs > 0 else np.nan,
+        }
+
+
+class GroupedMetricsAccumulator:
+    """MetricsAccumulators keyed by group, e.g. (variable, treatment)."""
+
+    def __init__(self, track_d_stat: bool = True):
+        self.track_d_stat = track_d_stat
+        self.groups = {}
+
+    def update(self, key, sim_values, obs_values) -> None:
+        """Add a chunk of pairs to one group."""
+        if key not in self.groups:
+            self.groups[key] = MetricsAccumulator(self.track_d_stat)
+        self.groups[key].update(sim_values, obs_values)
+
+    def merge(self, other: "GroupedMetricsAccumulator") -> "GroupedMetricsAccumulator":
+        """Fold another worker's partial results into this one."""
+        for key, accumulator in other.groups.items():
+            if key not in self.groups:
+                self.groups[key] = MetricsAccumulator(self.track_d_stat)
+            self.groups[key].merge(accumulator)
+        return self
+
+    def discard(self, predicate) -> None:
+        """Drop the groups whose key matches predicate(key)."""
+        self.groups = {key: acc for key, acc in self.groups.items() if not predicate(key)}
+
+    def results(self) -> dict:
+        """Return {key: metrics dict} for every group."""
+        return {key: accumulator.result() for key, accumulator in self.groups.items()}
@@ -0,0 +1,124 @@
+"""
+Content-addressed cache of model performance metrics
+
+Results are keyed by a BLAKE2 digest of the aligned value arrays (their
+bytes, dtype and group offsets) plus the operation and its parameters,
+so equal inputs hit the cache no matter which widget computed them and
+different inputs never share an entry. Entries are kept in an LRU bounded
+by config.METRICS_CACHE_SIZE.
+"""
+import os
+import sys
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from models.metrics import MetricsCalculator
+from models.bootstrap import bootstrap_metrics
+from utils.performance_monitor import perf_monitor
+
+logger = logging.getLogger(__name__)
+
+def _as_values(values) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(values, dtype=float).ravel())
+
+def content_key(operation: str, *arrays, **params) -> str:
+    """Digest of the arrays' contents and shapes plus the operation name and parameters."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps([operation, params], sort_keys=True, default=str).encode("utf-8"))
+    for values in arrays:
+        values = np.ascontiguousarray(values)
+        digest.update(f"|{values.dtype.str}{values.shape}|".encode("ascii"))
+        digest.update(values.view(np.uint8).ravel())
+    return digest.hexdigest()
+
+def _read_only(result: dict) -> dict:
+    # Cached arrays are shared between callers, so they must not be modified in place
+    for values in result.values():
+        if isinstance(values, np.ndarray):
+            values.setflags(write=False)
+    return result
+
+class MetricsCache:
+    """LRU cache of metric results keyed by content digest."""
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or config.METRICS_CACHE_SIZE
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], dict]) -> dict:
+        """Return the cached result for key, computing and storing it on a miss."""
+        with self._lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                perf_monitor.increment_counter("metrics_cache", "hits")
+                return result
+
+        result = _read_only(compute())
+        with self._lock:
+            self.misses += 1
+            perf_monitor.increment_counter("metrics_cache", "misses")
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return result
+
+    def batch_metrics(self, sim_values, obs_values, offsets: Optional[np.ndarray] = None) -> dict:
+        """Cached MetricsCalculator.batch_metrics; without offsets the values form one group."""
+        sim = _as_values(sim_values)
+        obs = _as_values(obs_values)
+        offsets = np.asarray([0, len(sim)] if offsets is None else offsets, dtype=np.int64)
+        key = content_key("batch_metrics", sim, obs, offsets)
+        return self.get_or_compute(key, lambda: MetricsCalculator.batch_metrics(sim, obs, offsets))
+
+    def bootstrap_metrics(self, sim_values, obs_values, offsets: Optional[np.ndarray] = None,
+                          metrics=None, n_resamples: int = None, confidence: float = None, seed=None) -> dict:
+        """Cached models.bootstrap.bootstrap_metrics with the config defaults resolved into the key."""
+        sim = _as_values(sim_values)
+        obs = _as_values(obs_values)
+        offsets = np.asarray([0, len(sim)] if offsets is None else offsets, dtype=np.int64)
+        params = {
+            "metrics": list(metrics) if metrics else None,
+            "n_resamples": n_resamples or config.BOOTSTRAP_RESAMPLES,
+            "confidence": confidence or config.BOOTSTRAP_CONFIDENCE,
+            "seed": config.BOOTSTRAP_SEED if seed is None else seed,
+        }
+        key = content_key("bootstrap_metrics", sim, obs, offsets, **params)
+        kwargs = {name: value for name, value in params.items() if value is not None}
+        return self.get_or_compute(key, lambda: bootstrap_metrics(sim, obs, offsets, **kwargs))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+
+    def get_stats(self) -> dict:
+        """Return hit/miss counts and the number of cached results."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+            }
+
+
+# Create a singleton instance
+metrics_cache = MetricsCache()
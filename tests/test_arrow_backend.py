@@ -0,0 +1,116 @@
+"""
+Arrow-backed DataFrames from the DSSAT readers
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import data.dssat_io as dssat_io
+from data.alignment import align_sim_obs
+from data.arrow_backend import to_arrow_frame
+from data.data_processing import dates_to_epoch_seconds
+from data.file_cache import ParsedFileCache
+
+
+class RecordingCache(ParsedFileCache):
+    """Keeps the memory-mapped frames returned on cache hits."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.returned = []
+
+    def get(self, key):
+        df = super().get(key)
+        if df is not None:
+            self.returned.append(df)
+        return df
+
+
+def is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = RecordingCache(cache_dir=str(tmp_path / "cache"), enabled=True)
+    monkeypatch.setattr(dssat_io, "parsed_file_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def out_path(tmp_path):
+    path = tmp_path / "PlantGro.OUT"
+    blocks = "".join(
+        f"*RUN {trt:>3}        : TEST\n TREATMENT{trt:>3}   : TEST\n\n@YEAR DOY  LAID  CWAD\n"
+        f" 1982  60  {trt}.25  {trt}00\n 1982  61   -99  {trt}50\n\n"
+        for trt in (1, 2)
+    )
+    path.write_text("*DSSAT Cropping System Model Ver. 4.8.0.000\n\n" + blocks)
+    return str(path)
+
+
+def test_arrow_columns_match_numpy_columns(cache, out_path):
+    arrow = dssat_io.read_file(out_path, use_arrow=True)
+    plain = dssat_io.read_file(out_path, use_arrow=False)
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow.dtypes)
+    assert list(arrow.columns) == list(plain.columns)
+    for col in ("YEAR", "DOY", "LAID", "CWAD"):
+        np.testing.assert_array_equal(arrow[col].to_numpy(dtype=np.float64, na_value=np.nan),
+                                      plain[col].to_numpy(dtype=np.float64))
+    assert list(arrow["TRT"].astype(str)) == list(plain["TRT"].astype(str))
+    np.testing.assert_array_equal(arrow["DATE"].to_numpy(dtype="datetime64[ns]"), plain["DATE"].to_numpy())
+
+
+def test_cache_hit_reuses_mapped_buffer(cache, out_path):
+    dssat_io.read_file(out_path, use_arrow=False)
+    arrow = dssat_io.read_file(out_path, use_arrow=True)
+
+    mapped = cache.returned[-1]["LAID"].to_numpy()
+    assert is_memory_mapped(mapped)
+    chunk = arrow["LAID"].array._pa_array.chunk(0)
+    wrapped = np.frombuffer(chunk.buffers()[1], dtype=mapped.dtype)
+    assert np.shares_memory(wrapped, mapped)
+
+
+def test_mixed_object_columns_stay_unchanged():
+    df = pd.DataFrame({"MIXED": pd.Series(["a", 1, 2.5], dtype=object), "LAID": [0.5, np.nan, 1.5]})
+    arrow = to_arrow_frame(df)
+
+    assert arrow["MIXED"].dtype == object
+    assert arrow["MIXED"].tolist() == ["a", 1, 2.5]
+    assert isinstance(arrow["LAID"].dtype, pd.ArrowDtype)
+
+
+def test_use_arrow_off_returns_numpy_columns(cache, out_path):
+    dssat_io.read_file(out_path, use_arrow=True)
+    plain = dssat_io.read_file(out_path, use_arrow=False)
+
+    assert not any(isinstance(dtype, pd.ArrowDtype) for dtype in plain.dtypes)
+    assert plain["LAID"].dtype == np.float32
+
+
+def test_alignment_and_dates_accept_arrow_columns(cache, out_path):
+    plain = dssat_io.read_file(out_path, use_arrow=False)
+    arrow = dssat_io.read_file(out_path, use_arrow=True)
+
+    expected = align_sim_obs(plain, plain, ["LAID", "CWAD"], ["1", "2"])
+    aligned = align_sim_obs(arrow, arrow, ["LAID", "CWAD"], ["1", "2"])
+    assert aligned.keys() == expected.keys()
+    for key, pair in expected.items():
+        np.testing.assert_array_equal(aligned[key]["sim"], pair["sim"])
+        np.testing.assert_array_equal(aligned[key]["dates"], pair["dates"])
+    np.testing.assert_array_equal(dates_to_epoch_seconds(arrow["DATE"]), dates_to_epoch_seconds(plain["DATE"]))
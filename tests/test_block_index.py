@@ -0,0 +1,89 @@
+"""
+Treatment block index of OUT files, built cold and read back from the parsed cache
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data import dssat_io
+from data.file_cache import ParsedFileCache
+
+WEATHER = """*WEATHER MODULE DAILY OUTPUT FILE
+
+@YEAR DOY   DAS  SRAD  TMXD
+ 1982  60     0  18.2  28.1
+ 1982  61     1  20.5  29.4
+"""
+
+PLANT_GROWTH = """*DSSAT Cropping System Model Ver. 4.8.0.000
+
+*RUN   1        : TEST
+ TREATMENT  1   : FIRST
+
+@YEAR DOY   DAS  LAID
+ 1982  60     0  0.00
+ 1982  61     1  0.12
+
+*RUN   2        : TEST
+ TREATMENT  2   : SECOND
+
+@YEAR DOY   DAS  LAID
+ 1982  60     0  0.00
+ 1982  61     1  0.22
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    cache = ParsedFileCache(cache_dir=str(tmp_path / "cache"), enabled=True)
+    monkeypatch.setattr(dssat_io, "parsed_file_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def weather_file(tmp_path):
+    path = tmp_path / "Weather.OUT"
+    path.write_text(WEATHER)
+    return str(path)
+
+
+def test_file_without_treatments_cold_and_cached(weather_file, isolated_cache):
+    cold = dssat_io.read_treatment_blocks(weather_file, ["1"])
+    misses = isolated_cache.misses
+    cached = dssat_io.read_treatment_blocks(weather_file, ["1"])
+
+    # The second read takes the block index from the cache
+    assert isolated_cache.hits >= 1 and isolated_cache.misses == misses
+    assert "TRT" not in cold.columns
+    pd.testing.assert_frame_equal(cached, cold)
+
+    index = dssat_io.get_block_index(weather_file)
+    assert [treatment for _, treatment in dssat_io._read_indexed_blocks(weather_file, index)] == [None]
+
+
+def test_treatment_blocks_cold_and_cached(tmp_path):
+    path = tmp_path / "PlantGro.OUT"
+    path.write_text(PLANT_GROWTH)
+
+    cold = dssat_io.read_treatment_blocks(str(path), ["2"])
+    cached = dssat_io.read_treatment_blocks(str(path), ["2"])
+    pd.testing.assert_frame_equal(cached, cold)
+    assert list(cold["TRT"]) == ["2", "2"]
+
+
+def test_iter_treatment_blocks_cold_and_cached(weather_file, tmp_path):
+    for _ in range(2):
+        blocks = list(dssat_io.iter_treatment_blocks(weather_file))
+        assert [treatment for treatment, _ in blocks] == [None]
+        assert len(blocks[0][1]) == 2
+
+    path = tmp_path / "PlantGro.OUT"
+    path.write_text(PLANT_GROWTH)
+    for _ in range(2):
+        assert [treatment for treatment, _ in dssat_io.iter_treatment_blocks(str(path))] == ["1", "2"]
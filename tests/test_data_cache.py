@@ -0,0 +1,72 @@
+"""
+DataCacheManager pinning and caller-frame handling
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from data.data_processing import DataCacheManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DataCacheManager(size_limit=64 * 1024 * 1024, spill=False, spill_dir=str(tmp_path / "spill"),
+                            hot_entries=1)
+
+
+def frame(rows=200):
+    return pd.DataFrame({"TRT": ["1", "2"] * (rows // 2), "LAID": np.linspace(0.0, 4.0, rows)})
+
+
+def test_cache_data_leaves_caller_frame_unchanged(manager):
+    data = frame()
+    manager.cache_data("sim", data)
+    assert not isinstance(data["TRT"].dtype, pd.CategoricalDtype)
+    assert isinstance(manager.get_cached_data("sim")["TRT"].dtype, pd.CategoricalDtype)
+
+
+def test_pin_frames_unpins_previous_selection(manager):
+    shown = manager.pin_frames({"sim-a": frame(), "obs-a": pd.DataFrame()})
+    assert sorted(shown) == ["obs-a", "sim-a"]
+    assert set(manager.pinned) == {"obs-a", "sim-a"}
+
+    shown = manager.pin_frames({"sim-b": frame(), "obs-b": None}, shown)
+    assert shown == ["sim-b"]
+    assert set(manager.pinned) == {"sim-b"}
+    # Unpinned frames stay cached until they are evicted
+    assert manager.get_cached_data("sim-a") is not None
+    assert manager.get_cached_data("obs-a").empty
+
+
+def test_make_key_changes_when_file_is_rewritten(tmp_path):
+    path = tmp_path / "PlantGro.OUT"
+    path.write_text("data\n")
+    key = DataCacheManager.make_key("time_series_sim", [str(path)], x_var="DATE")
+    assert key == DataCacheManager.make_key("time_series_sim", [str(path)], x_var="DATE")
+    assert key != DataCacheManager.make_key("time_series_sim", [str(path)], x_var="DAS")
+    path.write_text("more data\n")
+    assert key != DataCacheManager.make_key("time_series_sim", [str(path)], x_var="DATE")
+
+
+def test_frames_unpinned_by_selection_changes_are_compressed(manager, monkeypatch, caplog):
+    monkeypatch.setattr("config.ENABLE_DATA_COMPRESSION", True)
+    monkeypatch.setattr("config.DATA_COMPRESSION_MIN_BYTES", 0)
+    shown = []
+    with caplog.at_level("INFO", logger="data.data_processing"):
+        for selection in range(3):
+            shown = manager.pin_frames({f"sim-{selection}": frame(20000)}, shown)
+
+    stats = manager.get_stats()
+    assert stats["pinned"] == 1
+    # hot_entries=1 keeps the last inactive frame uncompressed
+    assert stats["compressed_entries"] == 1
+    assert stats["compression_saved_bytes"] > 0
+    assert "1 compressed" in caplog.records[-1].getMessage()
+    pd.testing.assert_frame_equal(manager.get_cached_data("sim-0"), manager.get_cached_data("sim-2"))
@@ -0,0 +1,149 @@
+"""
+Parallel DSSAT shards and the merging of their OUT files
+"""
+import os
+import stat
+import sys
+
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import data.dssat_runner as dssat_runner
+from data.dssat_runner import ParallelDSSATRunner, shard_runs, merge_out_contents, merge_out_files
+
+
+# Stand-in for the DSSAT executable: runs the treatments of BatchFile.v48 and
+# writes them like run_blocks() and summary() below
+FAKE_DSSAT = '''#!{python}
+import os, sys
+with open(sys.argv[2]) as f:
+    lines = f.read().splitlines()
+start = next(i for i, line in enumerate(lines) if line.startswith("@FILEX"))
+treatments = [int(line[90:99]) for line in lines[start + 1:] if line.strip()]
+with open("PlantGro.OUT", "w") as plant, open("Summary.OUT", "w") as summary:
+    plant.write("*DSSAT Cropping System Model Ver. 4.8.0.000\\n\\n")
+    summary.write("*SUMMARY : TEST\\n\\n@   RUNNO   TRNO  HWAM\\n")
+    for run, trt in enumerate(treatments, 1):
+        plant.write(f"*RUN {{run:>3}}        : TEST\\n TREATMENT{{trt:>3}}   : TEST\\n\\n@YEAR DOY  LAID\\n 1982  60  {{trt}}.00\\n\\n")
+        summary.write(f"{{run:>9}}{{trt:>7}}{{trt * 1000:>6}}\\n")
+print(os.getcwd())
+'''
+
+
+def run_blocks(first_run, treatments):
+    text = "*DSSAT Cropping System Model Ver. 4.8.0.000\n\n"
+    for run, trt in enumerate(treatments, first_run):
+        text += f"*RUN {run:>3}        : TEST\n TREATMENT{trt:>3}   : TEST\n\n@YEAR DOY  LAID\n 1982  60  {trt}.00\n\n"
+    return text.encode("ascii")
+
+
+def summary(treatments):
+    text = "*SUMMARY : TEST\n\n@   RUNNO   TRNO  HWAM\n"
+    for run, trt in enumerate(treatments, 1):
+        text += f"{run:>9}{trt:>7}{trt * 1000:>6}\n"
+    return text.encode("ascii")
+
+
+def run_lines(content):
+    return [line for line in content.decode("ascii").splitlines() if line.startswith("*RUN")]
+
+
+def test_shard_runs_are_contiguous_and_balanced():
+    runs = list(range(10))
+    shards = shard_runs(runs, 4)
+    assert [len(shard) for shard in shards] == [3, 3, 2, 2]
+    assert sum(shards, []) == runs
+    assert shard_runs(runs[:2], 4) == [[0], [1]]
+
+
+def test_run_blocks_are_renumbered_across_shards():
+    # Every shard numbers its runs from 1
+    merged = merge_out_contents([run_blocks(1, range(1, 10)), run_blocks(1, [10, 11])])
+    lines = run_lines(merged)
+
+    assert [int(line.split()[1]) for line in lines] == list(range(1, 12))
+    # The field keeps its width when the number gains a digit
+    assert {line.index(":") for line in lines} == {len("*RUN   1        ")}
+    assert merged.count(b"*DSSAT Cropping System Model") == 1
+    assert b"TREATMENT 11" in merged
+
+
+def test_summary_rows_are_renumbered():
+    merged = merge_out_contents([summary([1, 2]), summary([3]), summary([4, 5])]).decode("ascii")
+    rows = merged.splitlines()[3:]
+
+    assert merged.count("@   RUNNO") == 1
+    assert [row.split()[:2] for row in rows] == [[str(n), str(n)] for n in range(1, 6)]
+    assert all(len(row) == len(rows[0]) for row in rows)
+
+
+def test_merge_out_files_keeps_target_mode(tmp_path):
+    shards = [tmp_path / "shard0", tmp_path / "shard1"]
+    for idx, shard in enumerate(shards):
+        shard.mkdir()
+        (shard / "PlantGro.OUT").write_bytes(run_blocks(1, [idx + 1]))
+    target = tmp_path / "crop"
+    target.mkdir()
+    (target / "PlantGro.OUT").write_bytes(b"old")
+    os.chmod(target / "PlantGro.OUT", 0o664)
+
+    assert merge_out_files([str(shard) for shard in shards], str(target)) == ["PlantGro.OUT"]
+    assert stat.S_IMODE(os.stat(target / "PlantGro.OUT").st_mode) == 0o664
+    assert len(run_lines((target / "PlantGro.OUT").read_bytes())) == 2
+
+
+def test_run_entries_publishes_finished_shards_as_appends(tmp_path, monkeypatch):
+    target = tmp_path / "crop"
+    target.mkdir()
+    exe = tmp_path / "dscsm048"
+    exe.write_text("")
+    monkeypatch.setattr(dssat_runner, "batch_runs", lambda folder, entries: [("X", trt) for _, trt in entries])
+
+    def run_shard(self, shard_dir, crop_code, folder_path, exe_path, experiment, runs):
+        with open(os.path.join(shard_dir, "PlantGro.OUT"), "wb") as f:
+            f.write(run_blocks(1, [trt for _, trt in runs]))
+        return ""
+
+    snapshots = []
+
+    def recording_merge(shard_dirs, target_dir):
+        names = merge_out_files(shard_dirs, target_dir)
+        snapshots.append((target / "PlantGro.OUT").read_bytes())
+        return names
+
+    monkeypatch.setattr(ParallelDSSATRunner, "_run_shard", run_shard)
+    monkeypatch.setattr(dssat_runner, "merge_out_files", recording_merge)
+    runner = ParallelDSSATRunner(dssat_base=str(tmp_path), workers=3, scratch_dir=str(tmp_path / "scratch"))
+    runner.run_entries(str(target), "MZ", str(exe), [("X", trt) for trt in range(1, 7)])
+
+    # One merge per shard, each extending the file written by the previous one
+    assert len(snapshots) == 3
+    assert all(later.startswith(earlier) for earlier, later in zip(snapshots, snapshots[1:]))
+    assert [len(run_lines(snapshot)) for snapshot in snapshots] == [2, 4, 6]
+    assert snapshots[-1] == merge_out_contents([run_blocks(1, [1, 2]), run_blocks(1, [3, 4]), run_blocks(1, [5, 6])])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the stand-in executable runs through its shebang line")
+def test_run_entries_with_stand_in_executable(tmp_path):
+    target = tmp_path / "Maize"
+    target.mkdir()
+    (target / "UFGA8201.MZX").write_text("*EXP.DETAILS: UFGA8201MZ TEST\n")
+    exe = tmp_path / "DSCSM048"
+    exe.write_text(FAKE_DSSAT.format(python=sys.executable))
+    os.chmod(exe, os.stat(exe).st_mode | stat.S_IEXEC)
+    scratch = tmp_path / "scratch"
+
+    runner = ParallelDSSATRunner(dssat_base=str(tmp_path), workers=3, scratch_dir=str(scratch))
+    output = runner.run_entries(str(target), "MZ", str(exe), [("UFGA8201.MZX", trt) for trt in range(1, 8)])
+
+    # Every shard ran in its own scratch directory, which is removed afterwards
+    shard_dirs = output.splitlines()
+    assert len(set(shard_dirs)) == 3
+    assert all(os.path.dirname(shard_dir) == os.path.realpath(scratch) for shard_dir in shard_dirs)
+    assert os.listdir(scratch) == []
+    # The merged files read as if one run had produced all treatments
+    assert (target / "PlantGro.OUT").read_bytes() == run_blocks(1, range(1, 8))
+    assert (target / "Summary.OUT").read_bytes() == summary(range(1, 8))
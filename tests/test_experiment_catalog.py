@@ -0,0 +1,57 @@
+"""
+ExperimentCatalog file classification
+"""
+import os
+import sys
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import data.experiment_catalog as experiment_catalog
+from data.experiment_catalog import ExperimentCatalog
+
+
+def test_suffixes_match_case_insensitively(tmp_path):
+    crop_dir = tmp_path / "Maize"
+    crop_dir.mkdir()
+    (crop_dir / "UFGA8201.mzx").write_text("*EXP.DETAILS: UFGA8201MZ GAINESVILLE IRRIGATED\n")
+    (crop_dir / "UFGA8201.Mzt").write_text("")
+    (crop_dir / "plantgro.out").write_text("")
+    (crop_dir / "Summary.OUT").write_text("")
+    (crop_dir / "notes.txt").write_text("")
+    catalog = ExperimentCatalog(index_path=str(tmp_path / "catalog.json"))
+
+    assert catalog.out_files(str(crop_dir), "MZ") == ["Summary.OUT", "plantgro.out"]
+    assert catalog.experiments(str(crop_dir), "MZ") == [("GAINESVILLE IRRIGATED", "UFGA8201.mzx")]
+    assert catalog.observed_file(str(crop_dir), "MZ", "UFGA8201") == str(crop_dir / "UFGA8201.Mzt")
+    assert catalog.observed_file(str(crop_dir), "MZ", "UFGA8202") is None
+
+
+def test_queries_rescan_only_changed_directories(tmp_path, monkeypatch):
+    crop_dir = tmp_path / "Maize"
+    crop_dir.mkdir()
+    (crop_dir / "UFGA8201.MZX").write_text("*EXP.DETAILS: UFGA8201MZ GAINESVILLE\n")
+    os.utime(crop_dir, (1_000_000_000, 1_000_000_000))
+    catalog = ExperimentCatalog(index_path=str(tmp_path / "catalog.json"))
+    scans = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        scans.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(experiment_catalog.os, "scandir", counting_scandir)
+    folder = str(crop_dir)
+
+    assert catalog.experiments(folder, "MZ") == [("GAINESVILLE", "UFGA8201.MZX")]
+    catalog.treatments(folder, "MZ", "UFGA8201.MZX")
+    catalog.out_files(folder, "MZ")
+    catalog.observed_file(folder, "MZ", "UFGA8201")
+    assert scans == [folder]
+
+    # A new file changes the directory mtime, so the next query rescans
+    (crop_dir / "PlantGro.OUT").write_text("")
+    os.utime(crop_dir, (1_000_000_100, 1_000_000_100))
+    assert catalog.out_files(folder, "MZ") == ["PlantGro.OUT"]
+    assert scans == [folder, folder]
@@ -0,0 +1,155 @@
+"""
+ParsedFileCache round-trip, invalidation and eviction
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import data.dssat_io as dssat_io
+from data.file_cache import ParsedFileCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParsedFileCache(cache_dir=str(tmp_path / "cache"), enabled=True)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "PlantGro.OUT"
+    path.write_text("data\n")
+    return str(path)
+
+
+def sample_frame():
+    return pd.DataFrame({
+        "YEAR": np.array([1982, 1982, 1983], dtype=np.int16),
+        "LAID": np.array([0.1, np.nan, 2.5], dtype=np.float32),
+        "TRT": pd.Categorical(["1", "1", "2"]),
+        "NAME": pd.array(["a", None, "c"], dtype="str"),
+        "DATE": pd.to_datetime(["1982-03-01", "1982-03-02", "1983-03-01"]),
+    })
+
+
+def test_round_trip(cache, source):
+    df = sample_frame()
+    key = cache.make_key("out", source, version=1)
+    assert cache.get(key) is None
+    assert cache.put(key, df, source)
+
+    cached = cache.get(key)
+    pd.testing.assert_frame_equal(cached, df)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Cached columns are copy-on-write maps
+    cached.loc[0, "LAID"] = 99.0
+    pd.testing.assert_frame_equal(cache.get(key), df)
+
+
+def test_key_changes_with_source_and_params(cache, source):
+    key = cache.make_key("out", source, version=1)
+    assert key != cache.make_key("out", source, version=2)
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert key != cache.make_key("out", source, version=1)
+    assert cache.make_key("out", source + ".missing") is None
+
+
+def test_invalidate(cache, source, tmp_path):
+    other = tmp_path / "Summary.OUT"
+    other.write_text("data\n")
+    key = cache.make_key("out", source)
+    other_key = cache.make_key("out", str(other))
+    cache.put(key, sample_frame(), source)
+    cache.put(other_key, sample_frame(), str(other))
+
+    cache.invalidate(source)
+    assert cache.get(key) is None
+    assert cache.get(other_key) is not None
+
+    cache.invalidate()
+    assert cache.get(other_key) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_rewritten_source_replaces_stale_entry(cache, source):
+    old_key = cache.make_key("out", source)
+    cache.put(old_key, sample_frame(), source)
+
+    with open(source, "a") as f:
+        f.write("more\n")
+    os.utime(source, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    new_key = cache.make_key("out", source)
+    cache.put(new_key, sample_frame(), source)
+
+    assert cache.get(old_key) is None
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_eviction_keeps_size_limit(cache, source):
+    df = pd.DataFrame({"LAID": np.arange(2000, dtype=np.float64)})
+    for idx in range(6):
+        cache.put(cache.make_key("out", source, run=idx), df, source)
+    entry_size = cache.get_stats()["size_bytes"] // 6
+
+    cache.size_limit = entry_size * 3
+    cache.put(cache.make_key("out", source, run=6), df, source)
+    stats = cache.get_stats()
+    assert stats["size_bytes"] <= cache.size_limit
+    assert stats["entries"] == 3
+    assert cache.get(cache.make_key("out", source, run=6)) is not None
+
+
+def test_disabled_cache_stores_nothing(tmp_path, source):
+    cache = ParsedFileCache(cache_dir=str(tmp_path / "off"), enabled=False)
+    key = cache.make_key("out", source)
+    assert not cache.put(key, sample_frame(), source)
+    assert cache.get(key) is None
+    assert not os.path.exists(tmp_path / "off")
+
+
+def test_mixed_object_column_is_skipped_with_a_log(cache, source, caplog):
+    df = pd.DataFrame({"MIXED": pd.Series(["a", 1, 2.5], dtype=object)})
+    key = cache.make_key("out", source)
+    with caplog.at_level("DEBUG", logger="data.file_cache"):
+        assert not cache.put(key, df, source)
+    assert "MIXED" in caplog.text
+    assert "Not caching" in caplog.text
+    assert cache.get(key) is None
+
+
+def test_projections_share_one_full_parse(cache, tmp_path, monkeypatch):
+    path = tmp_path / "PlantGro.OUT"
+    blocks = "".join(
+        f"*RUN {trt:>3}        : TEST\n TREATMENT{trt:>3}   : TEST\n\n@YEAR DOY  LAID  CWAD\n"
+        f" 1982  60  {trt}.00  {trt}00\n 1982  61  {trt}.50  {trt}50\n\n"
+        for trt in (1, 2)
+    )
+    path.write_text("*DSSAT Cropping System Model Ver. 4.8.0.000\n\n" + blocks)
+    parses = []
+
+    def counting_parse(file_path):
+        parses.append(file_path)
+        return parse(file_path)
+
+    parse = dssat_io.parse_output_file
+    monkeypatch.setattr(dssat_io, "parsed_file_cache", cache)
+    monkeypatch.setattr(dssat_io, "parse_output_file", counting_parse)
+
+    laid = dssat_io.read_file(str(path), columns=["LAID"], treatments=["1"])
+    cwad = dssat_io.read_file(str(path), columns=["CWAD"], treatments=["2"])
+
+    assert len(parses) == 1
+    assert cache.get_stats()["entries"] == 1
+    assert "CWAD" not in laid.columns and "LAID" not in cwad.columns
+    assert list(laid["TRT"].astype(str)) == ["1", "1"]
+    assert list(cwad["CWAD"]) == [200, 250]
@@ -0,0 +1,94 @@
+"""
+Batched and streaming metrics against the per-group MetricsCalculator functions
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+from models.metrics import (
+    BATCH_METRIC_COLUMNS, MetricsCalculator, MetricsAccumulator, GroupedMetricsAccumulator
+)
+
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(0)
+    result = []
+    for size in (2, 5, 12, 30):
+        obs = rng.random(size) * 100
+        sim = obs * rng.normal(1.0, 0.2, size)
+        result.append((sim, obs))
+    return result
+
+
+def test_batch_metrics_match_per_group_functions(groups):
+    sim, obs, offsets = MetricsCalculator.concatenate_groups(groups)
+    result = MetricsCalculator.batch_metrics(sim, obs, offsets)
+
+    assert set(result) == set(BATCH_METRIC_COLUMNS)
+    for idx, (group_sim, group_obs) in enumerate(groups):
+        assert result["n"][idx] == len(group_sim)
+        assert result["RMSE"][idx] == pytest.approx(MetricsCalculator.rmse(group_obs, group_sim))
+        assert result["d-stat"][idx] == pytest.approx(MetricsCalculator.d_stat(group_obs, group_sim))
+        assert result["R2"][idx] == pytest.approx(MetricsCalculator.r_squared(group_sim, group_obs))
+        assert result["Bias"][idx] == pytest.approx(np.mean(group_sim - group_obs))
+
+
+def test_batch_metrics_skip_missing_pairs():
+    sim = np.array([1.0, np.nan, 3.0, 4.0, 5.0])
+    obs = np.array([1.5, 2.0, np.nan, 4.5, 4.0])
+    result = MetricsCalculator.batch_metrics(sim, obs, np.array([0, 3, 5]))
+
+    assert list(result["n"]) == [1, 2]
+    assert result["RMSE"][1] == pytest.approx(MetricsCalculator.rmse(obs[3:], sim[3:]))
+    # One pair has no variance, so R2 is undefined
+    assert np.isnan(result["R2"][0])
+
+
+def test_empty_group_is_nan():
+    result = MetricsCalculator.batch_metrics(np.array([1.0, 2.0]), np.array([1.0, 3.0]), np.array([0, 0, 2]))
+    assert result["n"][0] == 0
+    assert np.isnan(result["RMSE"][0])
+    assert result["n"][1] == 2
+
+
+def test_accumulator_chunks_match_batch(groups):
+    sim, obs, offsets = MetricsCalculator.concatenate_groups(groups)
+    batch = MetricsCalculator.batch_metrics(sim, obs, offsets)
+
+    for idx, (group_sim, group_obs) in enumerate(groups):
+        accumulator = MetricsAccumulator()
+        for chunk in np.array_split(np.arange(len(group_sim)), 3):
+            accumulator.update(group_sim[chunk], group_obs[chunk])
+        result = accumulator.result()
+        for column in BATCH_METRIC_COLUMNS:
+            assert result[column] == pytest.approx(batch[column][idx], nan_ok=True), column
+
+
+def test_merged_accumulators_match_batch(groups):
+    sim, obs, offsets = MetricsCalculator.concatenate_groups(groups)
+    batch = MetricsCalculator.batch_metrics(sim, obs, offsets)
+
+    # Two "workers" see alternating halves of every group
+    workers = [GroupedMetricsAccumulator(), GroupedMetricsAccumulator()]
+    for idx, (group_sim, group_obs) in enumerate(groups):
+        middle = len(group_sim) // 2
+        workers[0].update(idx, group_sim[:middle], group_obs[:middle])
+        workers[1].update(idx, group_sim[middle:], group_obs[middle:])
+    results = workers[0].merge(workers[1]).results()
+
+    for idx in range(len(groups)):
+        for column in BATCH_METRIC_COLUMNS:
+            assert results[idx][column] == pytest.approx(batch[column][idx], nan_ok=True), column
+
+
+def test_accumulator_ignores_missing_pairs():
+    accumulator = MetricsAccumulator().update([1.0, np.nan, 3.0], [1.0, 2.0, 2.0])
+    assert accumulator.result()["n"] == 2
+    assert MetricsAccumulator().result()["n"] == 0
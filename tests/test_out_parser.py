@@ -0,0 +1,115 @@
+"""
+Vectorized OUT parser against the legacy line-based parser
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from data.dssat_io import process_standard_buffer, process_standard_file, _parse_observed_file
+
+HEADER = "@YEAR DOY   DAS  LAID  CWAD"
+ROWS = [" 1982  60     0  0.00     0", " 1982  61     1  0.12    15", " 1982  62     2  0.30    30"]
+
+
+def block(treatment, rows, header=HEADER):
+    lines = [f"*RUN {treatment:>3}        : TEST", f" TREATMENT{treatment:>3}   : TEST {treatment}", "", header]
+    return "\n".join(lines + list(rows)) + "\n\n"
+
+
+def out_file(*blocks):
+    return "*DSSAT Cropping System Model Ver. 4.8.0.000\n\n" + "".join(blocks)
+
+
+def parse_both(text):
+    fast = process_standard_buffer(text.encode("latin-1"))
+    legacy = process_standard_file(text.splitlines(keepends=True))
+    return fast, legacy
+
+
+def numeric_values(df):
+    """Columns as floats where every value parses as a number, else as objects."""
+    values = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values[col] = series
+            continue
+        numbers = pd.to_numeric(series.astype(object), errors="coerce")
+        if numbers.notna().sum() == series.notna().sum():
+            values[col] = numbers.astype(float)
+        else:
+            values[col] = series.astype(object)
+    return pd.DataFrame(values)
+
+
+@pytest.fixture(autouse=True)
+def legacy_dtypes(monkeypatch):
+    # The legacy parser produces the float64/int64 and string columns
+    monkeypatch.setattr(config, "COMPACT_DTYPES", False)
+
+
+def test_matches_legacy_parser():
+    fast, legacy = parse_both(out_file(block(1, ROWS), block(2, ROWS[:2])))
+    pd.testing.assert_frame_equal(fast, legacy)
+    assert list(fast["TRT"]) == ["1", "1", "1", "2", "2"]
+
+
+def test_crlf_line_endings():
+    text = out_file(block(1, ROWS), block(2, ROWS))
+    fast, legacy = parse_both(text.replace("\n", "\r\n"))
+    pd.testing.assert_frame_equal(fast, legacy)
+    pd.testing.assert_frame_equal(fast, parse_both(text)[0])
+
+
+def test_overflow_stars():
+    rows = [" 1982  60     0 *****     0", " 1982  61     1  0.12 *****"]
+    fast, legacy = parse_both(out_file(block(1, rows)))
+    pd.testing.assert_frame_equal(fast, legacy)
+    assert fast["LAID"].iloc[0] == "*****"
+
+
+def test_ragged_lines():
+    rows = [ROWS[0] + "   ", " 1982 61 1 0.12 15", ROWS[2]]
+    fast, legacy = parse_both(out_file(block(1, rows)))
+    pd.testing.assert_frame_equal(fast, legacy)
+
+
+def test_short_lines_are_missing_values():
+    rows = [ROWS[0], " 1982  61     1  0.12"]
+    fast, legacy = parse_both(out_file(block(1, rows)))
+    pd.testing.assert_frame_equal(numeric_values(fast), numeric_values(legacy))
+    assert np.isnan(fast["CWAD"].iloc[1])
+
+
+def test_per_block_headers():
+    wide = HEADER + "  HWAD"
+    text = out_file(block(1, ROWS), block(2, [row + "   100" for row in ROWS], header=wide), block(3, ROWS))
+    fast, legacy = parse_both(text)
+    # The legacy parser leaves partially missing columns as strings; values must agree
+    pd.testing.assert_frame_equal(numeric_values(fast), numeric_values(legacy))
+    assert list(fast["TRT"]) == ["1"] * 3 + ["2"] * 3 + ["3"] * 3
+    assert fast["HWAD"].isna().sum() == 6
+
+
+def test_file_without_treatments():
+    text = "*SOIL WATER\n\n" + HEADER + "\n" + "\n".join(ROWS) + "\n"
+    fast, legacy = parse_both(text)
+    pd.testing.assert_frame_equal(fast, legacy)
+    assert "TRT" not in fast.columns
+
+
+def test_observed_dates_stay_datetime(tmp_path):
+    t_file = tmp_path / "UFGA8201.MZT"
+    t_file.write_text("*EXP. DATA (T): UFGA8201MZ\n\n@TRNO DATE  LAID\n    1 82060   0.5\n    1 82366   1.0\n    1 xx061   2.0\n")
+    df = _parse_observed_file(str(t_file))
+
+    assert pd.api.types.is_datetime64_any_dtype(df["DATE"])
+    assert list(df["DATE"]) == [pd.Timestamp("1982-03-01"), pd.Timestamp("1983-01-01")]
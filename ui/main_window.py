@@ -18,21 +18,22 @@ project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_dir)
 
 import config
-from utils.dssat_paths import get_crop_details, prepare_folders
+from utils.dssat_paths import crop_registry, prepare_folders
 from data.dssat_io import (
     prepare_experiment, prepare_treatment, prepare_out_files, 
-    read_file, read_observed_data, read_evaluate_file,
+    read_file_schema, read_observed_data, read_evaluate_data,
     create_batch_file, run_treatment
 )
-from data.data_processing import (
-    get_evaluate_variable_pairs, get_all_evaluate_variables
-)
+from data.experiment_catalog import experiment_catalog
+from data.data_processing import cache_manager
+from data.dssat_runner import run_treatments_parallel
 from ui.widgets.plot_widget import PlotWidget
 from ui.widgets.status_widget import StatusWidget
 from ui.widgets.data_table_widget import DataTableWidget
 from ui.widgets.scatter_plot_widget import ScatterPlotWidget
 from ui.widgets.metrics_table_widget import MetricsDialog, MetricsTableWidget
 from utils.performance_monitor import PerformanceMonitor, function_timer
+from utils.parallel_loader import ParallelFileLoader, shutdown_pools as shutdown_loader_pools
 
 class MainWindow(QMainWindow):
     execution_completed = pyqtSignal(bool, str)
@@ -41,6 +42,11 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.perf_monitor = PerformanceMonitor()
+        self.file_loader = ParallelFileLoader(parent=self)
+        self.file_loader.files_loaded.connect(self.on_table_files_loaded)
+        # Data cache keys of the frames requested for and shown in the data table
+        self.table_frame_keys = None
+        self.pinned_table_keys = []
         self.execution_status = {"completed": False}
         self.selected_treatments = []
         self.selected_experiment = None
@@ -425,10 +431,13 @@ class MainWindow(QMainWindow):
     def connect_metrics_signals(self):
         self.metrics_button.clicked.connect(self.show_metrics_dialog)
         self.time_series_plot.metrics_calculated.connect(self.update_timeseries_metrics)
+        self.time_series_plot.plot_failed.connect(self.show_error)
         self.scatter_plot.metrics_calculated.connect(self.update_scatter_metrics)
         self.content_area.currentChanged.connect(self.update_current_metrics)
         
     def initialize_data(self):
+        # Warm the experiment catalog for every crop directory in the background
+        experiment_catalog.refresh_all_async()
         self.load_folders()
     
     def update_ui_state(self):
@@ -563,27 +572,24 @@ class MainWindow(QMainWindow):
             
             if not self.selected_folder or not selected_files:
                 return
-            crop_details = get_crop_details()
-            crop_info = next(
-                (crop for crop in crop_details 
-                if crop['name'].upper() == self.selected_folder.upper()),
-                None
-            )
+            crop_info = crop_registry.get_by_name(self.selected_folder)
             if not crop_info:
                 return
             all_columns = set()
             for out_file in selected_files:
                 file_path = os.path.join(crop_info['directory'], out_file)
-                data = read_file(file_path)
-                if data is not None and not data.empty:
+                schema = read_file_schema(file_path)
+                if schema is not None:
                     all_columns.update(
-                        col for col in data.columns 
+                        col for col in schema["columns"]
                         if col not in ["TRT", "FILEX"]
                     )
-            from data.data_processing import get_variable_info
+            from data.data_processing import get_variable_infos
+            sorted_columns = sorted(all_columns)
+            infos = get_variable_infos(sorted_columns)
             self.x_var_selector.clear()
-            for col in sorted(all_columns):
-                var_label, _ = get_variable_info(col)
+            for col in sorted_columns:
+                var_label, _ = infos[col]
                 display_text = f"{var_label} ({col})" if var_label else col
                 self.x_var_selector.addItem(display_text, userData=col)
             if "DATE" in all_columns:
@@ -592,8 +598,8 @@ class MainWindow(QMainWindow):
                         self.x_var_selector.setCurrentIndex(i)
                         break
             self.y_var_selector.clear()
-            for col in sorted(all_columns):
-                var_label, _ = get_variable_info(col)
+            for col in sorted_columns:
+                var_label, _ = infos[col]
                 display_text = f"{var_label} ({col})" if var_label else col
                 item = QListWidgetItem(display_text)
                 item.setData(Qt.ItemDataRole.UserRole, col)
@@ -623,12 +629,7 @@ class MainWindow(QMainWindow):
                 logging.warning("No folder selected for loading scatter variables")
                 return
             logging.info(f"Loading scatter variables for folder: {self.selected_folder}")
-            crop_details = get_crop_details()
-            crop_info = next(
-                (crop for crop in crop_details 
-                if crop['name'].upper() == self.selected_folder.upper()),
-                None
-            )
+            crop_info = crop_registry.get_by_name(self.selected_folder)
             if not crop_info:
                 logging.error(f"Could not find crop info for: {self.selected_folder}")
                 self.populate_default_scatter_variables()
@@ -640,13 +641,14 @@ class MainWindow(QMainWindow):
                 logging.warning(f"EVALUATE.OUT not found at: {evaluate_path}")
                 self.populate_default_scatter_variables()
                 return
-            evaluate_data = read_evaluate_file(self.selected_folder)
+            evaluate = read_evaluate_data(self.selected_folder)
+            evaluate_data = evaluate["data"] if evaluate is not None else None
             if evaluate_data is None or evaluate_data.empty:
                 logging.warning(f"No evaluate data available for folder: {self.selected_folder}")
                 self.populate_default_scatter_variables()
                 return
             logging.info(f"Successfully loaded evaluate data with {len(evaluate_data)} rows")
-            var_pairs = get_evaluate_variable_pairs(evaluate_data)
+            var_pairs = evaluate["pairs"]
             logging.info(f"Found {len(var_pairs)} variable pairs")
             self.scatter_var_selector.clear()
             for display_name, sim_var, meas_var in var_pairs:
@@ -657,7 +659,7 @@ class MainWindow(QMainWindow):
             if self.scatter_var_selector.count() > 0:
                 self.scatter_var_selector.item(0).setSelected(True)
                 logging.info(f"Selected default auto-pair: {self.scatter_var_selector.item(0).text()}")
-            all_vars = get_all_evaluate_variables(evaluate_data)
+            all_vars = evaluate["variables"]
             logging.info(f"Found {len(all_vars)} total variables")
             self.scatter_x_var_selector.clear()
             for display_name, var_name in all_vars:
@@ -803,14 +805,18 @@ class MainWindow(QMainWindow):
             from PyQt6.QtCore import QThread
             class WorkerThread(QThread):
                 result_signal = pyqtSignal(bool, str)
-                def __init__(self, parent, input_data, dssat_base):
+                def __init__(self, parent, input_data, dssat_base, parallel):
                     super().__init__(parent)
                     self.input_data = input_data
                     self.dssat_base = dssat_base
+                    self.parallel = parallel
                 def run(self):
                     try:
-                        batch_file_path = create_batch_file(self.input_data, self.dssat_base)
-                        run_treatment(self.input_data, self.dssat_base)
+                        if self.parallel:
+                            run_treatments_parallel(self.input_data, self.dssat_base)
+                        else:
+                            batch_file_path = create_batch_file(self.input_data, self.dssat_base)
+                            run_treatment(self.input_data, self.dssat_base)
                         treatment_str = (
                             ", ".join(str(t) for t in self.input_data["treatment"])
                             if isinstance(self.input_data["treatment"], list)
@@ -827,7 +833,11 @@ class MainWindow(QMainWindow):
                 "experiment": self.selected_experiment,
                 "treatment": self.selected_treatments,
             }
-            self.worker_thread = WorkerThread(self, input_data, config.DSSAT_BASE)
+            self.start_streaming_plot()
+            parallel = config.ENABLE_PARALLEL_RUNS and len(self.selected_treatments) > 1
+            if parallel:
+                self.status_widget.show_running(f"Running {len(self.selected_treatments)} treatments in parallel...")
+            self.worker_thread = WorkerThread(self, input_data, config.DSSAT_BASE, parallel)
             self.worker_thread.result_signal.connect(self.handle_execution_completed)
             self.worker_thread.start()
         except Exception as e:
@@ -835,12 +845,34 @@ class MainWindow(QMainWindow):
             self.status_widget.clear()
             self.show_error("Error executing treatment", str(e))
     
+    def start_streaming_plot(self):
+        """Plot treatment blocks as the running simulation appends them to the selected files."""
+        if self.content_area.currentIndex() != 0:
+            return
+        selected_files = [item.text() for item in self.out_file_selector.selectedItems()]
+        x_var = self.x_var_selector.currentData() or self.x_var_selector.currentText()
+        y_vars = [
+            item.data(Qt.ItemDataRole.UserRole) or item.text()
+            for item in self.y_var_selector.selectedItems()
+        ]
+        if not selected_files or not x_var or not y_vars:
+            return
+        crop_info = crop_registry.get_by_name(self.selected_folder)
+        if not crop_info:
+            return
+        file_paths = [os.path.join(crop_info['directory'], out_file) for out_file in selected_files]
+        self.time_series_plot.start_following(
+            file_paths, selected_files, self.selected_treatments, x_var, y_vars, self.treatment_names,
+            selected_folder=self.selected_folder, selected_experiment=self.selected_experiment
+        )
+
     @pyqtSlot(bool, str)
     def handle_execution_completed(self, success, message):
         self.execution_completed.emit(success, message)
     
     @pyqtSlot(bool, str)
     def on_execution_completed(self, success, message):
+        self.time_series_plot.stop_following(flush=success)
         self.run_button.setEnabled(True)
         self.status_widget.clear()
         if success:
@@ -1123,44 +1155,52 @@ class MainWindow(QMainWindow):
             if not selected_files:
                 return
                 
+            crop_info = crop_registry.get_by_name(self.selected_folder)
+            if not crop_info:
+                self.table_frame_keys = None
+                self.on_table_files_loaded([])
+                return
+            file_paths = [os.path.join(crop_info['directory'], out_file) for out_file in selected_files]
+            x_var, y_vars = self.selected_plot_variables()
+            self.table_frame_keys = tuple(
+                cache_manager.make_key(f"data_table_{source}", file_paths, experiment=self.selected_experiment,
+                                       treatments=list(self.selected_treatments), x_var=x_var, y_vars=y_vars)
+                for source in ("sim", "obs")
+            )
+            cached_sim = cache_manager.get_cached_data(self.table_frame_keys[0])
+            cached_obs = cache_manager.get_cached_data(self.table_frame_keys[1])
+            if cached_sim is not None and cached_obs is not None:
+                # The same selection was shown before
+                self.file_loader.cancel_pending()
+                self.show_table_frames(cached_sim, cached_obs if not cached_obs.empty else None)
+                return
+            logging.info(f"Reading files with full paths: {file_paths}")
+            # Files are parsed concurrently off the GUI thread; on_table_files_loaded fills the table
+            self.file_loader.load_files_async(file_paths, selected_files)
+        except Exception as e:
+            logging.error(f"Error updating data table: {e}")
+            self.show_error("Error updating data table", str(e))
+    
+    @pyqtSlot(list)
+    def on_table_files_loaded(self, loaded):
+        """Fill the data table from the loaded files (tagged with FILE/source, in selection order)."""
+        try:
             all_data = []
-            for out_file in selected_files:
-                crop_details = get_crop_details()
-                crop_info = next(
-                    (crop for crop in crop_details 
-                    if crop['name'].upper() == self.selected_folder.upper()),
-                    None
-                )
-                if not crop_info:
-                    continue
-                file_path = os.path.join(crop_info['directory'], out_file)
-                logging.info(f"Reading file with full path: {file_path}")
-                file_data = read_file(file_path)
-                if file_data is not None and not file_data.empty:
-                    file_data['FILE'] = out_file
-                    file_data['source'] = 'sim'
-                    if 'TRT' not in file_data.columns:
-                        if 'TRNO' in file_data.columns:
-                            file_data['TRT'] = file_data['TRNO']
-                        elif 'TR' in file_data.columns:
-                            file_data['TRT'] = file_data['TR']
-                        elif 'TN' in file_data.columns:
-                            file_data['TRT'] = file_data['TN']
-                        else:
-                            file_data['TRT'] = '1'
-                    file_data['TRT'] = file_data['TRT'].astype(str)
-                    all_data.append(file_data)
+            for file_data in loaded:
+                if 'TRT' not in file_data.columns:
+                    if 'TRNO' in file_data.columns:
+                        file_data['TRT'] = file_data['TRNO']
+                    elif 'TR' in file_data.columns:
+                        file_data['TRT'] = file_data['TR']
+                    elif 'TN' in file_data.columns:
+                        file_data['TRT'] = file_data['TN']
+                    else:
+                        file_data['TRT'] = '1'
+                file_data['TRT'] = file_data['TRT'].astype(str)
+                all_data.append(file_data)
                     
             if self.selected_experiment:
-                x_var = self.x_var_selector.currentData() or self.x_var_selector.currentText()
-                y_vars = []
-                for item in self.y_var_selector.selectedItems():
-                    var_code = item.data(Qt.ItemDataRole.UserRole)
-                    if var_code:
-                        y_vars.append(var_code)
-                    else:
-                        y_vars.append(item.text())
-                        
+                x_var, y_vars = self.selected_plot_variables()
                 obs_data = read_observed_data(
                     self.selected_folder,
                     self.selected_experiment,
@@ -1186,14 +1226,39 @@ class MainWindow(QMainWindow):
                 sim_data = filtered_data[filtered_data['source'] == 'sim'].copy() if 'source' in filtered_data.columns else filtered_data.copy()
                 obs_data = filtered_data[filtered_data['source'] == 'obs'].copy() if 'source' in filtered_data.columns else None
                 
-                self.data_table.set_data(sim_data=sim_data, obs_data=obs_data)
+                self.show_table_frames(sim_data, obs_data)
             else:
                 self.data_table.clear()
         except Exception as e:
             logging.error(f"Error updating data table: {e}")
             self.show_error("Error updating data table", str(e))
             
+    def selected_plot_variables(self):
+        """Return the selected x variable and the list of selected y variable codes."""
+        x_var = self.x_var_selector.currentData() or self.x_var_selector.currentText()
+        y_vars = []
+        for item in self.y_var_selector.selectedItems():
+            var_code = item.data(Qt.ItemDataRole.UserRole)
+            if var_code:
+                y_vars.append(var_code)
+            else:
+                y_vars.append(item.text())
+        return x_var, y_vars
+    
+    def show_table_frames(self, sim_data, obs_data):
+        """Show frames in the data table, pinning them in the data cache while they are on screen."""
+        if self.table_frame_keys:
+            # An empty frame records that the selection has no observed data
+            self.pinned_table_keys = cache_manager.pin_frames({
+                self.table_frame_keys[0]: sim_data,
+                self.table_frame_keys[1]: obs_data if obs_data is not None else pd.DataFrame(),
+            }, self.pinned_table_keys)
+        self.data_table.set_data(sim_data=sim_data, obs_data=obs_data)
+    
     def closeEvent(self, event):
+        self.file_loader.shutdown()
+        self.time_series_plot.file_loader.shutdown()
+        shutdown_loader_pools()
         event.accept()
     
     def filter_out_files(self, text):
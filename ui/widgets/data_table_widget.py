@@ -23,6 +23,9 @@ sys.path.insert(0, project_dir)
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Dates are kept as datetime64 and only formatted for display and export
+DATE_FORMAT = "%Y-%m-%d"
+
 class PandasTableModel(QAbstractTableModel):
     """Table model for pandas DataFrame to display in QTableView"""
     
@@ -45,10 +48,12 @@ class PandasTableModel(QAbstractTableModel):
             # Format based on data type
             if pd.isna(value):
                 return "NA"
-            elif isinstance(value, (float, np.float64)):
+            elif isinstance(value, (float, np.floating)):
                 return f"{value:.4f}"
-            elif isinstance(value, (int, np.int64)):
+            elif isinstance(value, (int, np.integer)):
                 return str(value)
+            elif isinstance(value, pd.Timestamp):
+                return value.strftime(DATE_FORMAT)
             else:
                 return str(value)
                 
@@ -312,6 +317,8 @@ class DataTableWidget(QTableWidget):
             
             # Add values to filter dropdown
             for value in sorted(unique_values):
+                if isinstance(value, pd.Timestamp):
+                    value = value.strftime(DATE_FORMAT)
                 self.filter_value.addItem(str(value))
     
     def apply_filter(self):
@@ -333,6 +340,9 @@ class DataTableWidget(QTableWidget):
                 if pd.api.types.is_numeric_dtype(data[column]):
                     try:
                         filter_value = float(filter_text)
+                        if pd.api.types.is_float_dtype(data[column]):
+                            # Compare at the column's precision so float32 values match their text
+                            filter_value = data[column].dtype.type(filter_value)
                         filtered_data = data[data[column] == filter_value]
                     except ValueError:
                         filtered_data = data[data[column].astype(str).str.contains(filter_text)]
@@ -393,14 +403,14 @@ class DataTableWidget(QTableWidget):
             
         try:
             if file_path.endswith('.csv'):
-                data_to_export.to_csv(file_path, index=False)
+                data_to_export.to_csv(file_path, index=False, date_format=DATE_FORMAT)
             elif file_path.endswith('.xlsx'):
                 data_to_export.to_excel(file_path, index=False)
             else:
                 # Add extension based on filter
                 if 'CSV' in filter_type:
                     file_path += '.csv'
-                    data_to_export.to_csv(file_path, index=False)
+                    data_to_export.to_csv(file_path, index=False, date_format=DATE_FORMAT)
                 else:
                     file_path += '.xlsx'
                     data_to_export.to_excel(file_path, index=False)
@@ -32,13 +32,20 @@ class MetricsTableModel(QAbstractTableModel):
         self._data = data
         # Define column headers based on typical metrics
         self._headers = ["Variable", "n", "R²", "RMSE", "d-stat"]
+        # Bootstrap interval columns follow their metric when the rows carry them
+        for metric in ("RMSE", "d-stat"):
+            ci_header = f"{metric} CI"
+            if any(ci_header in row for row in data):
+                self._headers.insert(self._headers.index(metric) + 1, ci_header)
         # Map data keys to headers (for flexibility in data format)
         self._key_map = {
             "Variable": ["Variable", "variable", "var"],
             "n": ["n", "N", "samples", "count"],
             "R²": ["R²", "R2", "r_squared", "rsquared", "r-squared"],
             "RMSE": ["RMSE", "rmse", "root_mean_square_error"],
-            "d-stat": ["d-stat", "Willmott's d-stat", "d_stat", "dstat", "willmott_d"]
+            "d-stat": ["d-stat", "Willmott's d-stat", "d_stat", "dstat", "willmott_d"],
+            "RMSE CI": ["RMSE CI"],
+            "d-stat CI": ["d-stat CI"]
         }
 
     def rowCount(self, parent=None):
@@ -63,7 +70,12 @@ class MetricsTableModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.DisplayRole:
             if value is None:
                 return "NA"
-            elif isinstance(value, float):
+            elif isinstance(value, tuple):
+                # Confidence interval bounds
+                if any(pd.isna(bound) for bound in value):
+                    return "NA"
+                return f"[{value[0]:.3f}, {value[1]:.3f}]"
+            elif isinstance(value, (float, np.floating)):
                 # Format floating point numbers
                 return f"{value:.4f}"
             else:
@@ -83,12 +95,12 @@ class MetricsTableModel(QAbstractTableModel):
                 
         elif role == Qt.ItemDataRole.BackgroundRole:
             # Add coloring for good/bad metric values
-            if col_name == "R²" and isinstance(value, float):
+            if col_name == "R²" and isinstance(value, (float, np.floating)):
                 if value > 0.8:
                     return QColor(200, 255, 200)  # Light green
                 elif value < 0.5:
                     return QColor(255, 200, 200)  # Light red
-            elif col_name == "d-stat" and isinstance(value, float):
+            elif col_name == "d-stat" and isinstance(value, (float, np.floating)):
                 if value > 0.8:
                     return QColor(200, 255, 200)  # Light green
                 elif value < 0.5:
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import logging
 from typing import List, Dict, Any
 from PyQt6.QtCore import QTimer, QRect
@@ -7,6 +8,7 @@ from PyQt6.QtCore import QTimer, QRect
 import numpy as np
 import pandas as pd
 import pyqtgraph as pg
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout,
     QFrame, QSizePolicy, QScrollArea
@@ -19,13 +21,18 @@ project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'
 sys.path.insert(0, project_dir)
 
 import config
-from utils.dssat_paths import get_crop_details
-from data.dssat_io import read_file, read_observed_data
+from utils.dssat_paths import crop_registry
+from data.dssat_io import read_observed_data
+from data.tail_reader import OutFileTailer
+from utils.parallel_loader import ParallelFileLoader
 from data.data_processing import (
     handle_missing_xvar, get_variable_info, improved_smart_scale,
-    standardize_dtypes, unified_date_convert
+    standardize_dtypes, year_doy_to_dates, dates_to_epoch_seconds,
+    cache_manager
 )
-from models.metrics import MetricsCalculator
+from data.alignment import align_sim_obs
+from models.metrics import MetricsCalculator, MetricsAccumulator, GroupedMetricsAccumulator
+from models.metrics_cache import metrics_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -33,6 +40,7 @@ logger = logging.getLogger(__name__)
 class PlotWidget(QWidget):
     
     metrics_calculated = pyqtSignal(list)
+    plot_failed = pyqtSignal(str, str)  # title, message
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -52,6 +60,23 @@ class PlotWidget(QWidget):
         self.plot_item_cache = {}
         self.last_plot_config = None
         self.cache_size_limit = 1000
+        self.file_loader = ParallelFileLoader(parent=self)
+        self.file_loader.files_loaded.connect(self.on_sim_files_loaded)
+        # Arguments of the plot_time_series call whose files are still loading
+        self.pending_plot = None
+        # Data cache keys of the frames behind the current plot (pinned)
+        self.pinned_frame_keys = []
+        
+        # Output files followed while a simulation is still writing them
+        self.tailers = {}
+        self.follow_config = None
+        self.streamed_curves = 0
+        # Observed data and running metrics per (file, variable, treatment) while following
+        self.follow_obs = None
+        self.follow_metrics = GroupedMetricsAccumulator()
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(config.TAIL_POLL_INTERVAL_MS)
+        self.follow_timer.timeout.connect(self.poll_followed_files)
         
         self.sim_data = None
         self.obs_data = None
@@ -166,146 +191,143 @@ class PlotWidget(QWidget):
     def batch_date_convert(self, df):
         try:
             if "YEAR" in df.columns and "DOY" in df.columns:
-                df["DATE"] = df.apply(
-                    lambda row: unified_date_convert(row["YEAR"], row["DOY"]),
-                    axis=1,
-                )
-                df["DATE"] = df["DATE"].dt.strftime("%Y-%m-%d")
+                df["DATE"] = year_doy_to_dates(df["YEAR"], df["DOY"])
             return df
         except Exception as e:
             logger.warning(f"Error in batch date conversion: {e}")
             return df
 
+    def _x_axis_values(self, data, x_var):
+        """Return the x coordinates of data: epoch seconds for DATE, the column otherwise.
+
+        Numeric columns come back as float64 numpy arrays, also when Arrow-backed.
+        """
+        if x_var != "DATE":
+            if is_numeric_dtype(data[x_var]):
+                return data[x_var].to_numpy(dtype=np.float64, na_value=np.nan)
+            return data[x_var].to_numpy()
+        if "_x_values" in data.columns:
+            return data["_x_values"].to_numpy()
+        dates = data[x_var]
+        if not is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+        return dates_to_epoch_seconds(dates)
+
     def plot_time_series(self, selected_folder, selected_out_files, selected_experiment, 
                         selected_treatments, x_var, y_vars, treatment_names=None):
         try:
             plot_config = (selected_folder, tuple(selected_out_files), selected_experiment,
                         tuple(selected_treatments), x_var, tuple(y_vars))
             
-            if plot_config == self.last_plot_config and self.data_cache:
-                sim_data = self.data_cache.get('sim_data')
-                obs_data = self.data_cache.get('obs_data')
-                if sim_data is not None:
-                    self.plot_cached_data(sim_data, obs_data, x_var, y_vars, selected_treatments, treatment_names)
-                    return
+            # A newer request replaces any load still in flight
+            self.pending_plot = None
+            self.file_loader.cancel_pending()
 
             self.plot_view.clear()
             self.plot_items_metadata.clear()
             logger.debug("Cleared plot view and metadata")
 
-            sim_data_list = []
-            for file_path in selected_out_files:
-                full_path = os.path.abspath(file_path)
-                if not os.path.exists(full_path):
-                    logger.error(f"File does not exist: {full_path}")
-                    continue
-                df = read_file(full_path)
-                if df is not None and not df.empty:
-                    df.columns = df.columns.str.strip().str.upper()
-                    numeric_columns = df.columns[~df.columns.isin(['CR', 'CROP'])]
-                    for col in numeric_columns:
-                        try:
-                            df[col] = pd.to_numeric(df[col], errors='coerce')
-                        except Exception as e:
-                            logger.warning(f"Could not convert column {col} to numeric: {e}")
-                    df['source'] = 'sim'
-                    df['FILE'] = os.path.basename(file_path)
-                    sim_data_list.append(df)
-                else:
-                    logger.warning(f"No data loaded from {full_path}")
-            
-            sim_data = pd.concat(sim_data_list, ignore_index=True) if sim_data_list else None
-            logger.debug(f"Loaded sim_data with shape: {sim_data.shape if sim_data is not None else 'None'}")
-
             for i in reversed(range(self.legend_layout.count())):
                 item = self.legend_layout.itemAt(i)
                 if item.widget():
                     item.widget().deleteLater()
             
-            all_data = []
+            crop_info = crop_registry.get_by_name(selected_folder)
+            
+            if not crop_info:
+                logger.error(f"Could not find crop info for: {selected_folder}")
+                return
+            folder_path = crop_info['directory'].strip()
+            
+            file_paths, file_names = [], []
             for selected_out_file in selected_out_files:
-                crop_details = get_crop_details()
-                crop_info = next(
-                    (crop for crop in crop_details 
-                    if crop['name'].upper() == selected_folder.upper()),
-                    None
-                )
-                
-                if not crop_info:
-                    logger.error(f"Could not find crop info for: {selected_folder}")
-                    return
-                folder_path = crop_info['directory'].strip()
                 file_path = os.path.join(folder_path, selected_out_file)
                 if not os.path.exists(file_path):
                     logger.error(f"File does not exist: {file_path}")
                     continue
-                sim_data = read_file(file_path)
+                file_paths.append(file_path)
+                file_names.append(selected_out_file)
+            
+            # Frames of a selection shown before come from the data cache instead of the files
+            frame_keys = tuple(
+                cache_manager.make_key(f"time_series_{source}", file_paths, experiment=selected_experiment,
+                                       treatments=list(selected_treatments), x_var=x_var, y_vars=list(y_vars))
+                for source in ("sim", "obs")
+            )
+            request = (plot_config, frame_keys, selected_folder, selected_experiment,
+                       list(selected_treatments), x_var, list(y_vars), treatment_names)
+            cached_sim = cache_manager.get_cached_data(frame_keys[0])
+            cached_obs = cache_manager.get_cached_data(frame_keys[1])
+            if cached_sim is not None and cached_obs is not None:
+                self.plot_frames(request, cached=(cached_sim, cached_obs))
+                return
+
+            # Parse all selected files concurrently; on_sim_files_loaded plots them once all arrive
+            self.pending_plot = request
+            self.file_loader.load_files_async(
+                file_paths, file_names,
+                columns=[x_var] + list(y_vars), treatments=selected_treatments
+            )
                 
-                if sim_data is None or sim_data.empty:
-                    logger.warning(f"No data loaded from {file_path}")
-                    continue
+        except Exception as e:
+            logger.error(f"Error in plot_time_series: {str(e)}", exc_info=True)
+            raise
+
+    @pyqtSlot(list)
+    def on_sim_files_loaded(self, loaded):
+        """Plot the simulated frames of the pending plot_time_series request."""
+        if self.pending_plot is None:
+            return
+        request = self.pending_plot
+        self.pending_plot = None
+        self.plot_frames(request, loaded=loaded)
+
+    def plot_frames(self, request, loaded=None, cached=None):
+        """Plot a time series request from freshly loaded files or from cached (sim, obs) frames.
+        
+        The unscaled frames behind the plot are pinned in the data cache
+        until another selection is plotted; they then become inactive and
+        may be compressed or evicted.
+        """
+        (plot_config, frame_keys, selected_folder, selected_experiment,
+         selected_treatments, x_var, y_vars, treatment_names) = request
+        try:
+            if cached is not None:
+                sim_data, obs_data = cached
+                if obs_data.empty:
+                    obs_data = None
+            else:
+                all_data = [self._prepare_sim_frame(sim_data) for sim_data in loaded]
                     
-                sim_data.columns = sim_data.columns.str.strip().str.upper()
-                
-                if "TRNO" in sim_data.columns and "TRT" not in sim_data.columns:
-                    sim_data["TRT"] = sim_data["TRNO"]
-                elif "TRT" not in sim_data.columns:
-                    sim_data["TRT"] = "1"
+                if not all_data:
+                    logger.warning("No simulation data available")
+                    return
                     
-                sim_data["TRT"] = sim_data["TRT"].astype(str)
+                sim_data = pd.concat(all_data, ignore_index=True)
+                logger.debug(f"Combined sim_data with shape: {sim_data.shape}")
                 
-                for col in ["YEAR", "DOY"]:
-                    if col in sim_data.columns:
-                        sim_data[col] = (
-                            pd.to_numeric(sim_data[col], errors="coerce")
-                            .fillna(0)
-                            .replace([np.inf, -np.inf], 0)
-                        )
-                    else:
-                        sim_data[col] = 0
+                obs_data = None
+                if selected_experiment:
+                    obs_data = read_observed_data(
+                        selected_folder, selected_experiment, x_var, y_vars,
+                        columns=[x_var] + list(y_vars)
+                    )
+                    if obs_data is not None and not obs_data.empty:
+                        logger.info(f"Loaded observed data with shape: {obs_data.shape}")
+                        obs_data["source"] = "obs"
+                        obs_data = handle_missing_xvar(obs_data, x_var, sim_data)
                         
-                sim_data["DATE"] = sim_data.apply(
-                    lambda row: unified_date_convert(row["YEAR"], row["DOY"]),
-                    axis=1,
-                )
-                
-                sim_data["DATE"] = sim_data["DATE"].dt.strftime("%Y-%m-%d")
-                sim_data["source"] = "sim"
-                sim_data["FILE"] = selected_out_file
-                all_data.append(sim_data)
-                
-            if not all_data:
-                logger.warning("No simulation data available")
-                return
-                
-            sim_data = pd.concat(all_data, ignore_index=True)
-            missing_values = {-99, -99.0, -99.9, -99.99, -99.}
-            logger.debug(f"Combined sim_data with shape: {sim_data.shape}")
+                        if obs_data is not None:
+                            obs_data = self._prepare_obs_frame(obs_data, y_vars)
             
-            obs_data = None
-            if selected_experiment:
-                obs_data = read_observed_data(
-                    selected_folder, selected_experiment, x_var, y_vars
-                )
-                if obs_data is not None and not obs_data.empty:
-                    logger.info(f"Loaded observed data with shape: {obs_data.shape}")
-                    obs_data["source"] = "obs"
-                    obs_data = handle_missing_xvar(obs_data, x_var, sim_data)
-                    
-                    if obs_data is not None:
-                        if "TRNO" in obs_data.columns:
-                            obs_data["TRNO"] = obs_data["TRNO"].astype(str)
-                            obs_data = obs_data.rename(columns={"TRNO": "TRT"})
-                            
-                        for var in y_vars:
-                            if var in obs_data.columns:
-                                obs_data[var] = pd.to_numeric(
-                                    obs_data[var], errors="coerce")
-                                obs_data.loc[
-                                    obs_data[var].isin(missing_values), var
-                                ] = np.nan
-                        
-                        self.obs_data = obs_data.copy()
+            # An empty frame records that the selection has no observed data
+            self.pinned_frame_keys = cache_manager.pin_frames({
+                frame_keys[0]: sim_data,
+                frame_keys[1]: obs_data if obs_data is not None else pd.DataFrame(),
+            }, self.pinned_frame_keys)
+            # Scaling below adds columns; shallow copies keep the cached frames unscaled
+            sim_data = sim_data.copy(deep=False)
+            obs_data = obs_data.copy(deep=False) if obs_data is not None else None
             
             sim_scaling_factors = {}
             if len(y_vars) > 1:
@@ -315,7 +337,7 @@ class PlotWidget(QWidget):
                         sim_values = (
                             pd.to_numeric(sim_data[var], errors="coerce")
                             .dropna()
-                            .values
+                            .to_numpy(dtype=np.float64)
                         )
                         if len(sim_values) > 0 and not np.isclose(np.min(sim_values), np.max(sim_values)):
                             avg_value = np.mean(np.abs(sim_values))
@@ -433,22 +455,15 @@ class PlotWidget(QWidget):
                                     logger.debug(f"Creating pen for Variable: {var}, Treatment: {trt_value}, Style: {var_style_map[var]}")
                                     
                                     valid_mask = group[var].notna()
-                                    x_values = group[valid_mask][x_var].values
-                                    y_values = group[valid_mask][var].values
+                                    x_values = self._x_axis_values(group[valid_mask], x_var)
+                                    y_values = group[valid_mask][var].to_numpy(dtype=np.float64, na_value=np.nan)
                                     
                                     if x_var == "DATE":
-                                        try:
-                                            x_dates = pd.to_datetime(x_values, errors='coerce')
-                                            valid_date_mask = ~x_dates.isna()
-                                            x_values = x_values[valid_date_mask]
-                                            y_values = y_values[valid_date_mask]
-                                            x_dates = x_dates[valid_date_mask]
-                                            if len(x_dates) == 0:
-                                                logger.warning(f"No valid dates for {var}, {trt_display}")
-                                                continue
-                                            x_values = [d.timestamp() for d in x_dates]
-                                        except Exception as e:
-                                            logger.warning(f"Error converting dates for {var}, {trt_display}: {e}")
+                                        valid_date_mask = ~np.isnan(x_values)
+                                        x_values = x_values[valid_date_mask]
+                                        y_values = y_values[valid_date_mask]
+                                        if len(x_values) == 0:
+                                            logger.warning(f"No valid dates for {var}, {trt_display}")
                                             continue
                                         
                                     y_values = np.array(y_values, dtype=np.float64)
@@ -485,22 +500,15 @@ class PlotWidget(QWidget):
                                     symbol = self.marker_symbols[symbol_idx]
                                     
                                     valid_mask = group[var].notna()
-                                    x_values = group[valid_mask][x_var].values
-                                    y_values = group[valid_mask][var].values
+                                    x_values = self._x_axis_values(group[valid_mask], x_var)
+                                    y_values = group[valid_mask][var].to_numpy(dtype=np.float64, na_value=np.nan)
                                     
                                     if x_var == "DATE":
-                                        try:
-                                            x_dates = pd.to_datetime(x_values, errors='coerce')
-                                            valid_date_mask = ~x_dates.isna()
-                                            x_values = x_values[valid_date_mask]
-                                            y_values = y_values[valid_date_mask]
-                                            x_dates = x_dates[valid_date_mask]
-                                            if len(x_dates) == 0:
-                                                logger.warning(f"No valid dates for {var}, {trt_display}")
-                                                continue
-                                            x_values = [d.timestamp() for d in x_dates]
-                                        except Exception as e:
-                                            logger.warning(f"Error converting dates for {var}, {trt_display}: {e}")
+                                        valid_date_mask = ~np.isnan(x_values)
+                                        x_values = x_values[valid_date_mask]
+                                        y_values = y_values[valid_date_mask]
+                                        if len(x_values) == 0:
+                                            logger.warning(f"No valid dates for {var}, {trt_display}")
                                             continue
                                     
                                     if len(x_values) < 1 or len(y_values) < 1:
@@ -600,10 +608,6 @@ class PlotWidget(QWidget):
             
             self.plot_view.updateGeometry()
             
-            self.data_cache = {
-                'sim_data': sim_data,
-                'obs_data': obs_data
-            }
             self.last_plot_config = plot_config
             logger.info(f"Plotted with {len(self.plot_items_metadata)} items in metadata")
 
@@ -611,8 +615,170 @@ class PlotWidget(QWidget):
                 self.calculate_metrics(sim_data, obs_data, y_vars, selected_treatments, treatment_names)
                 
         except Exception as e:
-            logger.error(f"Error in plot_time_series: {str(e)}", exc_info=True)
-            raise
+            # Raising from a slot would abort the application, so the error is reported by signal
+            logger.error(f"Error plotting loaded files: {str(e)}", exc_info=True)
+            self.plot_failed.emit("Error updating plot", str(e))
+
+    def _prepare_sim_frame(self, sim_data):
+        """Normalize a tagged simulated frame (TRT as str, DATE as datetime64) for plotting."""
+        # Re-tagged below so the column layout matches a single-file read
+        selected_out_file = sim_data["FILE"].iloc[0]
+        sim_data = sim_data.drop(columns=["FILE", "source"])
+        sim_data.columns = sim_data.columns.str.strip().str.upper()
+        
+        if "TRNO" in sim_data.columns and "TRT" not in sim_data.columns:
+            sim_data["TRT"] = sim_data["TRNO"]
+        elif "TRT" not in sim_data.columns:
+            sim_data["TRT"] = "1"
+            
+        sim_data["TRT"] = sim_data["TRT"].astype(str)
+        
+        for col in ["YEAR", "DOY"]:
+            if col in sim_data.columns:
+                sim_data[col] = (
+                    pd.to_numeric(sim_data[col], errors="coerce")
+                    .fillna(0)
+                    .replace([np.inf, -np.inf], 0)
+                )
+            else:
+                sim_data[col] = 0
+                
+        dates = year_doy_to_dates(sim_data["YEAR"], sim_data["DOY"])
+        sim_data["DATE"] = dates
+        # Plot x coordinates of DATE, computed once per frame
+        sim_data["_x_values"] = dates_to_epoch_seconds(dates)
+        sim_data["source"] = "sim"
+        sim_data["FILE"] = selected_out_file
+        return sim_data
+
+    def _prepare_obs_frame(self, obs_data, y_vars):
+        """Key observed data by TRT and turn missing-value sentinels into NaN."""
+        if "TRNO" in obs_data.columns:
+            obs_data["TRNO"] = obs_data["TRNO"].astype(str)
+            obs_data = obs_data.rename(columns={"TRNO": "TRT"})
+            
+        for var in y_vars:
+            if var in obs_data.columns:
+                obs_data[var] = pd.to_numeric(obs_data[var], errors="coerce")
+                obs_data.loc[obs_data[var].isin(config.MISSING_VALUES), var] = np.nan
+        if "DATE" in obs_data.columns:
+            obs_data["_x_values"] = self._x_axis_values(obs_data, "DATE")
+        return obs_data
+
+    def start_following(self, file_paths, file_names, selected_treatments, x_var, y_vars, treatment_names=None,
+                        selected_folder=None, selected_experiment=None):
+        """Stream treatment blocks into the plot as a running simulation appends them.
+        
+        With an experiment given, metrics against its observed data are
+        updated as each block arrives.
+        """
+        self.stop_following(flush=False)
+        self.plot_view.clear()
+        self.plot_items_metadata.clear()
+        self.last_plot_config = None
+        self.streamed_curves = 0
+        self.follow_metrics = GroupedMetricsAccumulator()
+        self.follow_obs = None
+        if selected_folder and selected_experiment:
+            obs_data = read_observed_data(selected_folder, selected_experiment, x_var, y_vars,
+                                          columns=[x_var] + list(y_vars))
+            if obs_data is not None and not obs_data.empty:
+                self.follow_obs = self._prepare_obs_frame(obs_data, y_vars)
+        
+        since = time.time()
+        columns = [x_var] + list(y_vars)
+        self.tailers = {
+            name: OutFileTailer(path, columns=columns, since=since)
+            for path, name in zip(file_paths, file_names)
+        }
+        self.follow_config = (list(selected_treatments), x_var, list(y_vars), treatment_names)
+        self.follow_timer.start()
+        logger.info(f"Following {len(self.tailers)} output files")
+
+    def stop_following(self, flush=True):
+        """Stop following output files, plotting any blocks still pending."""
+        self.follow_timer.stop()
+        if flush:
+            for name, tailer in self.tailers.items():
+                reset, deltas = tailer.finish()
+                self.append_sim_blocks(name, deltas, reset)
+        self.tailers = {}
+        self.follow_config = None
+        self.follow_obs = None
+
+    def poll_followed_files(self):
+        for name, tailer in self.tailers.items():
+            try:
+                reset, deltas = tailer.poll()
+            except Exception as e:
+                logger.warning(f"Error following {name}: {e}")
+                continue
+            self.append_sim_blocks(name, deltas, reset)
+
+    def append_sim_blocks(self, file_name, deltas, reset=False):
+        """Add newly parsed treatment blocks of one file as new curves."""
+        if self.follow_config is None:
+            return
+        selected_treatments, x_var, y_vars, treatment_names = self.follow_config
+        
+        if reset:
+            # The file was rewritten; drop curves and metrics streamed from it so far
+            for item, meta in list(self.plot_items_metadata):
+                if meta.get('file') == file_name:
+                    self.plot_view.removeItem(item)
+                    self.plot_items_metadata.remove((item, meta))
+            self.follow_metrics.discard(lambda key: key[0] == file_name)
+        
+        line_styles = [Qt.PenStyle.SolidLine, Qt.PenStyle.DashLine, Qt.PenStyle.DotLine, Qt.PenStyle.DashDotLine]
+        var_style_map = {var: line_styles[idx % len(line_styles)] for idx, var in enumerate(y_vars)}
+        
+        for treatment, df in deltas:
+            df = df.copy()
+            df["FILE"] = file_name
+            df["source"] = "sim"
+            df = self._prepare_sim_frame(df)
+            first_item = len(self.plot_items_metadata)
+            self.plot_dataset(
+                df, "sim", x_var, y_vars, selected_treatments, treatment_names,
+                var_style_map, 2, color_offset=self.streamed_curves
+            )
+            for _, meta in self.plot_items_metadata[first_item:]:
+                meta['file'] = file_name
+            self.streamed_curves += 1
+            
+            if self.follow_obs is not None:
+                aligned = align_sim_obs(df, self.follow_obs, y_vars, selected_treatments)
+                for (var, trt), pair in aligned.items():
+                    self.follow_metrics.update((file_name, var, trt), pair["sim"], pair["obs"])
+        
+        if deltas and self.follow_obs is not None:
+            self.emit_follow_metrics(y_vars, selected_treatments, treatment_names)
+
+    def emit_follow_metrics(self, y_vars, selected_treatments, treatment_names=None):
+        """Emit metrics of the blocks streamed so far, merging the files' partial results."""
+        merged = {}
+        for (_, var, trt), accumulator in self.follow_metrics.groups.items():
+            merged.setdefault((var, trt), MetricsAccumulator()).merge(accumulator)
+        
+        metrics_data = []
+        for var in y_vars:
+            var_label, _ = get_variable_info(var)
+            display_name = var_label or var
+            for trt in selected_treatments:
+                if (var, trt) not in merged:
+                    continue
+                result = merged[(var, trt)].result()
+                trt_name = treatment_names[trt] if treatment_names and trt in treatment_names else trt
+                enough = result["n"] >= 2
+                metrics_data.append({
+                    "Variable": f"{display_name} - {trt_name}",
+                    "n": result["n"],
+                    "RMSE": round(float(np.nan_to_num(result["RMSE"])), 3) if enough else 0.0,
+                    "d-stat": round(float(np.nan_to_num(result["d-stat"])), 3) if enough else 0.0,
+                })
+        
+        if metrics_data:
+            self.metrics_calculated.emit(metrics_data)
 
     def plot_cached_data(self, sim_data, obs_data, x_var, y_vars, selected_treatments, treatment_names):
         try:
@@ -664,104 +830,60 @@ class PlotWidget(QWidget):
             logger.warning("No observed data available for metrics calculation")
             return
             
-        metrics_data = []
+        aligned = align_sim_obs(sim_data, obs_data, y_vars, selected_treatments)
         
+        rows = []
         for var in y_vars:
             if var not in sim_data.columns or var not in obs_data.columns:
                 logger.warning(f"Variable {var} not found in both simulated and observed data")
                 continue
                 
+            var_label, _ = get_variable_info(var)
+            display_name = var_label or var
+            
             for trt in selected_treatments:
-                try:
-                    sim_trt_data = sim_data[sim_data['TRT'] == trt]
-                    obs_trt_data = obs_data[obs_data['TRT'] == trt]
-                    
-                    if sim_trt_data.empty or obs_trt_data.empty:
-                        logger.info(f"No data for treatment {trt}, variable {var} in either sim or obs data")
-                        continue
-                        
-                    common_dates = set(sim_trt_data['DATE']) & set(obs_trt_data['DATE'])
-                    logger.info(f"Found {len(common_dates)} common dates for treatment {trt}, variable {var}")
-                    
-                    if not common_dates:
-                        logger.warning(f"No common dates found for treatment {trt}, variable {var}")
-                        continue
-                        
-                    sim_values = []
-                    obs_values = []
-                    
-                    for date in common_dates:
-                        try:
-                            if f"{var}_original" in sim_trt_data.columns:
-                                sim_val = sim_trt_data[sim_trt_data['DATE'] == date][f"{var}_original"].values
-                            else:
-                                sim_val = sim_trt_data[sim_trt_data['DATE'] == date][var].values
-                                
-                            if f"{var}_original" in obs_trt_data.columns:
-                                obs_val = obs_trt_data[obs_trt_data['DATE'] == date][f"{var}_original"].values
-                            else:
-                                obs_val = obs_trt_data[obs_trt_data['DATE'] == date][var].values
-                            
-                            if len(sim_val) > 0 and len(obs_val) > 0:
-                                if pd.isna(sim_val[0]) or pd.isna(obs_val[0]):
-                                    continue
-                                    
-                                sim_values.append(float(sim_val[0]))
-                                obs_values.append(float(obs_val[0]))
-                        except Exception as e:
-                            logger.warning(f"Error processing date {date}: {e}")
-                            continue
-                    
-                    logger.info(f"Collected {len(sim_values)} valid data points for treatment {trt}, variable {var}")
-                    
-                    trt_name = trt
-                    if treatment_names and trt in treatment_names:
-                        trt_name = treatment_names[trt]
-                    
-                    if len(sim_values) < 2 or len(obs_values) < 2:
-                        logger.warning(f"Insufficient data points for treatment {trt}, variable {var}")
-                        var_label, _ = get_variable_info(var)
-                        display_name = var_label or var
-                        
-                        metrics_data.append({
-                            "Variable": f"{display_name} - {trt_name}",
-                            "n": len(sim_values),
-                            "RMSE": 0.0,
-                            "d-stat": 0.0,
-                        })
-                        continue
-                    
-                    var_label, _ = get_variable_info(var)
-                    display_name = var_label or var
-                    
-                    try:
-                        sim_vals = np.array(sim_values, dtype=float)
-                        obs_vals = np.array(obs_values, dtype=float)
-                        
-                        r2 = MetricsCalculator.r_squared(sim_vals, obs_vals)
-                        rmse = MetricsCalculator.rmse(obs_vals, sim_vals)
-                        d_stat_val = MetricsCalculator.d_stat(obs_vals, sim_vals)
-                        
-                        metrics_data.append({
-                            "Variable": f"{display_name} - {trt_name}",
-                            "n": len(sim_values),
-                            "RMSE": round(rmse, 3),
-                            "d-stat": round(d_stat_val, 3),
-                        })
-                        
-                        logger.info(f"Calculated metrics for {display_name} - {trt_name}: R²={r2:.3f}, RMSE={rmse:.3f}, d-stat={d_stat_val:.3f}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error calculating metrics: {e}", exc_info=True)
-                        metrics_data.append({
-                            "Variable": f"{display_name} - {trt_name}",
-                            "n": len(sim_values),
-                            "RMSE": 0.0,
-                            "d-stat": 0.0,
-                        })
-                except Exception as e:
-                    logger.error(f"Error processing treatment {trt} for variable {var}: {e}", exc_info=True)
+                pair = aligned.get((var, trt))
+                if pair is None:
+                    logger.info(f"No common dates for treatment {trt}, variable {var} in sim and obs data")
                     continue
+                    
+                logger.info(f"Collected {len(pair['sim'])} valid data points from {pair['common_dates']} common dates "
+                            f"for treatment {trt}, variable {var}")
+                
+                trt_name = trt
+                if treatment_names and trt in treatment_names:
+                    trt_name = treatment_names[trt]
+                rows.append((var, trt, f"{display_name} - {trt_name}", pair))
+        
+        # All (variable, treatment) pairs are evaluated in one batch
+        sim_values, obs_values, offsets = MetricsCalculator.concatenate_groups(
+            (pair["sim"], pair["obs"]) for _, _, _, pair in rows
+        )
+        batch = metrics_cache.batch_metrics(sim_values, obs_values, offsets)
+        intervals = metrics_cache.bootstrap_metrics(sim_values, obs_values, offsets) if config.ENABLE_BOOTSTRAP_CI else None
+        
+        metrics_data = []
+        for idx, (var, trt, label, pair) in enumerate(rows):
+            n = int(batch["n"][idx])
+            if n < 2:
+                logger.warning(f"Insufficient data points for treatment {trt}, variable {var}")
+                metrics_data.append({"Variable": label, "n": n, "RMSE": 0.0, "d-stat": 0.0})
+                continue
+            
+            rmse = np.nan_to_num(batch["RMSE"][idx])
+            d_stat_val = np.nan_to_num(batch["d-stat"][idx])
+            row = {
+                "Variable": label,
+                "n": n,
+                "RMSE": round(rmse, 3),
+                "d-stat": round(d_stat_val, 3),
+            }
+            if intervals is not None:
+                for metric in ("RMSE", "d-stat"):
+                    row[f"{metric} CI"] = (round(float(intervals[f"{metric}_low"][idx]), 3),
+                                           round(float(intervals[f"{metric}_high"][idx]), 3))
+            metrics_data.append(row)
+            logger.info(f"Calculated metrics for {label}: R²={batch['R2'][idx]:.3f}, RMSE={rmse:.3f}, d-stat={d_stat_val:.3f}")
         
         if metrics_data:
             logger.info(f"Emitting metrics_calculated signal with {len(metrics_data)} entries")
@@ -812,19 +934,16 @@ class PlotWidget(QWidget):
             return 0.0
 
     
-    def plot_dataset(self, data, source_type, x_var, y_vars, selected_treatments, treatment_names, var_style_map, pen_width):
+    def plot_dataset(self, data, source_type, x_var, y_vars, selected_treatments, treatment_names, var_style_map, pen_width,
+                     color_offset=0):
         logger.debug(f"Plotting {source_type} data with shape {data.shape}")
         data = data[data['TRT'].isin(selected_treatments)].copy()
         
-        if x_var == "DATE":
-            try:
-                data['_x_values'] = pd.to_datetime(data[x_var], errors='coerce').map(
-                    lambda x: x.timestamp() if pd.notna(x) else np.nan)
-            except Exception as e:
-                logger.warning(f"Error converting dates: {e}")
-                return {}
-        else:
-            data['_x_values'] = data[x_var]
+        try:
+            data['_x_values'] = self._x_axis_values(data, x_var)
+        except Exception as e:
+            logger.warning(f"Error converting dates: {e}")
+            return {}
 
         legend_entries = {}
         color_idx_base = len(self.colors)
@@ -847,12 +966,12 @@ class PlotWidget(QWidget):
                     continue
 
                 trt_display = treatment_names.get(trt_value, f"Treatment {trt_value}") if treatment_names else f"Treatment {trt_value}"
-                color_idx = trt_idx % color_idx_base
+                color_idx = (trt_idx + color_offset) % color_idx_base
                 color = self.colors[color_idx]
                 qt_color = pg.mkColor(color)
 
                 x_values = group.loc[valid_mask, '_x_values'].values
-                y_values = group.loc[valid_mask, var].values
+                y_values = group.loc[valid_mask, var].to_numpy(dtype=np.float64, na_value=np.nan)
                 logger.debug(f"Plotting {len(x_values)} points for {var}, {trt_display}")
 
                 if source_type == "sim":
@@ -938,25 +1057,22 @@ class PlotWidget(QWidget):
 
     def _render_single_batch(self, data, var, x_var, color, style, symbol):
         valid_mask = data[var].notna()
-        x_values = data.loc[valid_mask, x_var].values
-        y_values = data.loc[valid_mask, var].values
+        y_values = data.loc[valid_mask, var].to_numpy(dtype=np.float64, na_value=np.nan)
         
-        if len(x_values) == 0:
+        if len(y_values) == 0:
             return None
             
+        try:
+            x_values = self._x_axis_values(data.loc[valid_mask], x_var)
+        except Exception as e:
+            logger.warning(f"Error converting dates: {e}")
+            return None
         if x_var == "DATE":
-            try:
-                x_dates = pd.to_datetime(x_values, errors='coerce')
-                valid_date_mask = ~x_dates.isna()
-                x_values = x_values[valid_date_mask]
-                y_values = y_values[valid_date_mask]
-                x_dates = x_dates[valid_date_mask]
-                if len(x_dates) == 0:
-                    logger.warning(f"No valid dates in batch for {var}")
-                    return None
-                x_values = [d.timestamp() for d in x_dates]
-            except Exception as e:
-                logger.warning(f"Error converting dates: {e}")
+            valid_date_mask = ~np.isnan(x_values)
+            x_values = x_values[valid_date_mask]
+            y_values = y_values[valid_date_mask]
+            if len(x_values) == 0:
+                logger.warning(f"No valid dates in batch for {var}")
                 return None
                 
         qt_color = pg.mkColor(color)
@@ -1057,8 +1173,7 @@ class PlotWidget(QWidget):
         
         if x_var == "DATE":
             try:
-                processed['_x_values'] = pd.to_datetime(processed[x_var], errors='coerce').map(
-                    lambda x: x.timestamp() if pd.notna(x) else np.nan)
+                processed['_x_values'] = self._x_axis_values(processed, x_var)
             except Exception as e:
                 logger.warning(f"Error converting dates: {e}")
                 processed['_x_values'] = processed[x_var]
@@ -22,12 +22,12 @@ sys.path.insert(0, project_dir)
 
 import config
 from utils.dssat_paths import get_crop_details
-from data.dssat_io import read_evaluate_file
+from data.dssat_io import read_evaluate_file, read_evaluate_data
 from data.data_processing import (
-    get_evaluate_variable_pairs, get_all_evaluate_variables,
+    get_all_evaluate_variables,
     get_variable_info
 )
-from models.metrics import MetricsCalculator
+from models.metrics_cache import metrics_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -153,8 +153,9 @@ class ScatterPlotWidget(QWidget):
         logger.info(f"Plotting scatter with folder: {selected_folder}, treatments: {selected_treatments}")
         logger.info(f"Selected vars type: {type(selected_vars)} content: {selected_vars}")
         
-        # Read EVALUATE.OUT data
-        self.evaluate_data = read_evaluate_file(selected_folder)
+        # Read EVALUATE.OUT data; unchanged files come back with their pairs precomputed
+        evaluate = read_evaluate_data(selected_folder)
+        self.evaluate_data = evaluate["data"] if evaluate is not None else None
         if self.evaluate_data is None or self.evaluate_data.empty:
             logger.warning("No evaluate data available")
             return
@@ -162,7 +163,7 @@ class ScatterPlotWidget(QWidget):
         logger.info(f"Evaluate data loaded with columns: {self.evaluate_data.columns.tolist()}")
         
         # Get variable pairs for auto mode
-        var_pairs = get_evaluate_variable_pairs(self.evaluate_data)
+        var_pairs = evaluate["pairs"]
         logger.info(f"Found {len(var_pairs)} variable pairs")
         
         # Filter to selected variables
@@ -445,32 +446,10 @@ class ScatterPlotWidget(QWidget):
                     if len(sim_values) >= 2 and len(meas_values) >= 2:
                         # Calculate metrics
                         try:
-                            # Calculate R-squared manually to avoid issues
-                            sim_mean = np.mean(sim_values)
-                            meas_mean = np.mean(meas_values)
-                                
-                            numerator = np.sum((sim_values - sim_mean) * (meas_values - meas_mean))
-                            denom1 = np.sum((sim_values - sim_mean)**2)
-                            denom2 = np.sum((meas_values - meas_mean)**2)
-                                
-                            if denom1 > 0 and denom2 > 0:
-                                denominator = np.sqrt(denom1 * denom2)
-                                r = numerator / denominator
-                                r2 = r**2
-                            else:
-                                r2 = 0.0
-                                    
-                            # Calculate RMSE
-                            rmse = np.sqrt(np.mean((meas_values - sim_values)**2))
-                                
-                            # Calculate d-stat
-                            try:
-                                d_stat = MetricsCalculator.d_stat(meas_values, sim_values)
-                                if d_stat is None:
-                                    d_stat = 0.0
-                            except Exception as e:
-                                logger.error(f"Error calculating d-stat: {e}")
-                                d_stat = 0.0
+                            metrics = self.calculate_metrics_efficiently(sim_values, meas_values)
+                            r2 = metrics['r2']
+                            rmse = metrics['rmse']
+                            d_stat = metrics['d_stat']
                                 
                             logger.info(f"Metrics: R²={r2:.3f}, RMSE={rmse:.3f}, d-stat={d_stat:.3f}")
                                 
@@ -599,23 +578,14 @@ class ScatterPlotWidget(QWidget):
             y_values = valid_data[y_var].to_numpy()
             
             if len(x_values) >= 2:
-                x_mean = np.mean(x_values)
-                y_mean = np.mean(y_values)
-                
-                # Vectorized calculations
-                numerator = np.sum((x_values - x_mean) * (y_values - y_mean))
-                denom1 = np.sum((x_values - x_mean)**2)
-                denom2 = np.sum((y_values - y_mean)**2)
-                
-                r2 = (numerator / np.sqrt(denom1 * denom2))**2 if denom1 > 0 and denom2 > 0 else 0.0
-                rmse = np.sqrt(np.mean((y_values - x_values)**2))
+                metrics = self.calculate_metrics_efficiently(x_values, y_values)
                 
                 self.metrics_data.append({
                     "Variable": f"{y_display} vs {x_display}",
                     "n": len(x_values),
-                    "R²": round(r2, 3),
-                    "RMSE": round(rmse, 3),
-                    "d-stat": round(MetricsCalculator.d_stat(y_values, x_values) or 0.0, 3)
+                    "R²": round(metrics['r2'], 3),
+                    "RMSE": round(metrics['rmse'], 3),
+                    "d-stat": round(metrics['d_stat'], 3)
                 })
             
             # Plot for each treatment in batches
@@ -688,43 +658,12 @@ class ScatterPlotWidget(QWidget):
         return None
         
     def calculate_metrics_efficiently(self, x_values, y_values):
-        """Calculate metrics using optimized numpy operations"""
-        cache_key = f"{hash(str(x_values))}_{hash(str(y_values))}"
-        cached = self._get_cached_data(cache_key)
-        if cached is not None:
-            return cached
-            
+        """Calculate R², RMSE and d-stat of y (measured) against x (simulated) through the shared metrics cache"""
         metrics = {}
         if len(x_values) >= 2:
-            # Vectorized metric calculations
-            x_mean = np.mean(x_values)
-            y_mean = np.mean(y_values)
-            
-            # Compute differences once
-            x_diff = x_values - x_mean
-            y_diff = y_values - y_mean
-            
-            # R-squared calculation
-            numerator = np.sum(x_diff * y_diff)
-            denom1 = np.sum(x_diff ** 2)
-            denom2 = np.sum(y_diff ** 2)
-            
-            if denom1 > 0 and denom2 > 0:
-                r = numerator / np.sqrt(denom1 * denom2)
-                metrics['r2'] = r ** 2
-            else:
-                metrics['r2'] = 0.0
-                
-            # RMSE calculation
-            metrics['rmse'] = np.sqrt(np.mean((y_values - x_values) ** 2))
-            
-            # D-stat calculation
-            try:
-                d_stat = MetricsCalculator.d_stat(y_values, x_values)
-                metrics['d_stat'] = d_stat if d_stat is not None else 0.0
-            except:
-                metrics['d_stat'] = 0.0
-                
-            self._cache_data(cache_key, metrics)
-            
+            result = metrics_cache.batch_metrics(x_values, y_values)
+            # Undefined metrics (zero variance) are reported as 0.0
+            metrics['r2'] = float(np.nan_to_num(result['R2'][0]))
+            metrics['rmse'] = float(np.nan_to_num(result['RMSE'][0]))
+            metrics['d_stat'] = float(np.nan_to_num(result['d-stat'][0]))
         return metrics
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Compiled cache of parsed DSSAT code dictionaries (DATA.CDE, DETAIL.CDE)
+
+A parsed dictionary is pickled next to the source file's mtime and size,
+so a new process loads it with a single read instead of reparsing the
+text file. Within a process the result is kept in memory and revalidated
+with one os.stat per lookup.
+"""
+import os
+import sys
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, List
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from utils.file_access import read_bytes, read_lines
+
+logger = logging.getLogger(__name__)
+
+# Bump when a parser's output changes so old artifacts are rebuilt
+CODE_CACHE_VERSION = 1
+
+# (kind, absolute path) -> (signature, parsed value)
+_memory_cache = {}
+_lock = threading.Lock()
+
+def _signature(file_path: str):
+    stat = os.stat(file_path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _artifact_path(kind: str, file_path: str) -> str:
+    digest = hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(config.CODE_CACHE_DIR, f"{kind}-{digest}.pkl")
+
+def _load_artifact(kind: str, file_path: str, signature) -> Any:
+    try:
+        artifact = pickle.loads(read_bytes(_artifact_path(kind, file_path)))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable {kind} artifact for {file_path}: {e}")
+        return None
+
+    if (artifact.get("version") != CODE_CACHE_VERSION
+            or artifact.get("source") != file_path
+            or artifact.get("signature") != signature):
+        return None
+    return artifact["data"]
+
+def _save_artifact(kind: str, file_path: str, signature, data: Any) -> None:
+    artifact = {
+        "version": CODE_CACHE_VERSION,
+        "source": file_path,
+        "signature": signature,
+        "data": data,
+    }
+    try:
+        os.makedirs(config.CODE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{kind}-", dir=config.CODE_CACHE_DIR)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _artifact_path(kind, file_path))
+    except Exception as e:
+        logger.warning(f"Could not save {kind} artifact for {file_path}: {e}")
+
+def load_code_dictionary(file_path: str, kind: str,
+                         parser: Callable[[List[str]], Any], default: Any = None) -> Any:
+    """Return parser(lines of file_path), from memory, the compiled artifact or the source.
+
+    kind names the parser and separates artifacts of different parsers of
+    the same file. If the source file is missing an error is logged once
+    and default is returned.
+    """
+    file_path = os.path.abspath(file_path)
+    key = (kind, file_path)
+    try:
+        signature = _signature(file_path)
+    except OSError as e:
+        with _lock:
+            cached = _memory_cache.get(key)
+            if cached is None or cached[0] is not None:
+                logger.error(f"Could not read {file_path}: {e}")
+                _memory_cache[key] = (None, default)
+        return default
+
+    cached = _memory_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _lock:
+        cached = _memory_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        data = _load_artifact(kind, file_path, signature)
+        if data is None:
+            data = parser(read_lines(file_path))
+            _save_artifact(kind, file_path, signature, data)
+        _memory_cache[key] = (signature, data)
+        return data
+
+def clear_code_dictionaries() -> None:
+    """Drop the in-memory dictionaries; artifacts on disk stay valid."""
+    with _lock:
+        _memory_cache.clear()
@@ -2,6 +2,7 @@ import sys
 import os
 import logging
 import platform
+import threading
 from typing import List, Optional, Tuple
 from pathlib import Path
 
@@ -9,6 +10,9 @@ from pathlib import Path
 project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_dir)
 
+from utils.file_access import read_lines
+from utils.code_cache import load_code_dictionary
+
 logger = logging.getLogger(__name__)
 
 def find_dssatpro_file() -> str:
@@ -106,26 +110,25 @@ def get_dssat_base() -> str:
         if not is_windows and v48_path == '/Applications/DSSAT48/DSSATPRO.L48':
             return '/Applications/DSSAT48'
         
-        with open(v48_path, 'r') as file:
-            for line in file:
-                if line.strip().startswith('DDB'):
-                    parts = line.strip().split()
-                    if len(parts) >= 2:
-                        dssat_path = (parts[1] + parts[2]).replace(' ', '')
-                        # Convert path separators based on OS
-                        dssat_path = dssat_path.replace('\\', '/' if not is_windows else '\\')
-                        
-                        # For macOS, handle potential Windows paths in the config file
-                        if not is_windows and ':' in dssat_path:
-                            # This is likely a Windows path (e.g., C:/DSSAT48)
-                            # Use the known Mac path instead
-                            dssat_path = '/Applications/DSSAT48'
-                        
-                        # Verify installation
-                        if verify_dssat_installation(dssat_path):
-                            return dssat_path
-                        else:
-                            logger.warning(f"Found DSSAT path but missing required files: {dssat_path}")
+        for line in read_lines(v48_path):
+            if line.strip().startswith('DDB'):
+                parts = line.strip().split()
+                if len(parts) >= 2:
+                    dssat_path = (parts[1] + parts[2]).replace(' ', '')
+                    # Convert path separators based on OS
+                    dssat_path = dssat_path.replace('\\', '/' if not is_windows else '\\')
+                    
+                    # For macOS, handle potential Windows paths in the config file
+                    if not is_windows and ':' in dssat_path:
+                        # This is likely a Windows path (e.g., C:/DSSAT48)
+                        # Use the known Mac path instead
+                        dssat_path = '/Applications/DSSAT48'
+                    
+                    # Verify installation
+                    if verify_dssat_installation(dssat_path):
+                        return dssat_path
+                    else:
+                        logger.warning(f"Found DSSAT path but missing required files: {dssat_path}")
         
         # If we couldn't find it in the file, return the known path for macOS
         if not is_windows:
@@ -140,118 +143,204 @@ def get_dssat_base() -> str:
             return '/Applications/DSSAT48'
         raise
 
+def _crop_file_paths() -> Tuple[str, str]:
+    """Return the DETAIL.CDE and DSSATPRO paths under the configured DSSAT base."""
+    from config import DSSAT_BASE
+    is_windows = platform.system() == 'Windows'
+    return (
+        os.path.join(DSSAT_BASE, 'DETAIL.CDE'),
+        os.path.join(DSSAT_BASE, 'DSSATPRO.V48' if is_windows else 'DSSATPRO.L48'),
+    )
+
+def _parse_crop_section(lines: List[str]) -> List[tuple]:
+    """Parse (code, name) pairs from the crop section of DETAIL.CDE."""
+    crops = []
+    in_crop_section = False
+    
+    for line in lines:
+        if '*Crop and Weed Species' in line:
+            in_crop_section = True
+            continue
+            
+        if '@CDE' in line:
+            continue
+            
+        if line.startswith('*') and in_crop_section:
+            break
+            
+        if in_crop_section and line.strip():
+            crop_code = line[:8].strip()
+            crop_name = line[8:72].strip()
+            if crop_code and crop_name:
+                crops.append((crop_code[:2], crop_name))
+    
+    return crops
+
+def _parse_crop_details(detail_cde_path: str, dssatpro_path: str) -> List[dict]:
+    """Parse crop codes and names from DETAIL.CDE and directories from DSSATPRO."""
+    is_windows = platform.system() == 'Windows'
+    
+    # Step 1: Get crop codes and names from the compiled DETAIL.CDE crop section
+    crop_details = [
+        {'code': code, 'name': name, 'directory': ''}
+        for code, name in load_code_dictionary(detail_cde_path, "detail_crops", _parse_crop_section, default=[])
+    ]
+    
+    # Step 2: Get directories from DSSATPRO file
+    try:
+        dssatpro_lines = read_lines(dssatpro_path)
+    except OSError as e:
+        # Crop names are still usable for the folder list without directories
+        logger.warning(f"Could not read crop directories from {dssatpro_path}: {e}")
+        dssatpro_lines = []
+    for line in dssatpro_lines:
+        line = line.strip()
+        if not line:
+            continue
+            
+        parts = line.split(None, 1)
+        if len(parts) >= 2:
+            folder_code = parts[0]
+            if folder_code.endswith('D'):
+                code = folder_code[:-1]
+                directory = parts[1].strip()
+                
+                # OS-specific directory formatting
+                if is_windows:
+                    directory = directory.replace(': ', ':')
+                else:  # macOS
+                    # Remove any extra spaces or colons
+                    directory = directory.replace(': ', '').replace(':', '')
+                    # Convert Windows path separators if needed
+                    directory = directory.replace('\\', '/')
+                    # Ensure the path starts with /Applications/DSSAT48
+                    if not directory.startswith('/Applications/DSSAT48'):
+                        directory = os.path.join('/Applications/DSSAT48', os.path.basename(directory))
+                    # Clean up any double slashes and normalize path
+                    directory = os.path.normpath(directory).replace('//', '/')
+                
+                # Update matching crop directory
+                for crop in crop_details:
+                    if crop['code'] == code:
+                        crop['directory'] = directory
+                        break
+    
+    # Log the results for debugging
+    if not is_windows:
+        logger.info("Crop details loaded:")
+        for crop in crop_details:
+            logger.info(f"Name: {crop['name']}, Code: {crop['code']}, Directory: {crop['directory']}")
+    
+    return crop_details
+
+class CropRegistry:
+    """Crop codes, names and directories parsed once from DETAIL.CDE and DSSATPRO.
+
+    The files are parsed again only when the DSSAT base directory changes or
+    either file's mtime or size changes. Lookups by name and code are dict
+    lookups; names are matched case-insensitively.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signature = None
+        self._crops = []
+        self._by_name = {}
+        self._by_code = {}
+
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _ensure_loaded(self) -> None:
+        detail_cde_path, dssatpro_path = _crop_file_paths()
+        signature = (
+            detail_cde_path, self._stat(detail_cde_path),
+            dssatpro_path, self._stat(dssatpro_path),
+        )
+        if signature == self._signature:
+            return
+
+        with self._lock:
+            if signature == self._signature:
+                return
+            try:
+                crops = _parse_crop_details(detail_cde_path, dssatpro_path)
+            except Exception as e:
+                error_msg = f"Error getting crop details: {str(e)}"
+                if platform.system() != 'Windows':
+                    logger.error(error_msg, exc_info=True)
+                else:
+                    logger.error(error_msg)
+                crops = []
+
+            self._by_name = {}
+            self._by_code = {}
+            for crop in crops:
+                # Keep the first entry, like the linear scans this replaces
+                self._by_name.setdefault(crop['name'].upper(), crop)
+                self._by_code.setdefault(crop['code'].upper(), crop)
+            self._crops = crops
+            self._signature = signature
+
+    def invalidate(self) -> None:
+        """Force the crop files to be parsed again on the next lookup."""
+        with self._lock:
+            self._signature = None
+
+    def crops(self) -> List[dict]:
+        """Return copies of all crop entries in DETAIL.CDE order."""
+        self._ensure_loaded()
+        return [dict(crop) for crop in self._crops]
+
+    def names(self) -> List[str]:
+        """Return all crop names in DETAIL.CDE order."""
+        self._ensure_loaded()
+        return [crop['name'] for crop in self._crops]
+
+    def get_by_name(self, name: str) -> Optional[dict]:
+        """Return the crop entry for a crop (folder) name."""
+        self._ensure_loaded()
+        crop = self._by_name.get(name.upper()) if name else None
+        return dict(crop) if crop else None
+
+    def get_by_code(self, code: str) -> Optional[dict]:
+        """Return the crop entry for a two-letter crop code."""
+        self._ensure_loaded()
+        crop = self._by_code.get(code.upper()) if code else None
+        return dict(crop) if crop else None
+
+    def get_directory(self, name: str) -> str:
+        """Return the directory of a crop, or '' if it has none."""
+        crop = self.get_by_name(name)
+        return crop['directory'].strip() if crop else ''
+
+    def directories(self) -> List[str]:
+        """Return the distinct non-empty crop directories."""
+        self._ensure_loaded()
+        seen = {}
+        for crop in self._crops:
+            directory = crop['directory'].strip()
+            if directory:
+                seen.setdefault(directory, None)
+        return list(seen)
+
+
+# Create a singleton instance
+crop_registry = CropRegistry()
+
 def get_crop_details() -> List[dict]:
     """Get crop codes, names, and directories from DETAIL.CDE and DSSATPRO file."""
-    try:
-        from config import DSSAT_BASE
-        is_windows = platform.system() == 'Windows'
-        
-        detail_cde_path = os.path.join(DSSAT_BASE, 'DETAIL.CDE')
-        dssatpro_path = os.path.join(DSSAT_BASE, 'DSSATPRO.V48' if is_windows else 'DSSATPRO.L48')
-        crop_details = []
-        in_crop_section = False
-        
-        # Step 1: Get crop codes and names from DETAIL.CDE
-        with open(detail_cde_path, 'r') as file:
-            for line in file:
-                if '*Crop and Weed Species' in line:
-                    in_crop_section = True
-                    continue
-                    
-                if '@CDE' in line:
-                    continue
-                    
-                if line.startswith('*') and in_crop_section:
-                    break
-                    
-                if in_crop_section and line.strip():
-                    crop_code = line[:8].strip()
-                    crop_name = line[8:72].strip()
-                    if crop_code and crop_name:
-                        crop_details.append({
-                            'code': crop_code[:2],
-                            'name': crop_name,
-                            'directory': ''
-                        })
-        
-        # Step 2: Get directories from DSSATPRO file
-        with open(dssatpro_path, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                parts = line.split(None, 1)
-                if len(parts) >= 2:
-                    folder_code = parts[0]
-                    if folder_code.endswith('D'):
-                        code = folder_code[:-1]
-                        directory = parts[1].strip()
-                        
-                        # OS-specific directory formatting
-                        if is_windows:
-                            directory = directory.replace(': ', ':')
-                        else:  # macOS
-                            # Remove any extra spaces or colons
-                            directory = directory.replace(': ', '').replace(':', '')
-                            # Convert Windows path separators if needed
-                            directory = directory.replace('\\', '/')
-                            # Ensure the path starts with /Applications/DSSAT48
-                            if not directory.startswith('/Applications/DSSAT48'):
-                                directory = os.path.join('/Applications/DSSAT48', os.path.basename(directory))
-                            # Clean up any double slashes and normalize path
-                            directory = os.path.normpath(directory).replace('//', '/')
-                        
-                        # Update matching crop directory
-                        for crop in crop_details:
-                            if crop['code'] == code:
-                                crop['directory'] = directory
-                                break
-        
-        # Log the results for debugging
-        if not is_windows:
-            logger.info("Crop details loaded:")
-            for crop in crop_details:
-                logger.info(f"Name: {crop['name']}, Code: {crop['code']}, Directory: {crop['directory']}")
-        
-        return crop_details
-        
-    except Exception as e:
-        error_msg = f"Error getting crop details: {str(e)}"
-        if not is_windows:
-            logger.error(error_msg, exc_info=True)
-        else:
-            logger.error(error_msg)
-        return []
+    return crop_registry.crops()
         
 def prepare_folders() -> List[str]:
     """List available folders based on DETAIL.CDE crop codes and names."""
     try:
-        from config import DSSAT_BASE
-        
-        detail_cde_path = os.path.join(DSSAT_BASE, 'DETAIL.CDE')
-        valid_folders = []
-        in_crop_section = False
-        
-        with open(detail_cde_path, 'r') as file:
-            for line in file:
-                if '*Crop and Weed Species' in line:
-                    in_crop_section = True
-                    continue
-                
-                if '@CDE' in line:
-                    continue
-                
-                if line.startswith('*') and in_crop_section:
-                    break
-                
-                if in_crop_section and line.strip():
-                    crop_code = line[:8].strip()
-                    crop_name = line[8:72].strip()
-                    if crop_code and crop_name:
-                        valid_folders.append(crop_name)
-        
-        return valid_folders
+        return crop_registry.names()
         
     except Exception as e:
         logger.error(f"Error preparing folders: {str(e)}")
@@ -0,0 +1,71 @@
+"""
+Shared file access for DSSAT readers: one buffered read per file and a
+consistent encoding, sniffed from a small prefix and remembered per file.
+"""
+import os
+import sys
+import codecs
+import logging
+from io import StringIO
+from typing import List
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Bytes inspected to choose an encoding
+SNIFF_BYTES = 64 * 1024
+
+# (path, mtime, size) -> encoding that decoded the whole file
+_encoding_cache = {}
+
+def _file_key(file_path: str) -> tuple:
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+def sniff_encoding(prefix: bytes) -> str:
+    """Pick an encoding from the first bytes of a file."""
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Incremental decode so a multi-byte character cut at the end is not an error
+        codecs.getincrementaldecoder(config.DEFAULT_ENCODING)().decode(prefix, final=False)
+        return config.DEFAULT_ENCODING
+    except UnicodeDecodeError:
+        return config.FALLBACK_ENCODING
+
+def read_bytes(file_path: str) -> bytes:
+    """Read a whole file in one call."""
+    with open(file_path, "rb") as file:
+        return file.read()
+
+def decode_bytes(buffer: bytes, file_path: str = None) -> str:
+    """Decode a file buffer with its remembered or sniffed encoding.
+
+    If the sniffed encoding fails further into the buffer the fallback
+    encoding is used on the same bytes and remembered for the file.
+    """
+    key = _file_key(file_path) if file_path else None
+    encoding = _encoding_cache.get(key) or sniff_encoding(buffer[:SNIFF_BYTES])
+    try:
+        text = buffer.decode(encoding)
+    except UnicodeDecodeError:
+        logger.debug(f"{file_path} is not valid {encoding}, using {config.FALLBACK_ENCODING}")
+        encoding = config.FALLBACK_ENCODING
+        text = buffer.decode(encoding)
+
+    if key is not None:
+        _encoding_cache[key] = encoding
+    return text
+
+def read_text(file_path: str) -> str:
+    """Read and decode a whole text file."""
+    return decode_bytes(read_bytes(file_path), file_path)
+
+def read_lines(file_path: str) -> List[str]:
+    """Read a text file as a list of lines, with newlines translated like readlines()."""
+    return StringIO(read_text(file_path), newline=None).readlines()
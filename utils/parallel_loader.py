@@ -0,0 +1,222 @@
+"""
+Parallel loading of selected DSSAT output files
+
+Large files are parsed in a process pool shared by every loader of the
+application. Small files, and a lone selected file, are parsed on a thread
+so they skip worker start-up and the pickling of the parsed frame.
+"""
+import os
+import sys
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Add project root to Python path
+project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_dir)
+
+import config
+from data.dssat_io import read_tagged_file
+
+logger = logging.getLogger(__name__)
+
+_pool_lock = threading.Lock()
+_process_pool = None
+_thread_pool = None
+
+def process_pool() -> ProcessPoolExecutor:
+    """Return the shared worker process pool, starting it on first use.
+
+    Workers are spawned rather than forked so they never inherit the
+    threads and state of the Qt process.
+    """
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=config.MAX_LOADER_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+def thread_pool() -> ThreadPoolExecutor:
+    """Return the shared thread pool used for small files."""
+    global _thread_pool
+    with _pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=config.MAX_LOADER_PROCESSES,
+                                              thread_name_prefix="file-loader")
+        return _thread_pool
+
+def reset_process_pool() -> None:
+    """Drop a broken process pool so the next load starts a new one."""
+    global _process_pool
+    with _pool_lock:
+        _process_pool = None
+
+def shutdown_pools() -> None:
+    """Stop the shared worker processes and threads."""
+    global _process_pool, _thread_pool
+    with _pool_lock:
+        for pool in (_process_pool, _thread_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _thread_pool = None
+
+def use_processes(file_paths: List[str]) -> List[bool]:
+    """Decide per file whether it is worth parsing in a worker process."""
+    if len(file_paths) <= 1 or config.MAX_LOADER_PROCESSES <= 1:
+        return [False] * len(file_paths)
+    flags = []
+    for path in file_paths:
+        try:
+            flags.append(os.path.getsize(path) >= config.LOADER_PROCESS_MIN_BYTES)
+        except OSError:
+            flags.append(False)
+    return flags
+
+class ParallelFileLoader(QObject):
+    """Parse several OUT files concurrently and report results through signals.
+
+    Frames are returned in the order the files were requested, each tagged
+    with its FILE name and source="sim".
+    """
+    file_loaded = pyqtSignal(str, object)   # file name, DataFrame
+    load_failed = pyqtSignal(str, str)      # file name, error message
+    files_loaded = pyqtSignal(list)         # DataFrames in request order
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def load_files(self, file_paths: List[str], file_names: List[str] = None,
+                   columns: Optional[List[str]] = None,
+                   treatments: Optional[List[str]] = None) -> list:
+        """Load files and wait for all of them.
+
+        Returns the successfully loaded DataFrames in request order.
+        """
+        file_names = file_names or [os.path.basename(path) for path in file_paths]
+        in_process = use_processes(file_paths)
+        if not any(in_process):
+            return self._load_sequential(file_paths, file_names, columns, treatments)
+
+        try:
+            futures = self._submit(file_paths, file_names, columns, treatments, in_process)
+            frames = []
+            for name, future in zip(file_names, futures):
+                df = self._collect(name, future)
+                if df is not None:
+                    frames.append(df)
+            self.files_loaded.emit(frames)
+            return frames
+
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool failed, loading files sequentially: {e}")
+            reset_process_pool()
+            return self._load_sequential(file_paths, file_names, columns, treatments)
+
+    def load_files_async(self, file_paths: List[str], file_names: List[str] = None,
+                         columns: Optional[List[str]] = None,
+                         treatments: Optional[List[str]] = None) -> None:
+        """Start loading files without blocking; results arrive via signals.
+
+        Results of an earlier request still in flight are discarded.
+        """
+        file_names = file_names or [os.path.basename(path) for path in file_paths]
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        if not file_paths:
+            self.files_loaded.emit([])
+            return
+
+        results = [None] * len(file_paths)
+        remaining = [len(file_paths)]
+
+        def on_done(idx, name, future):
+            try:
+                df = self._collect(name, future, emit=False)
+            except BrokenProcessPool as e:
+                logger.error(f"Process pool failed while loading {name}: {e}")
+                reset_process_pool()
+                self.load_failed.emit(name, str(e))
+                df = None
+            with self._lock:
+                if generation != self._generation:
+                    return
+                results[idx] = df
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            # Signals emitted from pool callback threads are queued to GUI receivers
+            if df is not None:
+                self.file_loaded.emit(name, df)
+            if finished:
+                self.files_loaded.emit([frame for frame in results if frame is not None])
+
+        in_process = use_processes(file_paths)
+        try:
+            futures = self._submit(file_paths, file_names, columns, treatments, in_process)
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool failed, restarting it: {e}")
+            reset_process_pool()
+            futures = self._submit(file_paths, file_names, columns, treatments, in_process)
+
+        for idx, (name, future) in enumerate(zip(file_names, futures)):
+            future.add_done_callback(lambda f, idx=idx, name=name: on_done(idx, name, f))
+
+    def cancel_pending(self) -> None:
+        """Discard the results of any asynchronous load still in flight."""
+        with self._lock:
+            self._generation += 1
+
+    def shutdown(self) -> None:
+        """Stop delivering results; the shared pools are stopped by shutdown_pools()."""
+        self.cancel_pending()
+
+    def _submit(self, file_paths, file_names, columns, treatments, in_process) -> list:
+        return [
+            (process_pool() if use_process else thread_pool()).submit(
+                read_tagged_file, path, name, columns, treatments
+            )
+            for path, name, use_process in zip(file_paths, file_names, in_process)
+        ]
+
+    def _collect(self, name: str, future, emit: bool = True):
+        try:
+            df = future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            logger.error(f"Error loading {name}: {e}")
+            self.load_failed.emit(name, str(e))
+            return None
+
+        if df is None or df.empty:
+            logger.warning(f"No data loaded from {name}")
+            self.load_failed.emit(name, "No data loaded")
+            return None
+        if emit:
+            self.file_loaded.emit(name, df)
+        return df
+
+    def _load_sequential(self, file_paths, file_names, columns, treatments) -> list:
+        frames = []
+        for path, name in zip(file_paths, file_names):
+            df = read_tagged_file(path, name, columns, treatments)
+            if df is None or df.empty:
+                logger.warning(f"No data loaded from {path}")
+                self.load_failed.emit(name, "No data loaded")
+                continue
+            self.file_loaded.emit(name, df)
+            frames.append(df)
+        self.files_loaded.emit(frames)
+        return frames
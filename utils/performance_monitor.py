@@ -22,6 +22,7 @@ class PerformanceMonitor:
             'max_time': 0.0,
             'times': []
         })
+        self.counters = defaultdict(int)
         
     def start_timer(self, category: str, name: str) -> str:
         """Start a new performance timer"""
@@ -120,6 +121,17 @@ class PerformanceMonitor:
             
         return metrics
         
+    def increment_counter(self, category: str, name: str, amount: int = 1) -> None:
+        """Increment an event counter such as cache hits or misses"""
+        self.counters[f"{category}_{name}"] += amount
+        
+    def get_counters(self, category: Optional[str] = None) -> Dict:
+        """Get event counters with optional category filter"""
+        return {
+            key: value for key, value in self.counters.items()
+            if not category or key.startswith(category)
+        }
+        
     def get_trends(self, metric_key: str, window: int = 10) -> Dict:
         """Analyze performance trends for a specific metric"""
         history = self.history[metric_key]
@@ -146,6 +158,7 @@ class PerformanceMonitor:
         self.timers.clear()
         self.metrics.clear()
         self.history.clear()
+        self.counters.clear()
         
     def get_bottlenecks(self, threshold_pct: float = 10.0) -> Dict:
         """Identify performance bottlenecks"""
@@ -196,7 +209,8 @@ class PerformanceMonitor:
     def print_report(self) -> None:
         """Print a formatted performance report to the console"""
         metrics = self.get_metrics()
-        if not metrics:
+        counters = self.get_counters()
+        if not metrics and not counters:
             print("No performance metrics recorded.")
             return
 
@@ -218,6 +232,12 @@ class PerformanceMonitor:
                 print(f"    Max time: {data['max_time']:.3f}s")
                 print(f"    P95 time: {data['p95_time']:.3f}s")
 
+        # Print event counters
+        if counters:
+            print("\nCOUNTERS:")
+            for key, value in sorted(counters.items()):
+                print(f"  {key}: {value}")
+
         # Print bottlenecks if any
         bottlenecks = self.get_bottlenecks()
         if bottlenecks:
@@ -235,6 +255,9 @@ class PerformanceMonitor:
                     print(f"    - {tip}")
         print("\n=========================")
 
+# Shared monitor for code that has no perf_monitor attribute of its own
+perf_monitor = PerformanceMonitor()
+
 def function_timer(category: str):
     """Decorator to time function execution"""
     def decorator(func):